@@ -1,22 +1,101 @@
-from .engines import *  # noqa: F403
-from .network import Network
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import SearchCache
+    from .engines import (
+        AnimeTrace,
+        Ascii2D,
+        BaiDu,
+        Bing,
+        Copyseeker,
+        EHentai,
+        Google,
+        GoogleLens,
+        Iqdb,
+        Lenso,
+        SauceNAO,
+        Tineye,
+        TraceMoe,
+        Yandex,
+    )
+    from .hooks import EngineHooks
+    from .metasearch import MetaSearch, MetaSearchResult, similarity_at_least
+    from .network import ClientRegistry, Network, default_registry
 
 __version__ = "3.12.11"
 
+# Public names are imported on first attribute access (PEP 562): `import PicImageSearch`
+# stays cheap, and `from PicImageSearch import Iqdb` only loads that engine and its model.
+_LAZY_ATTRS: dict[str, str] = {
+    "AnimeTrace": ".engines",
+    "Ascii2D": ".engines",
+    "BaiDu": ".engines",
+    "Bing": ".engines",
+    "ClientRegistry": ".network",
+    "Copyseeker": ".engines",
+    "EHentai": ".engines",
+    "EngineHooks": ".hooks",
+    "Google": ".engines",
+    "GoogleLens": ".engines",
+    "Iqdb": ".engines",
+    "Lenso": ".engines",
+    "MetaSearch": ".metasearch",
+    "MetaSearchResult": ".metasearch",
+    "Network": ".network",
+    "SauceNAO": ".engines",
+    "SearchCache": ".cache",
+    "Tineye": ".engines",
+    "TraceMoe": ".engines",
+    "Yandex": ".engines",
+    "default_registry": ".network",
+    "similarity_at_least": ".metasearch",
+}
+
 __all__ = [
     "AnimeTrace",
     "Ascii2D",
     "BaiDu",
     "Bing",
+    "ClientRegistry",
     "Copyseeker",
     "EHentai",
+    "EngineHooks",
     "Google",
     "GoogleLens",
     "Iqdb",
     "Lenso",
+    "MetaSearch",
+    "MetaSearchResult",
     "Network",
     "SauceNAO",
+    "SearchCache",
     "Tineye",
     "TraceMoe",
     "Yandex",
+    "default_registry",
+    "similarity_at_least",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY_ATTRS.get(name)) is None:
+        return _import_submodule(name)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name: str) -> Any:
+    # Submodules stay reachable as attributes (e.g. `PicImageSearch.network`), as when they were imported eagerly
+    if not name.startswith("__"):
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,146 @@
+"""Command-line interface.
+
+Usage:
+    python -m PicImageSearch scan <dir|list-file> -e saucenao=2 -e iqdb -o results.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
+from typing import Any
+
+from . import engines as _engines
+from .cache import SearchCache
+from .engines.base import BaseSearchEngine
+from .scan import ScanProgress, scan
+
+ENGINES: dict[str, str] = {name.lower(): name for name in _engines.__all__}
+"""Engine class names selectable on the command line, keyed by lowercase name."""
+
+
+def _parse_engine(value: str) -> tuple[str, int]:
+    name, _, concurrency = value.partition("=")
+    if name.lower() not in ENGINES:
+        raise argparse.ArgumentTypeError(f"unknown engine {name!r}, choose from: {', '.join(sorted(ENGINES))}")
+    try:
+        return name.lower(), int(concurrency) if concurrency else 0
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid concurrency in {value!r}") from None
+
+
+def _parse_option(value: str) -> tuple[str, str, Any]:
+    key, sep, raw = value.partition("=")
+    typed = key.endswith(":")
+    engine, dot, name = key.removesuffix(":").partition(".")
+    if not sep or not dot or engine.lower() not in ENGINES:
+        raise argparse.ArgumentTypeError(f"expected ENGINE.NAME=VALUE or ENGINE.NAME:=JSON, got {value!r}")
+    if not typed:
+        return engine.lower(), name, raw
+    try:
+        return engine.lower(), name, json.loads(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid JSON value in {value!r}") from None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m PicImageSearch", description="Reverse image search from the command line."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = commands.add_parser(
+        "scan",
+        help="search every image of a directory or list file, resumably",
+        description="Search every image of a directory (recursively) or list file (one path or URL per line) "
+        "and append the results to a JSONL file. Finished inputs are recorded in a checkpoint file, so an "
+        "interrupted scan resumes where it stopped.",
+    )
+    scan_parser.add_argument("target", help="directory of images, or a file listing image paths and URLs")
+    scan_parser.add_argument(
+        "-e",
+        "--engine",
+        dest="engines",
+        action="append",
+        type=_parse_engine,
+        required=True,
+        metavar="ENGINE[=N]",
+        help="engine to search with, optionally with its concurrency; repeat for several engines",
+    )
+    scan_parser.add_argument(
+        "-c", "--concurrency", type=int, default=2, help="default concurrency per engine (default: 2)"
+    )
+    scan_parser.add_argument(
+        "-o", "--output", default="results.jsonl", help="JSONL output file (default: results.jsonl)"
+    )
+    scan_parser.add_argument("--checkpoint", help="checkpoint file (default: OUTPUT.checkpoint)")
+    scan_parser.add_argument("--errors", help="JSONL file for failed inputs, retried on rerun (default: OUTPUT.errors)")
+    scan_parser.add_argument("--cache", metavar="PATH", help="SQLite response cache shared by all engines")
+    scan_parser.add_argument(
+        "--option",
+        dest="options",
+        action="append",
+        type=_parse_option,
+        default=[],
+        metavar="ENGINE.NAME[:]=VALUE",
+        help="engine constructor argument, passed as a string (saucenao.api_key=KEY), or decoded from JSON "
+        "when given with := (saucenao.numres:=10, iqdb.is_3d:=true)",
+    )
+    scan_parser.add_argument("--readers", type=int, default=4, help="concurrent file readers (default: 4)")
+    scan_parser.add_argument("--queue-size", type=int, default=64, help="capacity of each stage queue (default: 64)")
+    scan_parser.add_argument(
+        "--progress-interval", type=float, default=5.0, help="seconds between progress lines (default: 5)"
+    )
+    return parser
+
+
+async def _run_scan(args: argparse.Namespace) -> None:
+    cache = SearchCache(path=args.cache) if args.cache else None
+    options: dict[str, dict[str, Any]] = {}
+    for engine, name, value in args.options:
+        options.setdefault(engine, {})[name] = value
+
+    async with AsyncExitStack() as stack:
+        engines: dict[BaseSearchEngine[Any], int] = {}
+        for name, concurrency in dict(args.engines).items():
+            engine_type: type[BaseSearchEngine[Any]] = getattr(_engines, ENGINES[name])
+            engine = engine_type(cache=cache, **options.get(name, {}))
+            engines[await stack.enter_async_context(engine)] = concurrency or args.concurrency
+        if cache is not None:
+            stack.push_async_callback(cache.aclose)
+
+        await scan(
+            args.target,
+            engines,
+            args.output,
+            checkpoint=args.checkpoint,
+            errors=args.errors,
+            readers=args.readers,
+            queue_size=args.queue_size,
+            progress=ScanProgress(sys.stderr, args.progress_interval),
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the command line.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments without the program name, defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(_run_scan(args))
+    except KeyboardInterrupt:
+        print("Interrupted, rerun the same command to resume.", file=sys.stderr)
+        return 130
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
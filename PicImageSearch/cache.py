@@ -0,0 +1,321 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .types import DomainInfo
+
+DEFAULT_CACHE_TTL: float = 3600.0
+"""TTL in seconds for engines without an entry in `DEFAULT_CACHE_TTLS`."""
+
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "saucenao": 86400.0,
+    "tracemoe": 7 * 86400.0,
+    "iqdb": 86400.0,
+    "ascii2d": 86400.0,
+    "animetrace": 86400.0,
+    "ehentai": 86400.0,
+}
+"""TTLs in seconds for stable, index-backed engines, keyed by lowercase engine class name.
+
+Engines scraping general web search pages (Google, Bing, Yandex, ...) fall back to
+`DEFAULT_CACHE_TTL`, since their result links and thumbnails expire quickly.
+"""
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Normalizes an image URL so equivalent spellings share a cache entry.
+
+    Lowercases the scheme and host, drops default ports and fragments, and sorts the query.
+
+    Args:
+        url (str): The image URL.
+
+    Returns:
+        str: The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+    if parts.username is not None:
+        userinfo = parts.username if parts.password is None else f"{parts.username}:{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def make_cache_key(
+    engine_name: str,
+    config: Mapping[str, Any],
+    url: str | None,
+    image: bytes | None,
+    kwargs: Mapping[str, Any],
+    image_digest: str | None = None,
+) -> str:
+    """Builds the content-addressed key of a search.
+
+    Args:
+        engine_name (str): The engine's class name.
+        config (Mapping[str, Any]): Engine parameters that affect the results.
+        url (Optional[str]): The image URL, normalized before hashing.
+        image (Optional[bytes]): The image bytes, identified by their SHA-256 digest.
+        kwargs (Mapping[str, Any]): Additional search arguments.
+        image_digest (Optional[str]): The hex SHA-256 digest of `image`, if already known.
+
+    Returns:
+        str: A hex SHA-256 digest identifying the search.
+    """
+    if image:
+        source = f"sha256:{image_digest or hashlib.sha256(image).hexdigest()}"
+    else:
+        source = normalize_url(url) if url else None
+    material = json.dumps(
+        [engine_name, dict(config), source, dict(kwargs)],
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, DomainInfo):
+        return {"__domain_info__": [value.domain, value.count, [value.tag.value] if value.tag else []]}
+    raise TypeError(f"Object of type {type(value).__name__} is not cacheable")
+
+
+def _decode_object(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1 and "__domain_info__" in obj:
+        return DomainInfo.from_raw_data(obj["__domain_info__"])
+    return obj
+
+
+def encode_payload(response_name: str, resp_data: Any, resp_url: str, kwargs: Mapping[str, Any]) -> bytes:
+    """Serializes what a response model is built from, for storing in a `SearchCache`.
+
+    Payloads are JSON: the raw response data (page text or decoded JSON), the URL and the model's
+    extra arguments, plus the name of the model class. Unlike pickles, reading them back cannot
+    run code, and the model is only looked up among the loaded response classes.
+
+    Args:
+        response_name (str): Identifies the response model class, e.g. its qualified name.
+        resp_data (Any): Raw response data passed to the model.
+        resp_url (str): The URL of the search request.
+        kwargs (Mapping[str, Any]): Additional arguments for the model's constructor.
+
+    Returns:
+        bytes: The payload.
+
+    Raises:
+        TypeError: If the data or arguments hold values JSON cannot represent.
+        ValueError: If they contain circular references.
+    """
+    payload = {"response": response_name, "data": resp_data, "url": resp_url, "kwargs": dict(kwargs)}
+    return json.dumps(payload, ensure_ascii=False, default=_encode_value).encode()
+
+
+def decode_payload(payload: bytes) -> tuple[str, Any, str, dict[str, Any]] | None:
+    """Reads back a payload written by `encode_payload`.
+
+    Args:
+        payload (bytes): The payload.
+
+    Returns:
+        Optional[tuple[str, Any, str, dict[str, Any]]]: The response model name, raw data, URL and extra
+            arguments, or None if the payload is not in this format (e.g. written by an older version).
+    """
+    try:
+        data = json.loads(payload, object_hook=_decode_object)
+        return data["response"], data["data"], data["url"], data["kwargs"]
+    except (ValueError, TypeError, KeyError, IndexError):
+        return None
+
+
+class _SQLiteStore:
+    """Persistent cache tier, evicting the least recently used entries beyond `max_bytes`.
+
+    Every method is blocking; `SearchCache` runs them in a worker thread.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int):
+        self.path: Path = Path(path)
+        self.max_bytes: int = max_bytes
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, engine TEXT NOT NULL, expires_at REAL NOT NULL, "
+                    "accessed_at REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str, now: float) -> tuple[bytes, float] | None:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT payload, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with conn:
+                if row[1] <= now:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0], row[1]
+
+    def set(self, key: str, engine: str, payload: bytes, expires_at: float, now: float) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, engine, expires_at, now, len(payload), payload),
+                )
+                conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                if total > self.max_bytes:
+                    rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+                    for old_key, size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        conn.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                        total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SearchCache:
+    """Two-tier cache of raw search response payloads.
+
+    Entries are keyed by engine, engine parameters and the image content (see `make_cache_key`),
+    and hold the payload an engine built its response model from, so hits are rebuilt locally
+    without any network traffic. Recently used entries stay in an in-memory LRU; with a `path`,
+    entries are also persisted to an SQLite file shared across processes and runs.
+
+    Attributes:
+        maxsize (int): Maximum number of entries in the memory tier.
+        path (Optional[Path]): Location of the SQLite file, None for a memory-only cache.
+        max_disk_bytes (int): Payload size budget of the SQLite tier.
+        ttl (float): TTL in seconds for engines without a specific TTL.
+        ttls (dict[str, float]): Per-engine TTLs in seconds, keyed by lowercase engine class name.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        path: str | Path | None = None,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttls: Mapping[str, float] | None = None,
+    ):
+        """Initializes a search cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept in memory.
+            path (Union[str, Path, None]): SQLite file for the persistent tier, None to disable it.
+            max_disk_bytes (int): Maximum total payload size of the persistent tier, in bytes.
+            ttl (float): Default TTL in seconds.
+            ttls (Optional[Mapping[str, float]]): Per-engine TTLs, merged over `DEFAULT_CACHE_TTLS`.
+        """
+        self.maxsize: int = maxsize
+        self.path: Path | None = Path(path) if path is not None else None
+        self.max_disk_bytes: int = max_disk_bytes
+        self.ttl: float = ttl
+        self.ttls: dict[str, float] = {**DEFAULT_CACHE_TTLS, **{k.lower(): v for k, v in (ttls or {}).items()}}
+        self._memory: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._disk: _SQLiteStore | None = _SQLiteStore(self.path, max_disk_bytes) if self.path is not None else None
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the memory tier."""
+        return len(self._memory)
+
+    def ttl_for(self, engine_name: str) -> float:
+        """Returns the TTL of an engine's entries.
+
+        Args:
+            engine_name (str): Engine name, case-insensitive (e.g. "SauceNAO").
+
+        Returns:
+            float: TTL in seconds.
+        """
+        return self.ttls.get(engine_name.lower(), self.ttl)
+
+    def _remember(self, key: str, payload: bytes, expires_at: float) -> None:
+        self._memory[key] = (payload, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    async def get(self, key: str) -> bytes | None:
+        """Looks up a payload, promoting disk hits into memory.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bytes]: The stored payload, or None on a miss or expired entry.
+        """
+        now = time.time()
+        if (entry := self._memory.get(key)) is not None:
+            if entry[1] > now:
+                self._memory.move_to_end(key)
+                return entry[0]
+            del self._memory[key]
+        if self._disk is None:
+            return None
+        if (stored := await asyncio.to_thread(self._disk.get, key, now)) is None:
+            return None
+        self._remember(key, *stored)
+        return stored[0]
+
+    async def set(self, key: str, engine_name: str, payload: bytes) -> None:
+        """Stores a payload in both tiers with the engine's TTL.
+
+        Args:
+            key (str): The cache key.
+            engine_name (str): Engine name, selects the TTL.
+            payload (bytes): The serialized response payload.
+        """
+        now = time.time()
+        expires_at = now + self.ttl_for(engine_name)
+        self._remember(key, payload, expires_at)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.set, key, engine_name, payload, expires_at, now)
+
+    async def clear(self) -> None:
+        """Removes every entry from both tiers."""
+        self._memory.clear()
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.clear)
+
+    async def aclose(self) -> None:
+        """Closes the SQLite connection. The cache reopens it when used again."""
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.close)
@@ -1,17 +1,40 @@
-from .anime_trace import AnimeTrace
-from .ascii2d import Ascii2D
-from .baidu import BaiDu
-from .bing import Bing
-from .copyseeker import Copyseeker
-from .ehentai import EHentai
-from .google import Google
-from .google_lens import GoogleLens
-from .iqdb import Iqdb
-from .lenso import Lenso
-from .saucenao import SauceNAO
-from .tineye import Tineye
-from .tracemoe import TraceMoe
-from .yandex import Yandex
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .anime_trace import AnimeTrace
+    from .ascii2d import Ascii2D
+    from .baidu import BaiDu
+    from .bing import Bing
+    from .copyseeker import Copyseeker
+    from .ehentai import EHentai
+    from .google import Google
+    from .google_lens import GoogleLens
+    from .iqdb import Iqdb
+    from .lenso import Lenso
+    from .saucenao import SauceNAO
+    from .tineye import Tineye
+    from .tracemoe import TraceMoe
+    from .yandex import Yandex
+
+# Submodules are imported on first attribute access (PEP 562), so using one engine
+# does not pay for importing every other engine and model.
+_LAZY_ATTRS: dict[str, str] = {
+    "AnimeTrace": ".anime_trace",
+    "Ascii2D": ".ascii2d",
+    "BaiDu": ".baidu",
+    "Bing": ".bing",
+    "Copyseeker": ".copyseeker",
+    "EHentai": ".ehentai",
+    "Google": ".google",
+    "GoogleLens": ".google_lens",
+    "Iqdb": ".iqdb",
+    "Lenso": ".lenso",
+    "SauceNAO": ".saucenao",
+    "Tineye": ".tineye",
+    "TraceMoe": ".tracemoe",
+    "Yandex": ".yandex",
+}
 
 __all__ = [
     "AnimeTrace",
@@ -29,3 +52,26 @@ __all__ = [
     "TraceMoe",
     "Yandex",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY_ATTRS.get(name)) is None:
+        return _import_submodule(name)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name: str) -> Any:
+    # Submodules stay reachable as attributes (e.g. `PicImageSearch.network`), as when they were imported eagerly
+    if not name.startswith("__"):
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
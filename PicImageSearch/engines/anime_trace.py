@@ -1,10 +1,10 @@
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any
 
 from typing_extensions import override
 
 from ..model import AnimeTraceResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -20,6 +20,8 @@ class AnimeTrace(BaseSearchEngine[AnimeTraceResponse]):
         ai_detect (Optional[int]): Whether to enable AI image detection, 1 for yes, 2 for no.
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         base_url: str = "https://api.animetrace.com",
@@ -110,4 +112,4 @@ class AnimeTrace(BaseSearchEngine[AnimeTraceResponse]):
         else:
             raise ValueError("One of 'url', 'file', or 'base64' must be provided")
 
-        return AnimeTraceResponse(json_loads(resp.text), resp.url)
+        return await self._make_response(AnimeTraceResponse, resp.json(), resp.url)
@@ -4,6 +4,7 @@ from typing import Any
 from typing_extensions import override
 
 from ..model import Ascii2DResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -28,6 +29,8 @@ class Ascii2D(BaseSearchEngine[Ascii2DResponse]):
         - Feature search may be less accurate with heavily modified images
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         base_url: str = "https://ascii2d.net",
@@ -103,4 +106,4 @@ class Ascii2D(BaseSearchEngine[Ascii2DResponse]):
         if self.bovw:
             resp = await self._send_request(method="get", url=resp.url.replace("/color/", "/bovw/"))
 
-        return Ascii2DResponse(resp.text, resp.url)
+        return await self._make_response(Ascii2DResponse, resp.text, resp.url)
@@ -1,4 +1,3 @@
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any
 
@@ -7,7 +6,7 @@ from pyquery import PyQuery
 from typing_extensions import override
 
 from ..model import BaiDuResponse
-from ..utils import deep_get, read_file
+from ..utils import deep_get, json_loads, read_file
 from .base import BaseSearchEngine
 
 
@@ -20,13 +19,13 @@ class BaiDu(BaseSearchEngine[BaiDuResponse]):
         base_url (str): The base URL for BaiDu searches.
     """
 
-    def __init__(self, **request_kwargs: Any):
+    def __init__(self, base_url: str = "https://graph.baidu.com", **request_kwargs: Any):
         """Initializes a BaiDu API client with specified configurations.
 
         Args:
+            base_url (str): The base URL for BaiDu searches.
             **request_kwargs (Any): Additional arguments for network requests.
         """
-        base_url = "https://graph.baidu.com"
         super().__init__(base_url, **request_kwargs)
 
     @staticmethod
@@ -109,9 +108,9 @@ class BaiDu(BaseSearchEngine[BaiDuResponse]):
             data=data,
             files=files,
         )
-        data_url = deep_get(json_loads(resp.text), "data.url")
+        data_url = deep_get(resp.json(), "data.url")
         if not data_url:
-            return BaiDuResponse({}, resp.url)
+            return await self._make_response(BaiDuResponse, {}, resp.url)
 
         resp = await self._send_request(method="get", url=data_url)
 
@@ -121,17 +120,17 @@ class BaiDu(BaseSearchEngine[BaiDuResponse]):
 
         for card in card_data:
             if card.get("cardName") == "noresult":
-                return BaiDuResponse({}, data_url)
+                return await self._make_response(BaiDuResponse, {}, data_url)
             if card.get("cardName") == "same":
                 same_data = card["tplData"]
             if card.get("cardName") == "simipic":
                 next_url = card["tplData"]["firstUrl"]
                 resp = await self._send_request(method="get", url=next_url)
-                resp_data = json_loads(resp.text)
+                resp_data = resp.json()
 
                 if same_data:
                     resp_data["same"] = same_data
 
-                return BaiDuResponse(resp_data, data_url)
+                return await self._make_response(BaiDuResponse, resp_data, data_url)
 
-        return BaiDuResponse({}, data_url)
+        return await self._make_response(BaiDuResponse, {}, data_url)
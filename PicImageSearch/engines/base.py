@@ -1,12 +1,249 @@
+import asyncio
+import functools
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Coroutine, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Generic, TypeVar
+from types import TracebackType
+from typing import Any, Generic, Literal, TypeVar
+from urllib.parse import urlsplit
 
+from typing_extensions import Self
+
+from ..cache import SearchCache, decode_payload, encode_payload, make_cache_key
 from ..model.base import BaseSearchResponse
 from ..network import RESP, HandOver
+from ..ratelimit import RateLimiter, default_rate_limiter
+from ..utils import read_file
 
 ResponseT = TypeVar("ResponseT")
 T = TypeVar("T", bound=BaseSearchResponse[Any])
+R = TypeVar("R", bound=BaseSearchResponse[Any])
+
+SearchInput = str | bytes | Path
+"""An image for `search_many`: an HTTP(S) URL, a file path, or raw image bytes."""
+
+_recorded_payloads: ContextVar[list[tuple[Any, bytes]] | None] = ContextVar("_recorded_payloads", default=None)
+"""Collects (response, payload) pairs built by `_make_response` while a cached search runs."""
+
+_in_search: ContextVar[bool] = ContextVar("_in_search", default=False)
+"""Marks nested `search` calls (a subclass calling super().search()), which bypass the wrapper."""
+
+
+def _new_response(response_cls: type[R], resp_data: Any, resp_url: str, kwargs: dict[str, Any]) -> R:
+    """Builds a response model; a module-level function so process pools can pickle it."""
+    return response_cls(resp_data, resp_url, **kwargs)
+
+
+class _Flight:
+    """An in-flight search shared by every concurrent caller with the same key."""
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task: asyncio.Task[Any] = task
+        self.waiters: int = 0
+
+
+_flights: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, tuple[Any, ...]], _Flight]] = (
+    weakref.WeakKeyDictionary()
+)
+"""In-flight searches by event loop, since a task can only be awaited on the loop running it."""
+
+
+async def _join_flight(key: tuple[str, tuple[Any, ...]], start: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+    """Awaits the in-flight search for `key`, starting it if there is none.
+
+    The search runs in its own task, so one caller being cancelled does not cancel it for
+    the others; it is only cancelled once every caller has given up.
+    """
+    flights = _flights.setdefault(asyncio.get_running_loop(), {})
+    flight = flights.get(key)
+    if flight is None or flight.task.done():
+        flight = flights[key] = _Flight(asyncio.ensure_future(start()))
+
+        def forget(_: "asyncio.Task[Any]") -> None:
+            if flights.get(key) is flight:
+                del flights[key]
+
+        flight.task.add_done_callback(forget)
+
+    flight.waiters += 1
+    try:
+        return await asyncio.shield(flight.task)
+    finally:
+        flight.waiters -= 1
+        if not flight.waiters and not flight.task.done():
+            flight.task.cancel()
+
+
+_SearchMethod = Callable[..., Coroutine[Any, Any, Any]]
+
+
+def _wrap_search(search: _SearchMethod) -> tuple[_SearchMethod, _SearchMethod]:
+    """Wraps an engine's `search` with the engine's response cache and single-flight coalescing.
+
+    Returns the wrapped `search`, and the `_search_keyed` method it ends in once the cache key is known.
+    """
+
+    async def run(
+        self: "BaseSearchEngine[Any]",
+        key: str,
+        url: str | None,
+        image: bytes | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        recorded: list[tuple[Any, bytes]] | None = [] if self.cache is not None else None
+        searching, recording = _in_search.set(True), _recorded_payloads.set(recorded)
+        try:
+            response = await search(self, url, image, **kwargs)
+        finally:
+            _recorded_payloads.reset(recording)
+            _in_search.reset(searching)
+
+        if self.cache is not None and recorded and recorded[-1][0] is response and self._cacheable(response):
+            await self.cache.set(key, type(self).__name__, recorded[-1][1])
+        return response
+
+    @functools.wraps(search)
+    async def wrapper(
+        self: "BaseSearchEngine[Any]",
+        url: str | None = None,
+        file: str | bytes | Path | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        if (self.cache is None and not self.single_flight) or _in_search.get():
+            return await search(self, url, file, **kwargs)
+
+        image = read_file(file) if file else None
+        key = make_cache_key(type(self).__name__, self._cache_config(), url, image, kwargs)
+        return await search_keyed(self, key, url, image, kwargs)
+
+    async def search_keyed(
+        self: "BaseSearchEngine[Any]",
+        key: str,
+        url: str | None,
+        image: bytes | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        if self.cache is not None and (payload := await self.cache.get(key)) is not None:
+            cached = decode_payload(payload)
+            if cached is not None and (response_cls := BaseSearchResponse._classes.get(cached[0])) is not None:
+                _, resp_data, resp_url, response_kwargs = cached
+                return await self._build_response(response_cls, resp_data, resp_url, response_kwargs)
+
+        if self.single_flight:
+            return await _join_flight((key, self._flight_options()), lambda: run(self, key, url, image, kwargs))
+        return await run(self, key, url, image, kwargs)
+
+    return wrapper, search_keyed
+
+
+async def _iterate_inputs(
+    inputs: Iterable[SearchInput] | AsyncIterable[SearchInput],
+) -> AsyncGenerator[SearchInput, None]:
+    """Iterates synchronous and asynchronous input iterables alike."""
+    if isinstance(inputs, AsyncIterable):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
+
+
+class EngineHooks:
+    """Callbacks for instrumenting search engines, e.g. to export per-engine, per-step latencies.
+
+    Subclass it, override the callbacks needed (the others do nothing) and attach instances to
+    engines with the `hooks` argument or `engine.hooks.append(...)`. Callbacks run inline on the
+    event loop (`on_parse_*` on it too, around the executor call), so they should be quick.
+    Engines without hooks skip all of this, including taking timestamps.
+
+    Times are `time.perf_counter()` differences, in seconds.
+
+    Example:
+        >>> class Latency(EngineHooks):
+        ...     def on_request_end(self, engine, method, url, resp, elapsed, error):
+        ...         histogram.labels(type(engine).__name__, "request").observe(elapsed)
+        >>> engine = SauceNAO(api_key="...", hooks=[Latency()])
+    """
+
+    def on_request_start(self, engine: "BaseSearchEngine[Any]", method: str, url: str) -> None:
+        """Called before a request is sent, including rate limiter waits and retries.
+
+        Args:
+            engine (BaseSearchEngine): The engine sending the request.
+            method (str): The HTTP method, upper case.
+            url (str): The request URL.
+        """
+
+    def on_request_end(
+        self,
+        engine: "BaseSearchEngine[Any]",
+        method: str,
+        url: str,
+        resp: RESP | None,
+        elapsed: float,
+        error: BaseException | None,
+    ) -> None:
+        """Called once a request has finished, successfully or not.
+
+        Args:
+            engine (BaseSearchEngine): The engine that sent the request.
+            method (str): The HTTP method, upper case.
+            url (str): The request URL.
+            resp (Optional[RESP]): The response, None if the request failed. Its `elapsed` covers the
+                final attempt alone, from sending the request to reading the body.
+            elapsed (float): Time spent in the request, including rate limiter waits and retries.
+            error (Optional[BaseException]): The exception the request failed with, if any.
+        """
+
+    def on_retry(
+        self,
+        engine: "BaseSearchEngine[Any]",
+        method: str,
+        url: str,
+        attempt: int,
+        delay: float,
+        status_code: int | None,
+        error: BaseException | None,
+    ) -> None:
+        """Called when a failed attempt is about to be retried.
+
+        Args:
+            engine (BaseSearchEngine): The engine sending the request.
+            method (str): The HTTP method, upper case.
+            url (str): The request URL.
+            attempt (int): The number of the failed attempt, starting at 1.
+            delay (float): Seconds waited before the next attempt.
+            status_code (Optional[int]): The retried response's status, None after a transport error.
+            error (Optional[BaseException]): The transport error, None after a retried status.
+        """
+
+    def on_parse_start(self, engine: "BaseSearchEngine[Any]", response_cls: type) -> None:
+        """Called before a response model is built.
+
+        Args:
+            engine (BaseSearchEngine): The engine building the response.
+            response_cls (type[BaseSearchResponse]): The response model class.
+        """
+
+    def on_parse_end(
+        self,
+        engine: "BaseSearchEngine[Any]",
+        response_cls: type,
+        elapsed: float,
+        error: BaseException | None,
+    ) -> None:
+        """Called once a response model is built, or failed to build.
+
+        Args:
+            engine (BaseSearchEngine): The engine building the response.
+            response_cls (type[BaseSearchResponse]): The response model class.
+            elapsed (float): Time spent building it, including waiting for the parse executor.
+            error (Optional[BaseException]): The exception parsing failed with, if any.
+        """
 
 
 class BaseSearchEngine(HandOver, ABC, Generic[T]):
@@ -15,25 +252,300 @@ class BaseSearchEngine(HandOver, ABC, Generic[T]):
     This abstract base class implements the core functionality shared by all image search engines,
     including network request handling and basic parameter validation.
 
+    Engines are async context managers. Unless a client is passed in, each engine lazily creates
+    one pooled HTTP client and reuses its keep-alive connections across requests and searches;
+    leaving the `async with` block (or calling `close()`) releases it.
+
+    Requests sent through `_send_request` pass the engine's rate limiter first, so calls
+    over the limit are queued instead of being rejected by the service.
+
+    With a `SearchCache`, `search` results are served from the cache when the same image
+    (by content digest or normalized URL) was searched with the same engine parameters.
+    Engines build their responses through `_make_response`, which records the raw payload
+    the cache stores. With `single_flight`, concurrent identical searches (same engine class,
+    parameters, options, arguments and image) share one request and receive the same response object.
+    With `lazy`, responses parse their result items, and the items their `LazyField`s, on first
+    access (see `LazyItems`); otherwise everything is parsed up front. Without
+    `keep_origin`, responses drop the raw data of the page and its items once parsed.
+
+    By default, JSON responses are built inline, since the payload is already decoded and a thread
+    hop would cost more than the parse. HTML pages are parsed in a one-thread pool owned by the
+    engine, so a large page does not stall other searches running on the loop, without occupying
+    the loop's default thread pool, which also resolves host names (`getaddrinfo`) for new
+    connections. One thread serializes the engine's HTML parses; since lxml parsing mostly holds
+    the GIL, more threads would not parse much faster. See `parse_executor` for other choices.
+
+    `hooks` receive the start and end of every request and parse, and every retry (see `EngineHooks`).
+
     Attributes:
         base_url (str): The base URL endpoint for the search engine's API.
+        rate_limiter (Optional[RateLimiter]): Throttles requests per host, None if disabled.
+        cache (Optional[SearchCache]): Response cache for `search`, None if disabled.
+        single_flight (bool): Whether concurrent identical searches are coalesced.
+        lazy (bool): Whether responses parse their result items on first access.
+        keep_origin (bool): Whether responses keep the raw data they were parsed from.
+        parse_executor (Union[Executor, bool, None]): Where responses are parsed: None for the default
+            described above, an executor, True for the event loop's default executor, or False to parse
+            on the event loop itself.
+        hooks (list[EngineHooks]): Instrumentation callbacks, run in order.
+        cache_ignored_attrs (frozenset[str]): Public attributes left out of cache keys because
+            they do not affect the results.
     """
 
     base_url: str
+    cache_ignored_attrs: frozenset[str] = frozenset(
+        {
+            "proxies",
+            "cookies",
+            "timeout",
+            "verify_ssl",
+            "http2",
+            "reuse_client",
+            "single_flight",
+            "lazy",
+            "keep_origin",
+            "parse_executor",
+        }
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        search = cls.__dict__.get("search")
+        if search is not None and not getattr(search, "__isabstractmethod__", False):
+            cls.search, cls._search_keyed = _wrap_search(search)  # pyright: ignore[reportAttributeAccessIssue]
 
-    def __init__(self, base_url: str, **request_kwargs: Any):
+    def __init__(
+        self,
+        base_url: str,
+        rate_limiter: RateLimiter | Literal[False] | None = None,
+        cache: SearchCache | None = None,
+        single_flight: bool = False,
+        lazy: bool = False,
+        keep_origin: bool = True,
+        parse_executor: Executor | bool | None = None,
+        hooks: Iterable[EngineHooks] | None = None,
+        **request_kwargs: Any,
+    ):
         """Initialize the base search engine.
 
         Args:
             base_url (str): The base URL for the search engine's API endpoint.
+            rate_limiter (Union[RateLimiter, Literal[False], None]): Rate limiter applied to every request,
+                keyed by host. None uses the engine's default profile (if any) from
+                `PicImageSearch.ratelimit.DEFAULT_RATE_LIMITS`; False disables rate limiting.
+                Pass the same limiter to several engines to make them share one budget.
+            cache (Optional[SearchCache]): Cache for search responses, may be shared by several engines.
+            single_flight (bool): Coalesce concurrent identical searches into one request. Coalescing
+                spans engine instances with the same parameters and options (see `_flight_options`); the
+                search runs with the first caller's engine.
+            lazy (bool): Build responses whose result items are parsed on first access, saving the
+                parsing of items that are never looked at.
+            keep_origin (bool): Keep the raw response data (`origin`) on responses and result items. Set
+                to False to free the parsed HTML trees and JSON payloads when holding many results.
+            parse_executor (Union[Executor, bool, None]): Executor that parses responses, so the event loop
+                stays responsive. None (the default) parses JSON responses inline and HTML pages in a thread
+                owned by the engine, True uses the loop's default thread pool, False parses inline. With a
+                `ProcessPoolExecutor`, responses are built with `keep_origin=False` and without `lazy`, since
+                parsed HTML trees cannot be pickled back to the event loop's process.
+            hooks (Optional[Iterable[EngineHooks]]): Callbacks notified of requests, retries and parsing, e.g. to
+                record per-step latencies. More can be appended to `hooks` later.
             **request_kwargs (Any): Additional parameters for network requests, such as:
                 - headers: Custom HTTP headers
                 - proxies: Proxy settings
                 - timeout: Request timeout settings
+                - reuse_client: Set to False to build a new client for every request
+                - retry_policy: Retry settings overriding the engine's `default_retry_policy`
                 - etc.
         """
         super().__init__(**request_kwargs)
         self.base_url = base_url
+        if rate_limiter is None:
+            rate_limiter = default_rate_limiter(type(self).__name__)
+        self.rate_limiter: RateLimiter | None = rate_limiter or None
+        self.cache: SearchCache | None = cache
+        self.single_flight: bool = single_flight
+        self.lazy: bool = lazy
+        self.keep_origin: bool = keep_origin
+        self.parse_executor: Executor | bool | None = parse_executor
+        self._parse_pool: ThreadPoolExecutor | None = None
+        self.hooks: list[EngineHooks] = list(hooks) if hooks else []
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry.
+
+        Returns:
+            Self: The search engine instance.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Async context manager exit, closes the pooled client owned by the engine."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the pooled client and stops the parsing thread owned by the engine.
+
+        Both are created again when the engine is used afterwards.
+        """
+        await super().close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False)
+            self._parse_pool = None
+
+    def rate_limit_wait(self, url: str = "") -> float:
+        """Returns how long the next request to a URL would currently be queued by the rate limiter.
+
+        Args:
+            url (str): The request URL. Defaults to the engine's base URL.
+
+        Returns:
+            float: Wait time in seconds, 0.0 if the request would be sent immediately.
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.wait_time(urlsplit(url or self.base_url).netloc)
+
+    def _cache_config(self) -> dict[str, Any]:
+        """Returns the engine parameters that distinguish cache entries.
+
+        Defaults to the public scalar attributes that are set, minus `cache_ignored_attrs`. Engines keeping
+        their parameters in other containers override this.
+
+        Returns:
+            dict[str, Any]: Parameters included in cache keys.
+        """
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if not name.startswith("_")
+            and name not in self.cache_ignored_attrs
+            and isinstance(value, (str, int, float, bool))
+        }
+
+    def _cacheable(self, response: BaseSearchResponse[Any]) -> bool:
+        """Returns whether a search response may be cached.
+
+        Error responses and empty result pages (often blocks or captchas) are not cached.
+
+        Args:
+            response (BaseSearchResponse): The response returned by `search`.
+
+        Returns:
+            bool: True to store the response.
+        """
+        return getattr(response, "status_code", 200) == 200 and bool(response.raw)
+
+    def _flight_options(self) -> tuple[Any, ...]:
+        """Returns the engine options that single-flight searches must share, on top of the cache key.
+
+        They change how requests are sent (client, cookies, headers, proxy), how the response is built
+        (`lazy`, `keep_origin`, `parse_executor`) or who observes it (`hooks`), so searches differing in
+        them are not coalesced.
+        """
+        return (
+            self.client,
+            self.registry,
+            self.proxies,
+            tuple(sorted(self.headers.items())) if self.headers else (),
+            self.cookies,
+            self.timeout,
+            self.verify_ssl,
+            self.http2,
+            self.lazy,
+            self.keep_origin,
+            self.parse_executor,
+            tuple(self.hooks),
+        )
+
+    def _response_options(self) -> dict[str, Any]:
+        """Returns the engine options passed to every response model, on top of its own arguments.
+
+        They are left out of cached payloads, so engines with different options share cache entries.
+        """
+        options: dict[str, Any] = {}
+        if self.lazy:
+            options["lazy"] = True
+        if not self.keep_origin:
+            options["keep_origin"] = False
+        return options
+
+    async def _build_response(self, response_cls: type[R], resp_data: Any, resp_url: str, kwargs: dict[str, Any]) -> R:
+        """Builds a response model with the engine's response options, in the parse executor if any.
+
+        Args:
+            response_cls (type[BaseSearchResponse]): The response model class.
+            resp_data (Any): Raw response data passed to the model.
+            resp_url (str): The URL of the search request.
+            kwargs (dict[str, Any]): Additional arguments for the model's constructor.
+
+        Returns:
+            BaseSearchResponse: The response model instance.
+        """
+        if not self.hooks:
+            return await self._parse(response_cls, resp_data, resp_url, kwargs)
+
+        hooks = list(self.hooks)
+        for hook in hooks:
+            hook.on_parse_start(self, response_cls)
+        start = time.perf_counter()
+        try:
+            response = await self._parse(response_cls, resp_data, resp_url, kwargs)
+        except BaseException as e:
+            elapsed = time.perf_counter() - start
+            for hook in hooks:
+                hook.on_parse_end(self, response_cls, elapsed, e)
+            raise
+        elapsed = time.perf_counter() - start
+        for hook in hooks:
+            hook.on_parse_end(self, response_cls, elapsed, None)
+        return response
+
+    async def _parse(self, response_cls: type[R], resp_data: Any, resp_url: str, kwargs: dict[str, Any]) -> R:
+        """Builds a response model for `_build_response`, without notifying hooks."""
+        kwargs = kwargs | self._response_options()
+        if self.parse_executor is False or (self.parse_executor is None and not isinstance(resp_data, str)):
+            return response_cls(resp_data, resp_url, **kwargs)
+        if self.parse_executor is None:
+            if self._parse_pool is None:
+                self._parse_pool = ThreadPoolExecutor(1, thread_name_prefix=f"{type(self).__name__}-parse")
+            executor = self._parse_pool
+        else:
+            executor = None if self.parse_executor is True else self.parse_executor
+        if isinstance(executor, ProcessPoolExecutor):
+            kwargs |= {"lazy": False, "keep_origin": False}
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, _new_response, response_cls, resp_data, resp_url, kwargs
+        )
+
+    async def _make_response(self, response_cls: type[R], resp_data: Any, resp_url: str, **kwargs: Any) -> R:
+        """Builds a response model, recording its raw payload for the response cache.
+
+        Args:
+            response_cls (type[BaseSearchResponse]): The response model class.
+            resp_data (Any): Raw response data passed to the model.
+            resp_url (str): The URL of the search request.
+            **kwargs (Any): Additional arguments for the model's constructor.
+
+        Returns:
+            BaseSearchResponse: The response model instance.
+        """
+        recorded = _recorded_payloads.get()
+        payload = None
+        if recorded is not None:
+            try:
+                name = f"{response_cls.__module__}.{response_cls.__qualname__}"
+                payload = encode_payload(name, resp_data, resp_url, kwargs)
+            except (TypeError, ValueError):
+                pass
+        response = await self._build_response(response_cls, resp_data, resp_url, kwargs)
+        if recorded is not None and payload is not None:
+            recorded.append((response, payload))
+        return response
 
     @abstractmethod
     async def search(
@@ -64,39 +576,180 @@ class BaseSearchEngine(HandOver, ABC, Generic[T]):
         """
         raise NotImplementedError
 
-    async def _send_request(self, method: str, endpoint: str = "", url: str = "", **kwargs: Any) -> RESP:
+    async def _search_keyed(self, key: str, url: str | None, image: bytes | None, kwargs: dict[str, Any]) -> T:
+        """Runs a search whose cache key is already built, through the response cache and single-flight.
+
+        Defined along with the wrapped `search` of every engine class (see `_wrap_search`).
+        """
+        raise NotImplementedError
+
+    async def search_digest(self, image: bytes, digest: str, **kwargs: Any) -> T:
+        """Searches image bytes whose SHA-256 digest is already known, e.g. from deduplicating them.
+
+        Same as `search(file=image)`, except that the cache key is built from `digest` rather than by
+        hashing the image again.
+
+        Args:
+            image (bytes): The image to search.
+            digest (str): The hex SHA-256 digest of `image`.
+            **kwargs (Any): Additional search parameters specific to each search engine.
+
+        Returns:
+            T: Search results, as returned by `search`.
+        """
+        if (self.cache is None and not self.single_flight) or _in_search.get():
+            return await self.search(file=image, **kwargs)
+        key = make_cache_key(type(self).__name__, self._cache_config(), None, image, kwargs, image_digest=digest)
+        return await self._search_keyed(key, None, image, kwargs)
+
+    async def _search_input(self, item: SearchInput, kwargs: dict[str, Any]) -> T | Exception:
+        """Searches one `search_many` input, returning the exception instead of raising it."""
+        try:
+            if isinstance(item, str) and item.startswith(("http://", "https://")):
+                return await self.search(url=item, **kwargs)
+            return await self.search(file=item, **kwargs)
+        except Exception as e:
+            return e
+
+    async def search_many(
+        self,
+        inputs: Iterable[SearchInput] | AsyncIterable[SearchInput],
+        concurrency: int = 4,
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[SearchInput, T | Exception]]:
+        """Searches many images with bounded concurrency.
+
+        Inputs are pulled lazily, at most `concurrency` at a time, and each file is only read
+        when its search starts, so memory use does not grow with the number of inputs. Requests
+        still pass the engine's rate limiter, which paces the batch to the service's limits.
+
+        Args:
+            inputs (Union[Iterable[SearchInput], AsyncIterable[SearchInput]]): Images to search. Strings
+                starting with "http://" or "https://" are searched as URLs; other strings, Path objects
+                and bytes are searched as files.
+            concurrency (int): Maximum number of searches running at once.
+            **kwargs (Any): Additional search arguments passed to every search.
+
+        Yields:
+            tuple[SearchInput, Union[T, Exception]]: Each input with its response, or the exception its
+                search raised, in completion order.
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+
+        Note:
+            Searches still running when iteration stops early are cancelled. Wrap the iterator in
+            `contextlib.aclosing()` when breaking out of the loop to cancel them immediately.
+        """
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1")
+
+        iterator = _iterate_inputs(inputs)
+        pending: dict[asyncio.Task[T | Exception], SearchInput] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        item = await anext(iterator)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(self._search_input(item, kwargs))] = item
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await iterator.aclose()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str = "",
+        url: str = "",
+        rate_limit_key: str | None = None,
+        **kwargs: Any,
+    ) -> RESP:
         """Send an HTTP request and return the response.
 
         A utility method that handles both GET and POST requests to the search engine's API.
+        Every attempt (including retries) waits for the engine's rate limiter, if one is configured.
 
         Args:
             method (str): HTTP method, must be either 'get' or 'post' (case-insensitive).
             endpoint (str): API endpoint to append to the base URL. If empty, uses base_url directly.
             url (str): Full URL for the request. Overrides base_url and endpoint if provided.
+            rate_limit_key (Optional[str]): Key for the rate limiter. Defaults to the request host.
             **kwargs (Any): Additional parameters for the request, such as:
                 - params: URL parameters for GET requests
                 - data: Form data for POST requests
                 - files: Files to upload
                 - headers: Custom HTTP headers
+                - retry_policy: Retry settings overriding the engine's policy for this request
                 - etc.
 
         Returns:
-            RESP: A dataclass containing:
-                - text: The response body as text
-                - url: The final URL after any redirects
-                - status_code: The HTTP status code
+            RESP: The response text and bytes (with `json()` to decode them), the final URL after any
+                redirects, the HTTP status code and headers, and timing and transfer sizes.
 
         Raises:
             ValueError: If an unsupported HTTP method is specified.
         """
         request_url = url or (f"{self.base_url}/{endpoint}" if endpoint else self.base_url)
 
+        if (rate_limiter := self.rate_limiter) is not None:
+            key = rate_limit_key or urlsplit(request_url).netloc
+
+            async def before_attempt() -> None:
+                await rate_limiter.acquire(key)
+
+            kwargs["before_attempt"] = before_attempt
+
         method = method.lower()
         if method == "get":
             # Files are not valid for GET requests
             kwargs.pop("files", None)
-            return await self.get(request_url, **kwargs)
+            send = self.get
         elif method == "post":
-            return await self.post(request_url, **kwargs)
+            send = self.post
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
+
+        if not self.hooks:
+            return await send(request_url, **kwargs)
+        return await self._send_with_hooks(send, method.upper(), request_url, kwargs)
+
+    async def _send_with_hooks(
+        self,
+        send: Callable[..., Coroutine[Any, Any, RESP]],
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+    ) -> RESP:
+        """Sends a request for `_send_request`, notifying the engine's hooks of its start, retries and end."""
+        hooks = list(self.hooks)
+
+        def on_retry(attempt: int, delay: float, status_code: int | None, error: BaseException | None) -> None:
+            for hook in hooks:
+                hook.on_retry(self, method, url, attempt, delay, status_code, error)
+
+        for hook in hooks:
+            hook.on_request_start(self, method, url)
+        start = time.perf_counter()
+        try:
+            resp = await send(url, on_retry=on_retry, **kwargs)
+        except BaseException as e:
+            elapsed = time.perf_counter() - start
+            for hook in hooks:
+                hook.on_request_end(self, method, url, None, elapsed, e)
+            raise
+        elapsed = time.perf_counter() - start
+        for hook in hooks:
+            hook.on_request_end(self, method, url, resp, elapsed, None)
+        return resp
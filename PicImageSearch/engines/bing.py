@@ -1,7 +1,6 @@
 import re
 from base64 import b64decode, b64encode
 from json import dumps as json_dumps
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote_plus
@@ -77,13 +76,13 @@ class Bing(BaseSearchEngine[BingResponse]):
         _image_signature (str | None): Image signature used for authentication headers.
     """
 
-    def __init__(self, **request_kwargs: Any):
+    def __init__(self, base_url: str = "https://www.bing.com", **request_kwargs: Any):
         """Initializes a Bing API client with specified configurations.
 
         Args:
+            base_url (str): The base URL for Bing searches.
             **request_kwargs (Any): Additional arguments for network requests.
         """
-        base_url = "https://www.bing.com"
         super().__init__(base_url, **request_kwargs)
         self._session_key: str | None = None
         self._image_signature: str | None = None
@@ -168,12 +167,15 @@ class Bing(BaseSearchEngine[BingResponse]):
             referer = f"{self.base_url}/images/search?insightsToken={bcid}"
             image_info = {"imageInfo": {"imageInsightsToken": bcid, "source": "Gallery"}}
 
-            # Clear cookies for BCID-based search
-            if self.client:
-                self.client.cookies.clear()
-
         # Build headers with signature if available
         headers = {"Referer": referer}
+        if not image_url:
+            # BCID-based searches are sent without the cookies set by the upload. Pooled and registry
+            # clients outlive this request, so their cookies are overridden for it instead of cleared.
+            if self.client is not None:
+                self.client.cookies.clear()
+            else:
+                headers["Cookie"] = self.cookies or ""
         if self._image_signature:
             headers["X-Image-Knowledge-Signature"] = _parse_signature(self._image_signature)
 
@@ -186,7 +188,7 @@ class Bing(BaseSearchEngine[BingResponse]):
         }
         resp = await self._send_request(method="post", endpoint=endpoint, headers=headers, params=params, files=files)
 
-        return json_loads(resp.text)
+        return resp.json()
 
     @override
     async def search(
@@ -235,4 +237,4 @@ class Bing(BaseSearchEngine[BingResponse]):
         else:
             raise ValueError("Either 'url' or 'file' must be provided")
 
-        return BingResponse(resp_json, resp_url)
+        return await self._make_response(BingResponse, resp_json, resp_url)
@@ -1,4 +1,3 @@
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any
 
@@ -6,7 +5,7 @@ from typing_extensions import override
 
 from ..constants import COPYSEEKER_CONSTANTS
 from ..model import CopyseekerResponse
-from ..utils import read_file
+from ..utils import json_loads, read_file
 from .base import BaseSearchEngine
 
 
@@ -129,7 +128,7 @@ class Copyseeker(BaseSearchEngine[CopyseekerResponse]):
 
         discovery_id = await self._get_discovery_id(url, file)
         if discovery_id is None:
-            return CopyseekerResponse({}, "")
+            return await self._make_response(CopyseekerResponse, {}, "")
 
         data = [{"discoveryId": discovery_id, "hasBlocker": False}]
         headers = {"next-action": COPYSEEKER_CONSTANTS["GET_RESULTS_TOKEN"]}
@@ -149,4 +148,4 @@ class Copyseeker(BaseSearchEngine[CopyseekerResponse]):
                 resp_json = json_loads(line[2:])
                 break
 
-        return CopyseekerResponse(resp_json, resp.url)
+        return await self._make_response(CopyseekerResponse, resp_json, resp.url)
@@ -4,6 +4,7 @@ from typing import Any
 from typing_extensions import override
 
 from ..model import EHentaiResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -21,6 +22,8 @@ class EHentai(BaseSearchEngine[EHentaiResponse]):
         exp (bool): A flag to include results from expunged galleries.
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         is_ex: bool = False,
@@ -107,4 +110,4 @@ class EHentai(BaseSearchEngine[EHentaiResponse]):
             files=files,
         )
 
-        return EHentaiResponse(resp.text, resp.url)
+        return await self._make_response(EHentaiResponse, resp.text, resp.url)
@@ -5,6 +5,7 @@ from typing import Any
 from typing_extensions import override
 
 from ..model import GoogleResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -22,6 +23,8 @@ class Google(BaseSearchEngine[GoogleResponse]):
             Example: `https://www.google.co.jp` for searches in Japan.
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         base_url: str = "https://www.google.com",
@@ -70,7 +73,9 @@ class Google(BaseSearchEngine[GoogleResponse]):
             return None
 
         _resp = await self._send_request(method="get", url=resp.pages[next_page_number - 1])
-        return GoogleResponse(_resp.text, _resp.url, next_page_number, resp.pages)
+        return await self._make_response(
+            GoogleResponse, _resp.text, _resp.url, page_number=next_page_number, pages=resp.pages
+        )
 
     async def pre_page(self, resp: GoogleResponse) -> GoogleResponse | None:
         """Navigates to the previous page in Google search results.
@@ -118,7 +123,7 @@ class Google(BaseSearchEngine[GoogleResponse]):
             selected = next((i for i in resp.raw if i.thumbnail), resp.raw[0])
             if not selected.thumbnail and len(resp.raw) > 1:
                 _resp = await self._send_request(method="get", url=resp.url)
-                return GoogleResponse(_resp.text, _resp.url)
+                return await self._make_response(GoogleResponse, _resp.text, _resp.url)
         return resp
 
     @override
@@ -185,5 +190,5 @@ class Google(BaseSearchEngine[GoogleResponse]):
         else:
             raise ValueError("Either 'url' or 'file' must be provided")
 
-        initial_resp = GoogleResponse(resp.text, resp.url)
+        initial_resp = await self._make_response(GoogleResponse, resp.text, resp.url)
         return await self._ensure_thumbnail_data(initial_resp)
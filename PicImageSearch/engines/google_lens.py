@@ -5,7 +5,7 @@ from pyquery import PyQuery
 from typing_extensions import override
 
 from ..model import GoogleLensExactMatchesResponse, GoogleLensResponse
-from ..network import RESP
+from ..network import LOOKUP_RETRY_POLICY, RESP, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -27,6 +27,8 @@ class GoogleLens(BaseSearchEngine[GoogleLensResponse | GoogleLensExactMatchesRes
         q (Optional[str]): Optional query parameter for search. Not applicable for 'exact_matches' type.
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         base_url: str = "https://lens.google.com",
@@ -162,6 +164,6 @@ class GoogleLens(BaseSearchEngine[GoogleLensResponse | GoogleLensExactMatchesRes
         resp = await self._perform_image_search(url, file, q)
 
         if self.search_type == "exact_matches":
-            return GoogleLensExactMatchesResponse(resp.text, resp.url)
+            return await self._make_response(GoogleLensExactMatchesResponse, resp.text, resp.url)
         else:
-            return GoogleLensResponse(resp.text, resp.url)
+            return await self._make_response(GoogleLensResponse, resp.text, resp.url)
@@ -4,6 +4,7 @@ from typing import Any
 from typing_extensions import override
 
 from ..model import IqdbResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -22,6 +23,8 @@ class Iqdb(BaseSearchEngine[IqdbResponse]):
         - For real-life/3D images, uses 3d.iqdb.org
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         is_3d: bool = False,
@@ -92,4 +95,4 @@ class Iqdb(BaseSearchEngine[IqdbResponse]):
             files=files,
         )
 
-        return IqdbResponse(resp.text, resp.url)
+        return await self._make_response(IqdbResponse, resp.text, resp.url)
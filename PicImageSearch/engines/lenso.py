@@ -1,6 +1,5 @@
 import base64
 import warnings
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any, Literal, get_args
 
@@ -84,7 +83,7 @@ class Lenso(BaseSearchEngine[LensoResponse]):
         endpoint = "api/upload"
         payload = {"image": f"data:image/jpeg;base64,{image_base64}"}
         resp = await self._send_request(method="post", endpoint=endpoint, json=payload)
-        resp_json = json_loads(resp.text)
+        resp_json = resp.json()
 
         if result_hash := resp_json.get("id"):
             return result_hash
@@ -169,7 +168,7 @@ class Lenso(BaseSearchEngine[LensoResponse]):
         }
 
         resp = await self._send_request(method="post", endpoint=search_endpoint, json=search_payload)
-        resp_json = json_loads(resp.text)
+        resp_json = resp.json()
         resp_url = f"{self.base_url}/en/results/{result_hash}"
 
-        return LensoResponse(resp_json, resp_url)
+        return await self._make_response(LensoResponse, resp_json, resp_url)
@@ -1,15 +1,126 @@
-from json import loads as json_loads
+import asyncio
+import time
+from collections.abc import Sequence
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 from httpx import QueryParams
 from typing_extensions import override
 
 from ..model import SauceNAOResponse
+from ..network import LOOKUP_RETRY_POLICY, RESP, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
 
+class _KeyState:
+    """Quota bookkeeping for a single SauceNAO API key."""
+
+    def __init__(self) -> None:
+        self.short_remaining: int | None = None
+        self.long_remaining: int | None = None
+        self.parked_until: float = 0.0
+
+
+class SauceNAOKeyPool:
+    """A pool of SauceNAO API keys balanced by their remaining search quota.
+
+    Each search takes the key with the most remaining short (30 seconds) and long (daily)
+    quota, as reported by the `short_remaining` and `long_remaining` fields of the last
+    response for that key. Keys that run out are parked until their window resets.
+
+    Attributes:
+        short_window (float): Seconds a key is parked after its 30-second quota runs out.
+        long_window (float): Seconds a key is parked after its daily quota runs out.
+    """
+
+    short_window: float = 30
+    long_window: float = 86400
+
+    def __init__(self, api_keys: Sequence[str]):
+        """Initializes a key pool.
+
+        Args:
+            api_keys (Sequence[str]): The SauceNAO API keys to balance between.
+
+        Raises:
+            ValueError: If no API keys are given.
+        """
+        if not api_keys:
+            raise ValueError("At least one API key must be provided")
+        self._keys: dict[str, _KeyState] = {key: _KeyState() for key in api_keys}
+
+    @property
+    def api_keys(self) -> list[str]:
+        """All API keys in the pool."""
+        return list(self._keys)
+
+    def available(self) -> list[str]:
+        """Returns the keys that are not parked right now, best first."""
+        now = time.monotonic()
+        unknown = float("inf")
+
+        def remaining(key: str) -> tuple[float, float]:
+            state = self._keys[key]
+            short = unknown if state.short_remaining is None else state.short_remaining
+            long = unknown if state.long_remaining is None else state.long_remaining
+            return short, long
+
+        keys = [key for key, state in self._keys.items() if state.parked_until <= now]
+        return sorted(keys, key=remaining, reverse=True)
+
+    async def acquire(self) -> str:
+        """Returns the best key for the next search, waiting if every key is in its 30-second cooldown.
+
+        The chosen key's remaining quota is decremented right away, so concurrent searches
+        spread across keys before their responses arrive.
+
+        Returns:
+            str: The API key to use.
+
+        Raises:
+            RuntimeError: If every key has exhausted its daily quota.
+        """
+        while not (keys := self.available()):
+            delay = min(state.parked_until for state in self._keys.values()) - time.monotonic()
+            if delay > self.short_window:
+                raise RuntimeError("All SauceNAO API keys have exhausted their daily search quota")
+            await asyncio.sleep(delay)
+
+        key = keys[0]
+        state = self._keys[key]
+        if state.short_remaining is not None:
+            state.short_remaining -= 1
+        if state.long_remaining is not None:
+            state.long_remaining -= 1
+        return key
+
+    def update(self, api_key: str, status_code: int, header: dict[str, Any]) -> None:
+        """Updates a key's quota from a SauceNAO response.
+
+        Args:
+            api_key (str): The key the search was made with.
+            status_code (int): HTTP status code of the response.
+            header (dict[str, Any]): The `header` object of the response JSON.
+        """
+        if (state := self._keys.get(api_key)) is None:
+            return
+
+        if (short_remaining := header.get("short_remaining")) is not None:
+            state.short_remaining = int(short_remaining)
+        if (long_remaining := header.get("long_remaining")) is not None:
+            state.long_remaining = int(long_remaining)
+
+        now = time.monotonic()
+        if state.long_remaining is not None and state.long_remaining <= 0:
+            state.parked_until = now + self.long_window
+        elif (state.short_remaining is not None and state.short_remaining <= 0) or status_code == 429:
+            state.parked_until = now + self.short_window
+            state.short_remaining = None
+
+
 class SauceNAO(BaseSearchEngine[SauceNAOResponse]):
     """API client for the SauceNAO image search engine.
 
@@ -18,12 +129,15 @@ class SauceNAO(BaseSearchEngine[SauceNAOResponse]):
     Attributes:
         base_url (str): The base URL for SauceNAO searches.
         params (dict[str, Any]): The query parameters for SauceNAO search.
+        key_pool (Optional[SauceNAOKeyPool]): The API key pool, if several keys were given.
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         base_url: str = "https://saucenao.com",
-        api_key: str | None = None,
+        api_key: str | Sequence[str] | SauceNAOKeyPool | None = None,
         numres: int = 5,
         hide: int = 0,
         minsim: int = 30,
@@ -39,7 +153,9 @@ class SauceNAO(BaseSearchEngine[SauceNAOResponse]):
 
         Args:
             base_url (str): The base URL for SauceNAO searches, defaults to 'https://saucenao.com'.
-            api_key (Optional[str]): API key for SauceNAO API access, required for full API functionality.
+            api_key (Union[str, Sequence[str], SauceNAOKeyPool, None]): API key for SauceNAO API access, required
+                for full API functionality. A sequence of keys (or a shared `SauceNAOKeyPool`) spreads searches
+                over the keys by their remaining quota.
             numres (int): Number of results to return (1-40), defaults to 5.
             hide (int): Content filtering level (0-3), defaults to 0.
                 0: Show all results
@@ -63,6 +179,7 @@ class SauceNAO(BaseSearchEngine[SauceNAOResponse]):
             - Database indices: https://saucenao.com/tools/examples/api/index_details.txt
             - Using API key is recommended to avoid rate limits and access more features.
             - When `dbs` is provided, it takes precedence over `db` parameter.
+            - With a key pool, the rate limiter tracks each key separately.
         """
         base_url = f"{base_url}/search.php"
         super().__init__(base_url, **request_kwargs)
@@ -74,8 +191,13 @@ class SauceNAO(BaseSearchEngine[SauceNAOResponse]):
             "db": db,
             "minsim": minsim,
         }
-        if api_key is not None:
+        self.key_pool: SauceNAOKeyPool | None = None
+        if isinstance(api_key, SauceNAOKeyPool):
+            self.key_pool = api_key
+        elif isinstance(api_key, str):
             params["api_key"] = api_key
+        elif api_key is not None:
+            self.key_pool = SauceNAOKeyPool(api_key)
         if dbmask is not None:
             params["dbmask"] = dbmask
         if dbmaski is not None:
@@ -86,6 +208,13 @@ class SauceNAO(BaseSearchEngine[SauceNAOResponse]):
             for i in dbs:
                 self.params = self.params.add("dbs[]", i)
 
+    @override
+    def _cache_config(self) -> dict[str, Any]:
+        """Adds the query parameters, minus the API key, to the cache key."""
+        config = super()._cache_config()
+        config["params"] = str(self.params.remove("api_key"))
+        return config
+
     @override
     async def search(
         self,
@@ -131,13 +260,43 @@ class SauceNAO(BaseSearchEngine[SauceNAOResponse]):
         else:
             raise ValueError("Either 'url' or 'file' must be provided")
 
-        resp = await self._send_request(
-            method="post",
-            params=params,
-            files=files,
-        )
-
-        resp_json = json_loads(resp.text)
+        if self.key_pool is None:
+            resp = await self._send_request(method="post", params=params, files=files)
+            resp_json = resp.json()
+        else:
+            resp, resp_json = await self._send_with_key_pool(self.key_pool, params, files)
         resp_json.update({"status_code": resp.status_code})
 
-        return SauceNAOResponse(resp_json, resp.url)
+        return await self._make_response(SauceNAOResponse, resp_json, resp.url)
+
+    async def _send_with_key_pool(
+        self,
+        key_pool: SauceNAOKeyPool,
+        params: QueryParams,
+        files: dict[str, Any] | None,
+    ) -> tuple[RESP, dict[str, Any]]:
+        """Sends a search with a key from the pool, moving on to another key when one is throttled.
+
+        A 429 is not retried with the same key: the key is parked and the search is sent again with
+        the next available one, at most once per key in the pool.
+
+        Returns:
+            tuple[RESP, dict[str, Any]]: The last response and its decoded JSON.
+        """
+        retry_policy = replace(self.retry_policy, retry_statuses=self.retry_policy.retry_statuses - {429})
+        host = urlsplit(self.base_url).netloc
+        attempts = len(key_pool.api_keys)
+        while True:
+            api_key = await key_pool.acquire()
+            resp = await self._send_request(
+                method="post",
+                rate_limit_key=f"{host}#{api_key}",
+                retry_policy=retry_policy,
+                params=params.set("api_key", api_key),
+                files=files,
+            )
+            resp_json = resp.json()
+            key_pool.update(api_key, resp.status_code, resp_json.get("header", {}))
+            attempts -= 1
+            if resp.status_code != 429 or not attempts:
+                return resp, resp_json
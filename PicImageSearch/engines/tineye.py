@@ -1,10 +1,10 @@
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any
 
 from typing_extensions import override
 
 from ..model import TineyeResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..types import DomainInfo
 from ..utils import deep_get, read_file
 from .base import BaseSearchEngine
@@ -21,6 +21,8 @@ class Tineye(BaseSearchEngine[TineyeResponse]):
         base_url (str): The base URL for Tineye searches. Defaults to "https://tineye.com".
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(self, base_url: str = "https://tineye.com", **request_kwargs: Any):
         """Initializes a Tineye API client.
 
@@ -41,7 +43,7 @@ class Tineye(BaseSearchEngine[TineyeResponse]):
             match count and optional tag.
         """
         resp = await self._send_request(method="get", endpoint=f"api/v1/search/get_domains/{query_hash}")
-        resp_json = json_loads(resp.text)
+        resp_json = resp.json()
 
         return [DomainInfo.from_raw_data(domain_data) for domain_data in resp_json.get("domains", [])]
 
@@ -68,14 +70,15 @@ class Tineye(BaseSearchEngine[TineyeResponse]):
             f"page={resp.page_number}", f"page={next_page_number}"
         )
         _resp = await self._send_request(method="get", url=api_url)
-        resp_json = json_loads(_resp.text)
+        resp_json = _resp.json()
         resp_json.update({"status_code": _resp.status_code})
 
-        return TineyeResponse(
+        return await self._make_response(
+            TineyeResponse,
             resp_json,
             _resp.url,
-            resp.domains,
-            next_page_number,
+            domains=resp.domains,
+            page_number=next_page_number,
         )
 
     async def pre_page(self, resp: TineyeResponse) -> TineyeResponse | None:
@@ -170,7 +173,7 @@ class Tineye(BaseSearchEngine[TineyeResponse]):
             data=params,
             files=files,
         )
-        resp_json = json_loads(resp.text)
+        resp_json = resp.json()
         resp_json["status_code"] = resp.status_code
         _url = resp.url
 
@@ -180,4 +183,4 @@ class Tineye(BaseSearchEngine[TineyeResponse]):
             _url = f"{self.base_url}/search/{query_hash}?{query_string}"
             domains = await self._get_domains(resp_json["query"]["hash"])
 
-        return TineyeResponse(resp_json, _url, domains)
+        return await self._make_response(TineyeResponse, resp_json, _url, domains=domains)
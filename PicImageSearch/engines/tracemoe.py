@@ -1,10 +1,10 @@
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any
 
 from typing_extensions import override
 
 from ..model import TraceMoeMe, TraceMoeResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -21,6 +21,8 @@ class TraceMoe(BaseSearchEngine[TraceMoeResponse]):
         mute (bool): A flag to mute preview video in search results.
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         base_url: str = "https://trace.moe",
@@ -62,7 +64,7 @@ class TraceMoe(BaseSearchEngine[TraceMoeResponse]):
         """
         params = {"key": key} if key else None
         resp = await self._send_request(method="get", url=self.me_url, params=params)
-        return TraceMoeMe(json_loads(resp.text))
+        return TraceMoeMe(resp.json())
 
     @override
     async def search(
@@ -130,9 +132,10 @@ class TraceMoe(BaseSearchEngine[TraceMoeResponse]):
             files=files,
         )
 
-        result = TraceMoeResponse(
-            resp_data=json_loads(resp.text),
-            resp_url=resp.url,
+        result = await self._make_response(
+            TraceMoeResponse,
+            resp.json(),
+            resp.url,
             mute=self.mute,
             size=self.size,
         )
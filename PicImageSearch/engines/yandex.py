@@ -4,6 +4,7 @@ from typing import Any
 from typing_extensions import override
 
 from ..model import YandexResponse
+from ..network import LOOKUP_RETRY_POLICY, RetryPolicy
 from ..utils import read_file
 from .base import BaseSearchEngine
 
@@ -22,6 +23,8 @@ class Yandex(BaseSearchEngine[YandexResponse]):
         - Search results may vary based on the user's location and Yandex's algorithms.
     """
 
+    default_retry_policy: RetryPolicy = LOOKUP_RETRY_POLICY
+
     def __init__(
         self,
         base_url: str = "https://yandex.com",
@@ -83,4 +86,4 @@ class Yandex(BaseSearchEngine[YandexResponse]):
         else:
             raise ValueError("Either 'url' or 'file' must be provided")
 
-        return YandexResponse(resp.text, resp.url)
+        return await self._make_response(YandexResponse, resp.text, resp.url)
@@ -0,0 +1,9 @@
+"""Instrumentation callbacks for search engines.
+
+`EngineHooks` is defined next to `BaseSearchEngine`, which calls it, so that neither module
+has to import the other; this module is its public home.
+"""
+
+from .engines.base import EngineHooks
+
+__all__ = ["EngineHooks"]
@@ -0,0 +1,222 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from typing_extensions import Self
+
+from .engines.base import BaseSearchEngine
+from .model.base import BaseSearchResponse
+from .utils import read_file
+
+
+@dataclass
+class MetaSearchResult:
+    """The outcome of one engine's search within a metasearch.
+
+    Attributes:
+        engine (BaseSearchEngine): The engine that ran the search.
+        response (Optional[BaseSearchResponse]): The search response, or None if the search failed.
+        error (Optional[BaseException]): The exception raised by the search (including
+            `asyncio.TimeoutError` on timeout), or None if it succeeded.
+        elapsed (float): Wall-clock seconds the search took.
+    """
+
+    engine: BaseSearchEngine[Any]
+    response: BaseSearchResponse[Any] | None
+    error: BaseException | None
+    elapsed: float
+
+    @property
+    def engine_name(self) -> str:
+        """The engine's class name, e.g. "SauceNAO"."""
+        return type(self.engine).__name__
+
+    @property
+    def ok(self) -> bool:
+        """Whether the search succeeded."""
+        return self.error is None
+
+
+StopPolicy = Callable[[MetaSearchResult], bool]
+"""A predicate deciding whether a result settles the search, cancelling the remaining engines."""
+
+
+def similarity_at_least(
+    threshold: float,
+    engines: Iterable[type[BaseSearchEngine[Any]]] | None = None,
+) -> StopPolicy:
+    """Builds a stop policy that fires on a confident match.
+
+    Args:
+        threshold (float): Minimum item `similarity` (0-100) that counts as a confident match.
+        engines (Optional[Iterable[type[BaseSearchEngine]]]): Engine classes whose results may stop the
+            search, e.g. `(SauceNAO, Iqdb)`. None accepts results from any engine.
+
+    Returns:
+        StopPolicy: A predicate returning True when any item of a successful result from one of
+            the given engines has a similarity of at least `threshold`.
+    """
+    engine_types = tuple(engines) if engines is not None else None
+
+    def policy(result: MetaSearchResult) -> bool:
+        if result.response is None:
+            return False
+        if engine_types is not None and not isinstance(result.engine, engine_types):
+            return False
+        return any(getattr(item, "similarity", 0.0) >= threshold for item in result.response.raw)
+
+    return policy
+
+
+class MetaSearch:
+    """Searches one image on several engines concurrently.
+
+    The image file is read once and the same bytes are handed to every engine. Results
+    are available as each engine finishes, so fast JSON APIs can be used before slow
+    HTML scrapers complete.
+
+    An optional stop policy ends the search early: once a result satisfies it, the
+    searches still in flight are cancelled, saving their quota and tail latency.
+
+    Attributes:
+        engines (list[BaseSearchEngine]): The engines to search with.
+        timeout (Optional[float]): Default per-engine timeout in seconds, None for no timeout.
+        timeouts (dict[BaseSearchEngine, float]): Per-engine timeouts overriding `timeout`.
+        stop_when (Optional[StopPolicy]): Default stop policy, see `similarity_at_least()`.
+    """
+
+    def __init__(
+        self,
+        engines: Iterable[BaseSearchEngine[Any]],
+        timeout: float | None = None,
+        timeouts: Mapping[BaseSearchEngine[Any], float] | None = None,
+        stop_when: StopPolicy | None = None,
+    ):
+        """Initializes a metasearch over the given engines.
+
+        Args:
+            engines (Iterable[BaseSearchEngine]): Engine instances to search with.
+            timeout (Optional[float]): Default per-engine timeout in seconds.
+            timeouts (Optional[Mapping[BaseSearchEngine, float]]): Per-engine timeouts, keyed by engine instance.
+            stop_when (Optional[StopPolicy]): Default stop policy for every search.
+        """
+        self.engines: list[BaseSearchEngine[Any]] = list(engines)
+        self.timeout: float | None = timeout
+        self.timeouts: dict[BaseSearchEngine[Any], float] = dict(timeouts or {})
+        self.stop_when: StopPolicy | None = stop_when
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry.
+
+        Returns:
+            Self: The metasearch instance.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """Async context manager exit, closes the pooled clients of all engines."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the pooled clients of all engines."""
+        await asyncio.gather(*(engine.close() for engine in self.engines))
+
+    async def _run(
+        self,
+        engine: BaseSearchEngine[Any],
+        url: str | None,
+        file: bytes | None,
+        kwargs: dict[str, Any],
+    ) -> MetaSearchResult:
+        """Runs one engine's search, capturing its response or error."""
+        start = time.perf_counter()
+        timeout = self.timeouts.get(engine, self.timeout)
+        try:
+            response = await asyncio.wait_for(engine.search(url=url, file=file, **kwargs), timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return MetaSearchResult(engine, None, e, time.perf_counter() - start)
+        return MetaSearchResult(engine, response, None, time.perf_counter() - start)
+
+    async def as_completed(
+        self,
+        url: str | None = None,
+        file: str | bytes | Path | None = None,
+        stop_when: StopPolicy | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[MetaSearchResult]:
+        """Runs all searches concurrently and yields results in completion order.
+
+        Args:
+            url (Optional[str]): URL of the image to search.
+            file (Union[str, bytes, Path, None]): Local image file, can be a path string, bytes data, or Path object.
+            stop_when (Optional[StopPolicy]): Overrides the instance's stop policy. Once a yielded result
+                satisfies it, the remaining searches are cancelled and iteration ends.
+            **kwargs (Any): Additional search arguments passed to every engine.
+
+        Yields:
+            MetaSearchResult: One result per engine, fastest first. Failed and timed-out
+                searches are yielded with `error` set instead of raising.
+
+        Raises:
+            ValueError: If neither `url` nor `file` is provided.
+
+        Note:
+            Searches still running when iteration stops early are cancelled and awaited, so their
+            clients are left in a clean state. Wrap the iterator in `contextlib.aclosing()` when
+            breaking out of the loop yourself to cancel them immediately.
+        """
+        if not url and not file:
+            raise ValueError("Either 'url' or 'file' must be provided")
+
+        stop_when = stop_when or self.stop_when
+        image = read_file(file) if file else None
+        pending = {asyncio.create_task(self._run(engine, url, image, kwargs)) for engine in self.engines}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                stop = False
+                for task in done:
+                    result = task.result()
+                    yield result
+                    stop = stop or (stop_when is not None and stop_when(result))
+                if stop:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def search(
+        self,
+        url: str | None = None,
+        file: str | bytes | Path | None = None,
+        stop_when: StopPolicy | None = None,
+        **kwargs: Any,
+    ) -> list[MetaSearchResult]:
+        """Runs all searches concurrently and returns every result.
+
+        Args:
+            url (Optional[str]): URL of the image to search.
+            file (Union[str, bytes, Path, None]): Local image file, can be a path string, bytes data, or Path object.
+            stop_when (Optional[StopPolicy]): Overrides the instance's stop policy.
+            **kwargs (Any): Additional search arguments passed to every engine.
+
+        Returns:
+            list[MetaSearchResult]: One result per finished engine, in the order the engines were given.
+                Engines cancelled by the stop policy are left out.
+        """
+        results = [result async for result in self.as_completed(url, file, stop_when, **kwargs)]
+        order = {id(engine): index for index, engine in enumerate(self.engines)}
+        return sorted(results, key=lambda result: order[id(result.engine)])
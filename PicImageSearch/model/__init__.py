@@ -1,23 +1,65 @@
-from .anime_trace import AnimeTraceItem, AnimeTraceResponse
-from .ascii2d import Ascii2DItem, Ascii2DResponse
-from .baidu import BaiDuItem, BaiDuResponse
-from .bing import BingItem, BingResponse
-from .copyseeker import CopyseekerItem, CopyseekerResponse
-from .ehentai import EHentaiItem, EHentaiResponse
-from .google import GoogleItem, GoogleResponse
-from .google_lens import (
-    GoogleLensExactMatchesItem,
-    GoogleLensExactMatchesResponse,
-    GoogleLensItem,
-    GoogleLensRelatedSearchItem,
-    GoogleLensResponse,
-)
-from .iqdb import IqdbItem, IqdbResponse
-from .lenso import LensoResponse, LensoResultItem, LensoURLItem
-from .saucenao import SauceNAOItem, SauceNAOResponse
-from .tineye import TineyeItem, TineyeResponse
-from .tracemoe import TraceMoeItem, TraceMoeMe, TraceMoeResponse
-from .yandex import YandexItem, YandexResponse
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .anime_trace import AnimeTraceItem, AnimeTraceResponse
+    from .ascii2d import Ascii2DItem, Ascii2DResponse
+    from .baidu import BaiDuItem, BaiDuResponse
+    from .bing import BingItem, BingResponse
+    from .copyseeker import CopyseekerItem, CopyseekerResponse
+    from .ehentai import EHentaiItem, EHentaiResponse
+    from .google import GoogleItem, GoogleResponse
+    from .google_lens import (
+        GoogleLensExactMatchesItem,
+        GoogleLensExactMatchesResponse,
+        GoogleLensItem,
+        GoogleLensRelatedSearchItem,
+        GoogleLensResponse,
+    )
+    from .iqdb import IqdbItem, IqdbResponse
+    from .lenso import LensoResponse, LensoResultItem, LensoURLItem
+    from .saucenao import SauceNAOItem, SauceNAOResponse
+    from .tineye import TineyeItem, TineyeResponse
+    from .tracemoe import TraceMoeItem, TraceMoeMe, TraceMoeResponse
+    from .yandex import YandexItem, YandexResponse
+
+# Submodules are imported on first attribute access (PEP 562), so using one engine
+# does not pay for importing every other engine and model.
+_LAZY_ATTRS: dict[str, str] = {
+    "AnimeTraceItem": ".anime_trace",
+    "AnimeTraceResponse": ".anime_trace",
+    "Ascii2DItem": ".ascii2d",
+    "Ascii2DResponse": ".ascii2d",
+    "BaiDuItem": ".baidu",
+    "BaiDuResponse": ".baidu",
+    "BingItem": ".bing",
+    "BingResponse": ".bing",
+    "CopyseekerItem": ".copyseeker",
+    "CopyseekerResponse": ".copyseeker",
+    "EHentaiItem": ".ehentai",
+    "EHentaiResponse": ".ehentai",
+    "GoogleItem": ".google",
+    "GoogleResponse": ".google",
+    "GoogleLensExactMatchesItem": ".google_lens",
+    "GoogleLensExactMatchesResponse": ".google_lens",
+    "GoogleLensItem": ".google_lens",
+    "GoogleLensRelatedSearchItem": ".google_lens",
+    "GoogleLensResponse": ".google_lens",
+    "IqdbItem": ".iqdb",
+    "IqdbResponse": ".iqdb",
+    "LensoResponse": ".lenso",
+    "LensoResultItem": ".lenso",
+    "LensoURLItem": ".lenso",
+    "SauceNAOItem": ".saucenao",
+    "SauceNAOResponse": ".saucenao",
+    "TineyeItem": ".tineye",
+    "TineyeResponse": ".tineye",
+    "TraceMoeItem": ".tracemoe",
+    "TraceMoeMe": ".tracemoe",
+    "TraceMoeResponse": ".tracemoe",
+    "YandexItem": ".yandex",
+    "YandexResponse": ".yandex",
+}
 
 __all__ = [
     "AnimeTraceItem",
@@ -54,3 +96,26 @@ __all__ = [
     "YandexItem",
     "YandexResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY_ATTRS.get(name)) is None:
+        return _import_submodule(name)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name: str) -> Any:
+    # Submodules stay reachable as attributes (e.g. `PicImageSearch.network`), as when they were imported eagerly
+    if not name.startswith("__"):
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
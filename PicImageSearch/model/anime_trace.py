@@ -32,6 +32,8 @@ class AnimeTraceItem(BaseSearchItem):
         characters (list[Character]): List of possible character matches with their source works.
     """
 
+    __slots__ = ("box", "box_id", "characters")
+
     def __init__(self, data: dict[str, Any], **kwargs: Any):
         """Initializes an AnimeTraceItem with data from a search result.
 
@@ -99,4 +101,4 @@ class AnimeTraceResponse(BaseSearchResponse[AnimeTraceItem]):
 
         # Process results
         results = resp_data["data"]
-        self.raw: list[AnimeTraceItem] = [AnimeTraceItem(item) for item in results]
+        self.raw: list[AnimeTraceItem] = self._build_items(results, AnimeTraceItem)
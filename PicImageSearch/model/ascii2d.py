@@ -1,10 +1,28 @@
+from copy import deepcopy
 from typing import Any, NamedTuple
 
+from lxml.etree import _Element
 from pyquery import PyQuery
 from typing_extensions import override
 
 from ..utils import parse_html
-from .base import BaseSearchItem, BaseSearchResponse
+from .base import BaseSearchItem, BaseSearchResponse, LazyField, lazy_field
+from .selectors import (
+    ASCII2D_BACKUP_LINK,
+    ASCII2D_DETAIL_BOX,
+    ASCII2D_EXTERNAL,
+    ASCII2D_H6,
+    ASCII2D_HASH,
+    ASCII2D_IMG,
+    ASCII2D_ITEM,
+    ASCII2D_LINK,
+    ASCII2D_SMALL,
+    attr,
+    parents,
+    remove,
+    text,
+    wrap,
+)
 
 BASE_URL = "https://ascii2d.net"
 SUPPORTED_SOURCES = [
@@ -48,8 +66,33 @@ class Ascii2DItem(BaseSearchItem):
         title (str): Title of the image or related content.
         author (str): Name of the image author/creator.
         author_url (str): URL to the author's profile page.
+
+    Note:
+        `url`, `url_list`, `title`, `author` and `author_url` are arranged from the detail box while
+        parsing, or on first access when the item is built lazily.
     """
 
+    __slots__ = ("_author", "_author_url", "_title", "_url", "_url_list", "detail", "hash")
+
+    def _load_links(self) -> None:
+        """Arranges the links, title and author of the result.
+
+        Works on a copy of the result element, since arranging removes elements from it and the
+        item may be read after it.
+        """
+        self._arrange(deepcopy(self.origin[0]))
+
+    url: str = lazy_field(_load_links)
+    url_list: LazyField[list[URL]] = LazyField(_load_links)
+    title: str = lazy_field(_load_links)
+    author: LazyField[str] = LazyField(_load_links)
+    author_url: LazyField[str] = LazyField(_load_links)
+
+    @override
+    def _load_fields(self) -> None:
+        """Arranges the links in place while parsing, as nothing else reads the element afterwards."""
+        self._arrange(self.origin[0])
+
     def __init__(self, data: PyQuery, **kwargs: Any) -> None:
         """Initializes an Ascii2DItem with data from a search result.
 
@@ -69,88 +112,89 @@ class Ascii2DItem(BaseSearchItem):
             data (PyQuery): PyQuery object containing the search result HTML.
             **kwargs (Any): Additional keyword arguments (unused).
         """
-        self.hash: str = data("div.hash").eq(0).text()
-        self.detail: str = data("small").eq(0).text()
-        image_source = data("img").eq(0).attr("src")
+        element = data[0]
+        self.hash: str = text(ASCII2D_HASH.select(element)[:1])
+        self.detail: str = text(ASCII2D_SMALL.select(element)[:1])
+        image_source = attr(ASCII2D_IMG.select(element), "src", "")
         self.thumbnail: str = f"{BASE_URL}{image_source}" if image_source.startswith("/") else image_source
-        self.url_list: list[URL] = []
-        self.author: str = ""
-        self.author_url: str = ""
-        self._arrange(data)
 
-    def _arrange(self, data: PyQuery) -> None:
+    def _arrange(self, element: _Element) -> None:
         """Organizes and processes the search result data.
 
         Coordinates the extraction of URLs, title, author information, and other metadata.
         Handles the normalization of URLs and sets backup links if necessary.
 
         Args:
-            data (PyQuery): PyQuery object containing the detail box information.
+            element (_Element): The search result element.
         """
-        if infos := data.find("div.detail-box.gray-link"):
-            links = infos.find("a")
-            self.url_list = [URL(i.attr("href"), i.text()) for i in links.items()] if links else []
+        self.url = ""
+        self.url_list = []
+        self.title = ""
+        self.author = ""
+        self.author_url = ""
+        if infos := ASCII2D_DETAIL_BOX.find(element):
+            links = ASCII2D_LINK.find_all(infos)
+            self.url_list = [URL(link.get("href"), text([link])) for link in links]
             mark = next(
-                (small.text() for small in infos("small").items() if small.text() in SUPPORTED_SOURCES),
+                (source for small in ASCII2D_SMALL.select_all(infos) if (source := text([small])) in SUPPORTED_SOURCES),
                 "",
             )
             self._arrange_links(infos, links, mark)
             self._arrange_title(infos)
         self._normalize_url_list()
         if not self.url_list:
-            self._arrange_backup_links(data)
+            self._arrange_backup_links(element)
 
-    def _arrange_links(self, infos: PyQuery, links: PyQuery, mark: str) -> None:
+    def _arrange_links(self, infos: list[_Element], links: list[_Element], mark: str) -> None:
         """Processes and organizes the URLs found in the search result.
 
         Extracts primary URL, author URL, title, and author name based on the source type.
         Handles different link patterns based on the source platform.
 
         Args:
-            infos (PyQuery): PyQuery object containing the detail box information.
-            links (PyQuery): PyQuery object containing all URL links.
+            infos (list[_Element]): The detail box elements.
+            links (list[_Element]): All link elements of the detail boxes.
             mark (str): Source identifier string (e.g., "pixiv", "twitter").
         """
         if links:
-            link_items = list(links.items())
-            if len(link_items) > 1 and mark in SUPPORTED_SOURCES:
-                self.title: str = link_items[0].text()
-                self.url: str = link_items[0].attr("href")
-                self.author_url = link_items[1].attr("href")
-                self.author = link_items[1].text()
-            elif links.eq(0).parents("small"):
-                infos.remove("small")
-                self.title = infos.text()
-
-    def _arrange_title(self, infos: PyQuery) -> None:
+            if len(links) > 1 and mark in SUPPORTED_SOURCES:
+                self.title = text(links[:1])
+                self.url = links[0].get("href")
+                self.author_url = links[1].get("href")
+                self.author = text(links[1:2])
+            elif any(ASCII2D_SMALL.matches(parent) for parent in parents(links[0])):
+                remove(ASCII2D_SMALL.select_all(infos))
+                self.title = text(infos)
+
+    def _arrange_title(self, infos: list[_Element]) -> None:
         """Extracts and processes the title from the search result.
 
         Handles various title formats and removes unwanted text patterns.
         Falls back to external text or h6 content if primary title is not found.
 
         Args:
-            infos (PyQuery): PyQuery object containing the title information.
+            infos (list[_Element]): The detail box elements.
         """
         if not self.title:
-            self.title = self._extract_external_text(infos) or infos.find("h6").text()
+            self.title = self._extract_external_text(infos) or text(ASCII2D_H6.find_all(infos))
         if self.title and any(i in self.title for i in {"詳細掲示板のログ", "2ちゃんねるのログ"}):
             self.title = ""
 
     @staticmethod
-    def _extract_external_text(infos: PyQuery) -> str:
+    def _extract_external_text(infos: list[_Element]) -> str:
         """Extracts text from external elements in the search result.
 
         Removes link elements and combines remaining text content.
 
         Args:
-            infos (PyQuery): PyQuery object containing external text elements.
+            infos (list[_Element]): The detail box elements.
 
         Returns:
             str: Combined text from external elements, or empty string if none found.
         """
-        external = infos.find(".external")
-        external.remove("a")
-        return "\n".join(i.text() for i in external.items() if i.text()) or ""
+        external = ASCII2D_EXTERNAL.find_all(infos)
+        remove(ASCII2D_LINK.select_all(external))
+        return "\n".join(content for i in external if (content := text([i]))) or ""
 
     def _normalize_url_list(self) -> None:
         """Normalizes all URLs in the url_list to absolute paths.
@@ -162,17 +206,17 @@ class Ascii2DItem(BaseSearchItem):
             URL(BASE_URL + url.href, url.text) if url.href.startswith("/") else url for url in self.url_list
         ]
 
-    def _arrange_backup_links(self, data: PyQuery) -> None:
+    def _arrange_backup_links(self, element: _Element) -> None:
         """Sets backup URLs when primary URL list is empty.
 
         Extracts URLs from alternative locations in the HTML structure.
 
         Args:
-            data (PyQuery): PyQuery object to search for backup links.
+            element (_Element): The search result element to search for backup links.
         """
-        if links := data.find("div.pull-xs-right > a"):
-            self.url = links.eq(0).attr("href")
-            self.url_list = [URL(self.url, links.eq(0).text())]
+        if links := ASCII2D_BACKUP_LINK.find(element):
+            self.url = links[0].get("href")
+            self.url_list = [URL(self.url, text(links[:1]))]
 
 
 class Ascii2DResponse(BaseSearchResponse[Ascii2DItem]):
@@ -207,4 +251,4 @@ class Ascii2DResponse(BaseSearchResponse[Ascii2DItem]):
         """
         data = parse_html(resp_data)
         self.origin: PyQuery = data
-        self.raw: list[Ascii2DItem] = [Ascii2DItem(i) for i in data.find("div.row.item-box").items()]
+        self.raw: list[Ascii2DItem] = self._build_items(wrap(ASCII2D_ITEM.find(data[0]), data), Ascii2DItem)
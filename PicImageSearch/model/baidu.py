@@ -2,9 +2,12 @@ from typing import Any
 
 from typing_extensions import override
 
-from ..utils import deep_get
+from ..utils import compile_path
 from .base import BaseSearchItem, BaseSearchResponse
 
+_FIRST_TITLE = compile_path("title[0]")
+_DATA_LIST = compile_path("data.list")
+
 
 class BaiDuItem(BaseSearchItem):
     """Represents a single BaiDu search result item.
@@ -17,6 +20,8 @@ class BaiDuItem(BaseSearchItem):
         url (str): URL of the webpage containing the original image.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: dict[str, Any], **kwargs: Any) -> None:
         """Initialize a BaiDu search result item.
 
@@ -41,7 +46,7 @@ class BaiDuItem(BaseSearchItem):
         """
         # deprecated attributes
         # self.similarity: float = round(float(data["simi"]) * 100, 2)
-        self.title: str = deep_get(data, "title[0]") or ""
+        self.title: str = _FIRST_TITLE(data) or ""
         self.thumbnail: str = data.get("image_src") or data.get("thumbUrl") or ""
         self.url: str = data.get("url") or data.get("fromUrl") or ""
 
@@ -89,5 +94,5 @@ class BaiDuResponse(BaseSearchResponse[BaiDuItem]):
                 self.exact_matches.extend(BaiDuItem(i) for i in same_data["list"] if "url" in i and "image_src" in i)
 
         # Parse similar image results
-        if data_list := deep_get(resp_data, "data.list"):
-            self.raw.extend([BaiDuItem(i) for i in data_list])
+        if data_list := _DATA_LIST(resp_data):
+            self.raw = self._build_items(data_list, BaiDuItem)
@@ -1,7 +1,198 @@
+import functools
+import operator
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, ClassVar, Generic, SupportsIndex, TypeVar, overload
+
+from typing_extensions import override
 
 T = TypeVar("T")
+V = TypeVar("V")
+ItemT = TypeVar("ItemT")
+
+_UNPARSED: Any = object()
+
+
+class LazyItems(list[T]):
+    """A list of result items, each parsed on first access.
+
+    Holds the raw entries (JSON objects or HTML elements) of a result page and builds the
+    item for an entry the first time it is indexed or iterated over, then keeps it. Asking
+    for `len()` or `raw[0]` therefore only parses what is needed. The raw entry is released
+    once its item is built.
+
+    Being a `list`, it can be used wherever the eager list is. Its methods other than reading
+    items one by one (comparing, copying, modifying, ...) parse every remaining item first, but
+    code reading the list's storage directly (`[...] + items`, `heapq`) needs `list(items)`.
+    """
+
+    __slots__ = ("_entries", "_factory")
+
+    __hash__: ClassVar[None] = None
+
+    def __init__(self, entries: Iterable[Any], factory: Callable[[Any], T]):
+        """Initializes the list.
+
+        Args:
+            entries (Iterable[Any]): The raw entries, one per item.
+            factory (Callable[[Any], T]): Builds the item of an entry.
+        """
+        self._entries: list[Any] = list(entries)
+        self._factory: Callable[[Any], T] = factory
+        super().__init__([_UNPARSED] * len(self._entries))
+
+    def _item(self, index: int) -> T:
+        item = list.__getitem__(self, index)
+        if item is _UNPARSED:
+            item = self._factory(self._entries[index])
+            list.__setitem__(self, index, item)
+            self._entries[index] = None
+        return item
+
+    def _parse_all(self) -> None:
+        for index in range(len(self)):
+            self._item(index)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    @override
+    def __getitem__(self, index: SupportsIndex | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+        return self._item(operator.index(index))
+
+    @override
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self)):
+            yield self._item(index)
+
+    @override
+    def __reversed__(self) -> Iterator[T]:
+        for index in reversed(range(len(self))):
+            yield self._item(index)
+
+    @override
+    def __contains__(self, value: object) -> bool:
+        return any(item is value or item == value for item in self)
+
+    @override
+    def __repr__(self) -> str:
+        parsed = sum(item is not _UNPARSED for item in list.__iter__(self))
+        return f"<LazyItems: {parsed}/{len(self)} parsed>"
+
+    def drop_origin(self) -> None:
+        """Drops the raw data of the items parsed so far and of every item parsed from now on."""
+        factory = self._factory
+
+        def build(entry: Any) -> T:
+            item = factory(entry)
+            _drop_origin(item)
+            return item
+
+        self._factory = build
+        for item in list.__iter__(self):
+            if item is not _UNPARSED:
+                _drop_origin(item)
+
+
+def _parsing_all_first(name: str) -> Callable[..., Any]:
+    """Wraps a `list` method of `LazyItems` to parse every item (of both lists, if any) before running it."""
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self: LazyItems[Any], *args: Any, **kwargs: Any) -> Any:
+        for items in (self, *args):
+            if isinstance(items, LazyItems):
+                items._parse_all()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in (
+    "__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__add__", "__mul__", "__rmul__",
+    "__iadd__", "__imul__", "__setitem__", "__delitem__",
+    "append", "clear", "copy", "count", "extend", "index", "insert", "pop", "remove", "reverse", "sort",
+):  # fmt: skip
+    setattr(LazyItems, _name, _parsing_all_first(_name))
+del _name
+
+
+class LazyField(Generic[V]):
+    """An item attribute computed on first access.
+
+    The loader is an item method that sets the attribute (and possibly other lazy
+    attributes computed along with it). Assigning the attribute stores the value as is.
+
+    Attributes already declared by a base class are made lazy with `lazy_field` instead,
+    which keeps their annotation.
+
+    Example:
+        >>> class Item(BaseSearchItem):
+        ...     def _resolve_links(self) -> None:
+        ...         self.url, self.links = expensive_lookup(self.origin)
+        ...
+        ...     url: str = lazy_field(_resolve_links)
+        ...     links: LazyField[list[str]] = LazyField(_resolve_links)
+    """
+
+    def __init__(self, loader: Callable[[Any], None]):
+        """Initializes the field.
+
+        Args:
+            loader (Callable[[BaseSearchItem], None]): Sets the attribute on the item.
+        """
+        self.loader: Callable[[Any], None] = loader
+        self.name: str = ""
+        self.attr: str = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.attr = f"_{name}"
+
+    @overload
+    def __get__(self, obj: None, objtype: type | None = None) -> "LazyField[V]": ...
+
+    @overload
+    def __get__(self, obj: object, objtype: type | None = None) -> V: ...
+
+    def __get__(self, obj: object | None, objtype: type | None = None) -> "V | LazyField[V]":
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.attr)
+        except AttributeError:
+            self.loader(obj)
+            return getattr(obj, self.attr)
+
+    def __set__(self, obj: object, value: V) -> None:
+        setattr(obj, self.attr, value)
+
+    def reset(self, obj: object) -> None:
+        """Forgets the value, so the next access runs the loader."""
+        try:
+            delattr(obj, self.attr)
+        except AttributeError:
+            pass
+
+
+def lazy_field(loader: Callable[[Any], None]) -> Any:
+    """Makes an attribute declared by a base class (e.g. `url: str`) a `LazyField`.
+
+    Like `dataclasses.field`, this is typed as returning the attribute's own type, so the
+    redeclaration keeps the base class annotation.
+
+    Args:
+        loader (Callable[[BaseSearchItem], None]): Sets the attribute on the item.
+
+    Returns:
+        Any: The `LazyField` descriptor.
+    """
+    return LazyField(loader)
 
 
 class BaseSearchItem(ABC):
@@ -10,6 +201,12 @@ class BaseSearchItem(ABC):
     This class serves as a template for individual search results from various search engines.
     Each search engine should implement its own subclass with specific parsing logic.
 
+    Fields that are expensive to compute can be declared as `LazyField`s. Their loaders run
+    during parsing, or on first access for items built with `lazy=True`.
+
+    Items use `__slots__` to keep their footprint small; subclasses declare the attributes
+    they add in their own `__slots__` (and `_<name>` for their `LazyField`s).
+
     Attributes:
         origin (Any): The raw data from the search engine.
         url (str): The URL of the found image or page.
@@ -18,11 +215,29 @@ class BaseSearchItem(ABC):
         similarity (float): A float value indicating the similarity score (0.0 to 100.0).
     """
 
-    def __init__(self, data: Any, **kwargs: Any):
+    __slots__ = ("origin", "similarity", "thumbnail", "title", "url")
+
+    _lazy_fields: ClassVar[tuple[LazyField[Any], ...]] = ()
+    _lazy_loaders: ClassVar[tuple[Callable[[Any], None], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: dict[str, LazyField[Any]] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, LazyField):
+                    fields[name] = value
+                elif name in fields:
+                    del fields[name]
+        cls._lazy_fields = tuple(fields.values())
+        cls._lazy_loaders = tuple(dict.fromkeys(field.loader for field in cls._lazy_fields))
+
+    def __init__(self, data: Any, *, lazy: bool = False, **kwargs: Any):
         """Initialize a search result item.
 
         Args:
             data (Any): Raw data from the search engine response.
+            lazy (bool): Compute the `LazyField`s on first access rather than while parsing.
             **kwargs (Any): Additional keyword arguments for specific search engines.
         """
         self.origin: Any = data
@@ -30,7 +245,12 @@ class BaseSearchItem(ABC):
         self.thumbnail: str = ""
         self.title: str = ""
         self.similarity: float = 0.0
+        if lazy:
+            for field in self._lazy_fields:
+                field.reset(self)
         self._parse_data(data, **kwargs)
+        if not lazy and self._lazy_loaders:
+            self._load_fields()
 
     @abstractmethod
     def _parse_data(self, data: Any, **kwargs: Any) -> None:
@@ -45,6 +265,44 @@ class BaseSearchItem(ABC):
         """
         pass
 
+    def _load_fields(self) -> None:
+        """Computes the `LazyField`s of an item that is not built lazily, right after parsing.
+
+        Subclasses can override it when the fields are cheaper to compute during parsing than
+        on demand.
+        """
+        for loader in self._lazy_loaders:
+            loader(self)
+
+    def drop_origin(self) -> None:
+        """Drops the raw data the item was parsed from, along with that of nested items.
+
+        Lazy fields are computed first, since they are read from the raw data.
+        """
+        for field in self._lazy_fields:
+            field.__get__(self)
+        self.origin = None
+        for value in _attribute_values(self):
+            _drop_origin(value)
+
+
+def _attribute_values(obj: object) -> Iterator[Any]:
+    """Yields the values of an object's attributes, stored in slots or in its `__dict__`."""
+    for klass in type(obj).__mro__:
+        for name in vars(klass).get("__slots__", ()):
+            if name != "origin" and (value := getattr(obj, name, None)) is not None:
+                yield value
+    yield from getattr(obj, "__dict__", {}).values()
+
+
+def _drop_origin(value: Any) -> None:
+    """Drops the raw data of an item, or of the items in a list (`LazyItems` included)."""
+    if isinstance(value, (BaseSearchItem, LazyItems)):
+        value.drop_origin()
+    elif isinstance(value, list):
+        for element in value:
+            _drop_origin(element)
+
 
 class BaseSearchResponse(ABC, Generic[T]):
     """Base class for search response handling.
@@ -52,24 +310,68 @@ class BaseSearchResponse(ABC, Generic[T]):
     This class serves as a template for processing and storing search results
     from various search engines.
 
+    In lazy mode, models that build their items through `_build_items` return a `LazyItems`
+    list, which parses each item on first access, and the items compute their `LazyField`s on
+    first access too. Otherwise everything is parsed up front into plain lists.
+
+    Without `keep_origin`, the raw response data and the raw data of every item are dropped
+    once parsed (see `drop_origin`), so results held in memory only keep their parsed fields.
+
     Attributes:
         origin (Any): The original response data from the search engine.
         url (str): The URL of the search request.
-        raw (list[BaseSearchItem]): A list of BaseSearchItem objects representing individual search results.
+        raw (list[BaseSearchItem]): BaseSearchItem objects representing individual search results.
     """
 
-    def __init__(self, resp_data: Any, resp_url: str, **kwargs: Any):
+    _classes: ClassVar[dict[str, type["BaseSearchResponse[Any]"]]] = {}
+    """Every response model class, by `module.qualname`, for rebuilding cached responses by name."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        BaseSearchResponse._classes[f"{cls.__module__}.{cls.__qualname__}"] = cls
+
+    def __init__(self, resp_data: Any, resp_url: str, lazy: bool = False, keep_origin: bool = True, **kwargs: Any):
         """Initialize a search response.
 
         Args:
             resp_data (Any): Raw response data from the search engine.
             resp_url (str): The URL of the search request.
+            lazy (bool): Parse result items on first access rather than all at once.
+            keep_origin (bool): Keep the raw data of the response and its items after parsing.
             **kwargs (Any): Additional keyword arguments for specific search engines.
         """
         self.origin: Any = resp_data
         self.url: str = resp_url
         self.raw: list[T] = []
+        self._lazy: bool = lazy
         self._parse_response(resp_data, resp_url=resp_url, **kwargs)
+        if not keep_origin:
+            self.drop_origin()
+
+    def drop_origin(self) -> None:
+        """Drops the raw response data and that of every result item.
+
+        Lazily parsed items drop theirs as they are built. Until then, their raw entries are
+        kept, and HTML entries keep the whole document alive.
+        """
+        self.origin = None
+        for value in vars(self).values():
+            _drop_origin(value)
+
+    def _build_items(self, entries: Iterable[Any], factory: Callable[..., ItemT]) -> list[ItemT]:
+        """Builds result items from their raw entries, deferring the parsing in lazy mode.
+
+        Args:
+            entries (Iterable[Any]): The raw entries, one per item.
+            factory (Callable[..., ItemT]): Builds the item of an entry, usually the item class. In lazy
+                mode it is also passed `lazy=True`, which it forwards to `BaseSearchItem`.
+
+        Returns:
+            list[ItemT]: A `LazyItems` list in lazy mode, otherwise a list of the parsed items.
+        """
+        if self._lazy:
+            return LazyItems(entries, functools.partial(factory, lazy=True))
+        return [factory(entry) for entry in entries]
 
     @abstractmethod
     def _parse_response(self, resp_data: Any, **kwargs: Any) -> None:
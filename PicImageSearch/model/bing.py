@@ -17,6 +17,8 @@ class BingItem(BaseSearchItem):
         image_url (str): Direct URL to the full-size image.
     """
 
+    __slots__ = ("image_url",)
+
     def __init__(self, data: dict[str, Any], **kwargs: Any):
         """Initializes a BingItem with data from a search result.
 
@@ -42,6 +44,8 @@ class RelatedSearchItem:
         thumbnail (str): URL of the thumbnail image associated with this suggestion.
     """
 
+    __slots__ = ("text", "thumbnail")
+
     def __init__(self, data: dict[str, Any]):
         self.text: str = data.get("text", "")
         self.thumbnail: str = data.get("thumbnail", {}).get("url", "")
@@ -57,6 +61,8 @@ class PagesIncludingItem:
         image_url (str): Direct URL to the image on this page.
     """
 
+    __slots__ = ("image_url", "name", "thumbnail", "url")
+
     def __init__(self, data: dict[str, Any]):
         self.name: str = data.get("name", "")
         self.thumbnail: str = data.get("thumbnailUrl", "")
@@ -74,6 +80,8 @@ class VisualSearchItem:
         image_url (str): Direct URL to the full-size similar image.
     """
 
+    __slots__ = ("image_url", "name", "thumbnail", "url")
+
     def __init__(self, data: dict[str, Any]):
         self.name: str = data.get("name", "")
         self.thumbnail: str = data.get("thumbnailUrl", "")
@@ -91,6 +99,8 @@ class Attraction:
         interest_types (list[str]): Categories or types of interest for this attraction.
     """
 
+    __slots__ = ("interest_types", "search_url", "title", "url")
+
     def __init__(self, data: dict[str, Any]):
         self.url: str = data.get("attractionUrl", "")
         self.title: str = data.get("title", "")
@@ -109,6 +119,8 @@ class TravelCard:
         image_source_url (str): Source URL of the image used in the card.
     """
 
+    __slots__ = ("card_type", "image_source_url", "image_url", "title", "url")
+
     def __init__(self, data: dict[str, Any]):
         self.card_type: str = data.get("cardType", "")
         self.title: str = data.get("title", "")
@@ -127,6 +139,8 @@ class TravelInfo:
         travel_cards (list[TravelCard]): Collection of related travel information cards.
     """
 
+    __slots__ = ("attractions", "destination_name", "travel_cards", "travel_guide_url")
+
     def __init__(self, data: dict[str, Any]):
         self.destination_name: str = data.get("destinationName", "")
         self.travel_guide_url: str = data.get("travelGuideUrl", "")
@@ -147,6 +161,8 @@ class EntityItem:
         short_description (str): Brief description or entity type.
     """
 
+    __slots__ = ("description", "name", "profiles", "short_description", "thumbnail")
+
     def __init__(self, data: dict[str, Any]):
         self.name: str = data.get("name", "")
         self.thumbnail: str = data.get("image", {}).get("thumbnailUrl", "")
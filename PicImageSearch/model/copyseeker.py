@@ -19,6 +19,8 @@ class CopyseekerItem(BaseSearchItem):
         website_rank (float): Numerical ranking score of the website (0.0 to 1.0).
     """
 
+    __slots__ = ("thumbnail_list", "website_rank")
+
     def __init__(self, data: dict[str, Any], **kwargs: Any):
         """Initializes a CopyseekerItem with data from a search result.
 
@@ -78,5 +80,5 @@ class CopyseekerResponse(BaseSearchResponse[CopyseekerItem]):
         self.entities: str | None = resp_data.get("entities")
         self.total: int = resp_data["totalLinksFound"]
         self.exif: dict[str, Any] = resp_data.get("exif", {})
-        self.raw: list[CopyseekerItem] = [CopyseekerItem(page) for page in resp_data.get("pages", [])]
+        self.raw: list[CopyseekerItem] = self._build_items(resp_data.get("pages", []), CopyseekerItem)
         self.similar_image_urls: list[str] = resp_data.get("visuallySimilarImages", [])
@@ -1,10 +1,29 @@
 from typing import Any
 
+from lxml.etree import _Element
 from pyquery import PyQuery
 from typing_extensions import override
 
 from ..utils import parse_html
 from .base import BaseSearchItem, BaseSearchResponse
+from .selectors import (
+    EHENTAI_A,
+    EHENTAI_CELL,
+    EHENTAI_DIV,
+    EHENTAI_GLINK,
+    EHENTAI_GRID_ITEM,
+    EHENTAI_POSTED,
+    EHENTAI_ROW,
+    EHENTAI_TABLE,
+    EHENTAI_TAG,
+    EHENTAI_THUMBNAILS,
+    EHENTAI_TYPES,
+    attr,
+    children,
+    parent,
+    text,
+    wrap,
+)
 
 
 class EHentaiItem(BaseSearchItem):
@@ -20,6 +39,8 @@ class EHentaiItem(BaseSearchItem):
         tags (list[str]): List of tags associated with the gallery.
     """
 
+    __slots__ = ("date", "tags", "type")
+
     def __init__(self, data: PyQuery, **kwargs: Any):
         """Initializes an EHentaiItem with data from a search result.
 
@@ -36,10 +57,10 @@ class EHentaiItem(BaseSearchItem):
             data (PyQuery): PyQuery object containing the gallery's HTML data.
             **kwargs (Any): Additional keyword arguments (unused).
         """
-        self._arrange(data)
+        self._arrange(data[0])
 
-    def _arrange(self, data: PyQuery) -> None:
-        """Extract and organize gallery information from the PyQuery data.
+    def _arrange(self, element: _Element) -> None:
+        """Extract and organize gallery information from the gallery element.
 
         Processes the HTML data to extract various gallery attributes including:
         - Title and URL
@@ -49,26 +70,23 @@ class EHentaiItem(BaseSearchItem):
         - Associated tags
 
         Args:
-            data (PyQuery): PyQuery object containing the gallery's HTML data.
+            element (_Element): The gallery's table row or grid cell.
         """
-        glink = data.find(".glink")
-        self.title: str = glink.text()
+        glink = EHENTAI_GLINK.find(element)
+        self.title: str = text(glink)
 
-        if glink.parent("div"):
-            self.url: str = glink.parent("div").parent("a").attr("href")
+        if divs := parent(glink, EHENTAI_DIV):
+            self.url: str = attr(parent(divs, EHENTAI_A), "href", "")
         else:
-            self.url = glink.parent("a").attr("href")
+            self.url = attr(parent(glink, EHENTAI_A), "href", "")
 
-        thumbnail = data.find(".glthumb img") or data.find(".gl1e img") or data.find(".gl3t img")
-        self.thumbnail: str = thumbnail.attr("data-src") or thumbnail.attr("src")
-        _type = data.find(".cs") or data.find(".cn")
-        self.type: str = _type.eq(0).text() or ""
-        self.date: str = data.find("[id^='posted']").eq(0).text() or ""
+        thumbnail = next((found for selector in EHENTAI_THUMBNAILS if (found := selector.find(element))), [])
+        self.thumbnail: str = attr(thumbnail, "data-src") or attr(thumbnail, "src", "")
+        _type = next((found for selector in EHENTAI_TYPES if (found := selector.find(element))), [])
+        self.type: str = text(_type[:1])
+        self.date: str = text(EHENTAI_POSTED.find(element)[:1])
 
-        self.tags: list[str] = []
-        for i in data.find("div[class=gt],div[class=gtl]").items():
-            if tag := i.attr("title"):
-                self.tags.append(tag)
+        self.tags: list[str] = [tag for i in EHENTAI_TAG.find(element) if (tag := i.get("title"))]
 
 
 class EHentaiResponse(BaseSearchResponse[EHentaiItem]):
@@ -107,10 +125,12 @@ class EHentaiResponse(BaseSearchResponse[EHentaiItem]):
         """
         data = parse_html(resp_data)
         self.origin: PyQuery = data
+        tables = EHENTAI_TABLE.find(data[0])
         if "No unfiltered results" in resp_data:
             self.raw: list[EHentaiItem] = []
-        elif tr_items := data.find(".itg").children("tr").items():
-            self.raw = [EHentaiItem(i) for i in tr_items if i.children("td")]
+        elif rows := children(tables, EHENTAI_ROW):
+            self.raw = self._build_items(
+                wrap([row for row in rows if children([row], EHENTAI_CELL)], data), EHentaiItem
+            )
         else:
-            gl1t_items = data.find(".itg").children(".gl1t").items()
-            self.raw = [EHentaiItem(i) for i in gl1t_items]
+            self.raw = self._build_items(wrap(children(tables, EHENTAI_GRID_ITEM), data), EHentaiItem)
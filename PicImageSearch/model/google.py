@@ -1,12 +1,26 @@
+from collections.abc import Sequence
 from re import compile
 from typing import Any
 
+from lxml.etree import _Element
 from pyquery import PyQuery
 from typing_extensions import override
 
 from ..exceptions import ParsingError
 from ..utils import parse_html
 from .base import BaseSearchItem, BaseSearchResponse
+from .selectors import (
+    GOOGLE_CONTENT,
+    GOOGLE_ITEM,
+    GOOGLE_ITEM_IMAGE,
+    GOOGLE_LINK,
+    GOOGLE_PAGE_LINK,
+    GOOGLE_SCRIPT,
+    GOOGLE_TITLE,
+    attr,
+    text,
+    wrap,
+)
 
 
 class GoogleItem(BaseSearchItem):
@@ -22,22 +36,26 @@ class GoogleItem(BaseSearchItem):
         content (str): Descriptive text or context surrounding the image.
     """
 
-    def __init__(self, data: PyQuery, thumbnail: str | None):
+    __slots__ = ("content",)
+
+    def __init__(self, data: PyQuery, thumbnail: str | None, **kwargs: Any):
         """Initializes a GoogleItem with data from a search result.
 
         Args:
             data (PyQuery): A PyQuery instance containing the search result item's data.
             thumbnail (Optional[str]): Optional base64 encoded thumbnail image.
+            **kwargs (Any): Additional keyword arguments.
         """
-        super().__init__(data, thumbnail=thumbnail)
+        super().__init__(data, thumbnail=thumbnail, **kwargs)
 
     @override
     def _parse_data(self, data: PyQuery, **kwargs: Any) -> None:
         """Parse search result data."""
-        self.title: str = data("h3").text()
-        self.url: str = data("a").eq(0).attr("href")
+        element = data[0]
+        self.title: str = text(GOOGLE_TITLE.select(element))
+        self.url: str = attr(GOOGLE_LINK.select(element), "href", "")
         self.thumbnail: str = kwargs.get("thumbnail") or ""
-        self.content: str = data("div.VwiC3b").text()
+        self.content: str = text(GOOGLE_CONTENT.select(element))
 
 
 class GoogleResponse(BaseSearchResponse[GoogleItem]):
@@ -51,7 +69,7 @@ class GoogleResponse(BaseSearchResponse[GoogleItem]):
         page_number (int): Current page number in the search results.
         url (str): URL of the current search result page.
         pages (list[str]): List of URLs for all available result pages.
-        raw (list[GoogleItem]): List of processed search result items.
+        raw (list[GoogleItem]): Processed search result items.
     """
 
     def __init__(
@@ -60,6 +78,7 @@ class GoogleResponse(BaseSearchResponse[GoogleItem]):
         resp_url: str,
         page_number: int = 1,
         pages: list[str] | None = None,
+        **kwargs: Any,
     ):
         """Initializes with the response text and URL.
 
@@ -68,8 +87,9 @@ class GoogleResponse(BaseSearchResponse[GoogleItem]):
             resp_url (str): URL to the search result page.
             page_number (int): The current page number in the search results.
             pages (Optional[list[str]]): List of URLs to pages of search results.
+            **kwargs (Any): Options of `BaseSearchResponse`, such as `lazy`.
         """
-        super().__init__(resp_data, resp_url, page_number=page_number, pages=pages)
+        super().__init__(resp_data, resp_url, page_number=page_number, pages=pages, **kwargs)
 
     @override
     def _parse_response(self, resp_data: str, **kwargs: Any) -> None:
@@ -81,16 +101,18 @@ class GoogleResponse(BaseSearchResponse[GoogleItem]):
         if pages := kwargs.get("pages"):
             self.pages: list[str] = pages
         else:
-            self.pages = [f"https://www.google.com{i.attr('href')}" for i in data.find('a[aria-label~="Page"]').items()]
+            self.pages = [f"https://www.google.com{i.get('href')}" for i in GOOGLE_PAGE_LINK.find(data[0])]
             self.pages.insert(0, kwargs["resp_url"])
 
-        script_list = list(data.find("script").items())
-        thumbnail_dict: dict[str, str] = self.create_thumbnail_dict(script_list)
+        thumbnail_dict: dict[str, str] = self.create_thumbnail_dict(GOOGLE_SCRIPT.find(data[0]))
 
-        search_items = data.find("#search .wHYlTd")
-        self.raw: list[GoogleItem] = [
-            GoogleItem(i, thumbnail_dict.get(i('img[id^="dimg_"]').attr("id"))) for i in search_items.items()
-        ]
+        search_items = GOOGLE_ITEM.find(data[0])
+        self.raw: list[GoogleItem] = self._build_items(
+            wrap(search_items, data),
+            lambda i, **kwargs: GoogleItem(
+                i, thumbnail_dict.get(attr(GOOGLE_ITEM_IMAGE.select(i[0]), "id", "")), **kwargs
+            ),
+        )
 
         if thumbnail_dict and not self.raw:
             raise ParsingError(
@@ -100,15 +122,14 @@ class GoogleResponse(BaseSearchResponse[GoogleItem]):
             )
 
     @staticmethod
-    def create_thumbnail_dict(script_list: list[PyQuery]) -> dict[str, str]:
+    def create_thumbnail_dict(script_list: Sequence[_Element]) -> dict[str, str]:
         """Creates a mapping of image IDs to their base64 encoded thumbnails.
 
         Processes script tags from Google's search results to extract thumbnail images
         and their corresponding IDs.
 
         Args:
-            script_list (list[PyQuery]): List of PyQuery objects containing script elements
-                from the search results page.
+            script_list (Sequence[_Element]): The script elements from the search results page.
 
         Returns:
             dict[str, str]: A dictionary where:
@@ -124,13 +145,14 @@ class GoogleResponse(BaseSearchResponse[GoogleItem]):
         id_regex = compile(r"dimg_[^'\"]+")
 
         for script in script_list:
-            base_64_match = base_64_regex.findall(script.text())
+            script_text = text([script])
+            base_64_match = base_64_regex.findall(script_text)
             if not base_64_match:
                 continue
 
             # extract and adjust base64 encoded thumbnails
             base64: str = base_64_match[0]
-            id_list: list[str] = id_regex.findall(script.text())
+            id_list: list[str] = id_regex.findall(script_text)
 
             for _id in id_list:
                 thumbnail_dict[_id] = base64.replace(r"\x3d", "=")
@@ -1,13 +1,43 @@
 import re
 from ast import literal_eval
+from collections.abc import Sequence
 from typing import Any
 from urllib.parse import urlparse
 
+from lxml.etree import _Element
 from pyquery import PyQuery
 from typing_extensions import override
 
-from ..utils import parse_html
+from ..utils import json_loads, parse_html
 from .base import BaseSearchItem, BaseSearchResponse
+from .selectors import (
+    LENS_EXACT_IMAGE,
+    LENS_EXACT_INFO,
+    LENS_EXACT_INFO_SPAN,
+    LENS_EXACT_ITEM,
+    LENS_EXACT_LINK,
+    LENS_EXACT_SITE_NAME,
+    LENS_EXACT_TITLE,
+    LENS_IMAGE,
+    LENS_ITEM,
+    LENS_LINK,
+    LENS_RELATED,
+    LENS_RELATED_IMAGE,
+    LENS_RELATED_LINK,
+    LENS_RELATED_TITLE,
+    LENS_SCRIPT,
+    LENS_SITE_NAME,
+    LENS_TITLE,
+    attr,
+    text,
+    wrap,
+)
+
+_LDI = re.compile(r"google\.ldi\s*=\s*({[^}]+})")
+_IMAGE_IDS = re.compile(r"var ii=\[([^]]*)];")
+_BASE64_IMAGE = re.compile(r"var s='(data:image/[^;]+;base64,[^']+)';")
+_SCRIPT = re.compile(r"<script\b([^>]*)>([^<]*(?:<(?!/script)[^<]*)*)</script\s*>", re.IGNORECASE)
+_NONCE = re.compile(r"(?:^|\s)nonce(?:\s*=|\s|$)", re.IGNORECASE)
 
 
 def get_site_name(url: str | None) -> str:
@@ -19,18 +49,31 @@ def get_site_name(url: str | None) -> str:
     return parsed_url.netloc.replace("www.", "") if parsed_url.netloc else ""
 
 
-def parse_image_size(html: PyQuery) -> str | None:
+def parse_image_size(html: Sequence[_Element]) -> str | None:
     """Parses the image size from the HTML snippet."""
-    info_spans = html("div.oYQBg.Zn52Me > span")
-
-    for span in info_spans.items():
-        text = span.text()
-        if text and "x" in text:
-            return text
+    for span in LENS_EXACT_INFO_SPAN.select_all(html):
+        size = text([span])
+        if size and "x" in size:
+            return size
 
     return None
 
 
+def decode_ldi(literal: str) -> dict[str, Any]:
+    """Decodes the object literal assigned to `google.ldi`.
+
+    Google serves it as JSON, decoded with the JSON parser; other literals fall back to
+    `ast.literal_eval`.
+
+    Raises:
+        SyntaxError, ValueError: If the literal cannot be decoded.
+    """
+    try:
+        return json_loads(literal)
+    except ValueError:
+        return literal_eval(literal)
+
+
 def extract_ldi_images(script_text: str, image_url_map: dict[str, str]) -> None:
     """Extract LDI image URLs from script.
 
@@ -38,12 +81,11 @@ def extract_ldi_images(script_text: str, image_url_map: dict[str, str]) -> None:
         script_text (str): The JavaScript content to parse
         image_url_map (dict[str, str]): Dictionary to store extracted image URLs
     """
-    ldi_match = re.search(r"google\.ldi\s*=\s*({[^}]+})", script_text)
-    if not ldi_match:
+    if "google.ldi" not in script_text or not (ldi_match := _LDI.search(script_text)):
         return
 
     try:
-        ldi_dict = literal_eval(ldi_match[1])
+        ldi_dict = decode_ldi(ldi_match[1])
         for key, value in ldi_dict.items():
             if key.startswith("dimg_"):
                 image_url_map[key] = value.replace("\\u003d", "=").replace("\\u0026", "&")
@@ -61,8 +103,8 @@ def extract_base64_images(script_text: str, base64_image_map: dict[str, str]) ->
     if "_setImagesSrc" not in script_text:
         return
 
-    image_ids_match = re.search(r"var ii=\[([^]]*)];", script_text)
-    base64_match = re.search(r"var s='(data:image/[^;]+;base64,[^']+)';", script_text)
+    image_ids_match = _IMAGE_IDS.search(script_text)
+    base64_match = _BASE64_IMAGE.search(script_text)
 
     if not (image_ids_match and base64_match):
         return
@@ -76,11 +118,35 @@ def extract_base64_images(script_text: str, base64_image_map: dict[str, str]) ->
             base64_image_map[img_id] = base64_str
 
 
-def extract_image_maps(html: PyQuery) -> tuple[dict[str, str], dict[str, str]]:
+def scan_image_maps(html: str) -> tuple[dict[str, str], dict[str, str]]:
+    """Extract image mapping information from the raw page, in one pass over its `<script nonce>` elements.
+
+    Gives the same maps as `extract_image_maps` without a DOM: script contents are raw text
+    in HTML, so they are read straight from the page (without the whitespace squashing of
+    `PyQuery.text()`, which does not occur in the values read).
+
+    Args:
+        html (str): The page HTML
+
+    Returns:
+        tuple[dict[str, str], dict[str, str]]: A tuple containing (image_url_map, base64_image_map)
+    """
+    base64_image_map: dict[str, str] = {}
+    image_url_map: dict[str, str] = {}
+
+    for script in _SCRIPT.finditer(html):
+        if (script_text := script[2].strip()) and _NONCE.search(script[1]):
+            extract_ldi_images(script_text, image_url_map)
+            extract_base64_images(script_text, base64_image_map)
+
+    return image_url_map, base64_image_map
+
+
+def extract_image_maps(html: Sequence[_Element]) -> tuple[dict[str, str], dict[str, str]]:
     """Extract image mapping information from HTML.
 
     Args:
-        html (PyQuery): PyQuery object containing the page HTML
+        html (Sequence[_Element]): The page HTML, e.g. a PyQuery object
 
     Returns:
         tuple[dict[str, str], dict[str, str]]: A tuple containing (image_url_map, base64_image_map)
@@ -88,8 +154,8 @@ def extract_image_maps(html: PyQuery) -> tuple[dict[str, str], dict[str, str]]:
     base64_image_map: dict[str, str] = {}
     image_url_map: dict[str, str] = {}
 
-    for script_element in html("script[nonce]"):
-        if script_text := PyQuery(script_element).text():
+    for script_element in LENS_SCRIPT.select_all(html):
+        if script_text := text([script_element]):
             extract_ldi_images(script_text, image_url_map)
             extract_base64_images(script_text, base64_image_map)
 
@@ -99,6 +165,8 @@ def extract_image_maps(html: PyQuery) -> tuple[dict[str, str], dict[str, str]]:
 class GoogleLensBaseItem(BaseSearchItem):
     """Base class for Google Lens items with common image extraction functionality."""
 
+    __slots__ = ("base64_image_map", "image_url_map")
+
     def __init__(
         self,
         data: PyQuery,
@@ -131,7 +199,7 @@ class GoogleLensBaseItem(BaseSearchItem):
         """
         pass
 
-    def _extract_image_url(self, image_element: PyQuery) -> str:
+    def _extract_image_url(self, image_element: Sequence[_Element]) -> str:
         """Extract image URL using a comprehensive approach.
 
         Prioritizes in this order:
@@ -141,7 +209,7 @@ class GoogleLensBaseItem(BaseSearchItem):
         4. Uses src attribute
 
         Args:
-            image_element (PyQuery): The image element to extract URL from
+            image_element (Sequence[_Element]): The matched image elements, the first one is used
 
         Returns:
             str: The extracted image URL or empty string if not found
@@ -150,7 +218,7 @@ class GoogleLensBaseItem(BaseSearchItem):
             return ""
 
         # Try to get image ID from data-iid or id attribute
-        if image_id := image_element.attr("data-iid") or image_element.attr("id"):
+        if image_id := attr(image_element, "data-iid") or attr(image_element, "id"):
             # Check if ID exists in image URL map
             if image_id in self.image_url_map:
                 return self.image_url_map[image_id]
@@ -159,11 +227,11 @@ class GoogleLensBaseItem(BaseSearchItem):
                 return self.base64_image_map[image_id]
 
         # Try to get from data-src attribute
-        if data_src := image_element.attr("data-src"):
+        if data_src := attr(image_element, "data-src"):
             return data_src
 
         # Try to get from src attribute
-        return src if (src := image_element.attr("src")) else ""
+        return src if (src := attr(image_element, "src")) else ""
 
 
 class GoogleLensItem(GoogleLensBaseItem):
@@ -177,6 +245,8 @@ class GoogleLensItem(GoogleLensBaseItem):
         thumbnail (str): URL of the image representing the visual match.
     """
 
+    __slots__ = ("site_name",)
+
     def __init__(
         self,
         data: PyQuery,
@@ -190,16 +260,17 @@ class GoogleLensItem(GoogleLensBaseItem):
     @override
     def _parse_data(self, data: PyQuery, **kwargs: Any) -> None:
         """Parses the raw HTML data to populate item attributes."""
-        link_element = data("a.LBcIee")
-        title_element = data("a.LBcIee .Yt787")
-        site_name_element = data("a.LBcIee .R8BTeb.q8U8x.LJEGod.du278d.i0Rdmd")
-        image_element = data(".gdOPf.q07dbf.uhHOwf.ez24Df img")
+        element = data[0]
+        link_element = LENS_LINK.select(element)
+        title_element = LENS_TITLE.select(element)
+        site_name_element = LENS_SITE_NAME.select(element)
+        image_element = LENS_IMAGE.select(element)
 
-        self.url: str = link_element.attr("href") if link_element else ""
-        self.title: str = title_element.text() if title_element else ""
+        self.url: str = attr(link_element, "href", "")
+        self.title: str = text(title_element)
 
         if site_name_element:
-            self.site_name: str = site_name_element.text()
+            self.site_name: str = text(site_name_element)
         else:
             self.site_name = get_site_name(self.url)
 
@@ -216,6 +287,8 @@ class GoogleLensRelatedSearchItem(GoogleLensBaseItem):
         thumbnail (str): URL of the image associated with the related search.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         data: PyQuery,
@@ -229,13 +302,13 @@ class GoogleLensRelatedSearchItem(GoogleLensBaseItem):
     @override
     def _parse_data(self, data: PyQuery, **kwargs: Any) -> None:
         """Parses the raw HTML data to populate related search item attributes."""
-        url_el = data("a.Kg0xqe")
-        image_element = data("img")
+        element = data[0]
+        image_element = LENS_RELATED_IMAGE.select(element)
 
-        if url_el and url_el.attr("href"):
-            self.url: str = f"https://www.google.com{url_el.attr('href')}"
+        if href := attr(LENS_RELATED_LINK.select(element), "href"):
+            self.url: str = f"https://www.google.com{href}"
 
-        self.title: str = data(".I9S4yc").text()
+        self.title: str = text(LENS_RELATED_TITLE.select(element))
         self.thumbnail: str = self._extract_image_url(image_element)
 
 
@@ -263,10 +336,10 @@ class GoogleLensResponse(BaseSearchResponse[GoogleLensItem]):
             image_url_map (dict[str, str]): Dictionary mapping image IDs to URLs
             base64_image_map (dict[str, str]): Dictionary mapping image IDs to base64 data
         """
-        items_elements = html(".vEWxFf.RCxtQc.my5z3d")
-        for el in items_elements:
-            item = GoogleLensItem(PyQuery(el), image_url_map, base64_image_map)
-            self.raw.append(item)
+        self.raw = self._build_items(
+            wrap(LENS_ITEM.select_all(html), html),
+            lambda el, **kwargs: GoogleLensItem(el, image_url_map, base64_image_map, **kwargs),
+        )
 
     def _parse_related_searches(
         self, html: PyQuery, image_url_map: dict[str, str], base64_image_map: dict[str, str]
@@ -278,10 +351,10 @@ class GoogleLensResponse(BaseSearchResponse[GoogleLensItem]):
             image_url_map (dict[str, str]): Dictionary mapping image IDs to URLs
             base64_image_map (dict[str, str]): Dictionary mapping image IDs to base64 data
         """
-        related_searches_elements = html(".Kg0xqe")
-        for el in related_searches_elements:
-            related_item = GoogleLensRelatedSearchItem(PyQuery(el), image_url_map, base64_image_map)
-            self.related_searches.append(related_item)
+        self.related_searches = self._build_items(
+            wrap(LENS_RELATED.select_all(html), html),
+            lambda el, **kwargs: GoogleLensRelatedSearchItem(el, image_url_map, base64_image_map, **kwargs),
+        )
 
     @override
     def _parse_response(self, resp_data: str, **kwargs: Any) -> None:
@@ -292,7 +365,7 @@ class GoogleLensResponse(BaseSearchResponse[GoogleLensItem]):
         self.raw: list[GoogleLensItem] = []
         self.related_searches: list[GoogleLensRelatedSearchItem] = []
 
-        image_url_map, base64_image_map = extract_image_maps(html)
+        image_url_map, base64_image_map = scan_image_maps(resp_data)
         self._parse_search_items(html, image_url_map, base64_image_map)
         self._parse_related_searches(html, image_url_map, base64_image_map)
 
@@ -309,6 +382,8 @@ class GoogleLensExactMatchesItem(GoogleLensBaseItem):
         thumbnail (str): URL of the image representing the exact match.
     """
 
+    __slots__ = ("site_name", "size")
+
     def __init__(
         self,
         data: PyQuery,
@@ -322,17 +397,18 @@ class GoogleLensExactMatchesItem(GoogleLensBaseItem):
     @override
     def _parse_data(self, data: PyQuery, **kwargs: Any) -> None:
         """Parses raw HTML to populate exact match item attributes."""
-        link_element = data("a.ngTNl")
-        title_element = data(".ZhosBf")
-        image_element = data(".GmoL0c .zVq10e img")
-        site_name_element = data(".XC18Gb .LbKnXb .xuPcX")
-        info_div = data(".oYQBg.Zn52Me")
+        element = data[0]
+        link_element = LENS_EXACT_LINK.select(element)
+        title_element = LENS_EXACT_TITLE.select(element)
+        image_element = LENS_EXACT_IMAGE.select(element)
+        site_name_element = LENS_EXACT_SITE_NAME.select(element)
+        info_div = LENS_EXACT_INFO.select(element)
 
-        self.url: str = link_element.attr("href") if link_element else ""
-        self.title: str = title_element.text() if title_element else ""
+        self.url: str = attr(link_element, "href", "")
+        self.title: str = text(title_element)
 
         if site_name_element:
-            self.site_name: str = site_name_element.text()
+            self.site_name: str = text(site_name_element)
         else:
             self.site_name = get_site_name(self.url)
 
@@ -345,7 +421,7 @@ class GoogleLensExactMatchesResponse(BaseSearchResponse[GoogleLensExactMatchesIt
 
     Attributes:
         origin (PyQuery): The raw PyQuery object of the entire response page.
-        raw (list[GoogleLensExactMatchesItem]): List of GoogleLensExactMatchesItem objects representing exact matches.
+        raw (list[GoogleLensExactMatchesItem]): GoogleLensExactMatchesItem objects representing exact matches.
         url (str): URL of the search results page.
     """
 
@@ -353,8 +429,8 @@ class GoogleLensExactMatchesResponse(BaseSearchResponse[GoogleLensExactMatchesIt
         """Initializes GoogleLensExactMatchesResponse with HTML response data."""
         super().__init__(resp_data, resp_url, **kwargs)
 
-    @staticmethod
     def _parse_search_items(
+        self,
         html: PyQuery,
         image_url_map: dict[str, str],
         base64_image_map: dict[str, str],
@@ -367,14 +443,12 @@ class GoogleLensExactMatchesResponse(BaseSearchResponse[GoogleLensExactMatchesIt
             base64_image_map (dict[str, str]): Dictionary mapping image IDs to base64 data
 
         Returns:
-            list[GoogleLensExactMatchesItem]: List of parsed exact match items
+            list[GoogleLensExactMatchesItem]: Parsed exact match items
         """
-        items = []
-        items_elements = html(".YxbOwd")
-        for el in items_elements:
-            item = GoogleLensExactMatchesItem(PyQuery(el), image_url_map, base64_image_map)
-            items.append(item)
-        return items
+        return self._build_items(
+            wrap(LENS_EXACT_ITEM.select_all(html), html),
+            lambda el, **kwargs: GoogleLensExactMatchesItem(el, image_url_map, base64_image_map, **kwargs),
+        )
 
     @override
     def _parse_response(self, resp_data: str, **kwargs: Any) -> None:
@@ -384,5 +458,5 @@ class GoogleLensExactMatchesResponse(BaseSearchResponse[GoogleLensExactMatchesIt
         self.url: str = kwargs.get("resp_url", "")
         self.raw: list[GoogleLensExactMatchesItem] = []
 
-        image_url_map, base64_image_map = extract_image_maps(html)
+        image_url_map, base64_image_map = scan_image_maps(resp_data)
         self.raw = self._parse_search_items(html, image_url_map, base64_image_map)
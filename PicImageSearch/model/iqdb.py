@@ -1,10 +1,27 @@
 from typing import Any
 
+from lxml.etree import _Element
 from pyquery import PyQuery
 from typing_extensions import override
 
 from ..utils import parse_html
 from .base import BaseSearchItem, BaseSearchResponse
+from .selectors import (
+    IQDB_3D_LINK,
+    IQDB_A,
+    IQDB_IMG,
+    IQDB_MORE_TABLE,
+    IQDB_OTHER_LINK,
+    IQDB_ROW,
+    IQDB_TABLE,
+    IQDB_TD,
+    IQDB_TD_LINK,
+    IQDB_TD_LINK_IMG,
+    IQDB_TH,
+    attr,
+    text,
+    wrap,
+)
 
 
 class IqdbItem(BaseSearchItem):
@@ -21,6 +38,8 @@ class IqdbItem(BaseSearchItem):
         similarity (float): Percentage similarity between the search image and result (0-100).
     """
 
+    __slots__ = ("content", "other_source", "size", "source")
+
     def __init__(self, data: PyQuery, **kwargs: Any):
         """Initializes an IqdbItem with data from a search result.
 
@@ -41,9 +60,9 @@ class IqdbItem(BaseSearchItem):
         self.source: str = ""
         self.other_source: list[dict[str, str]] = []
         self.size: str = ""
-        self._arrange(data)
+        self._arrange(data[0])
 
-    def _arrange(self, data: PyQuery) -> None:
+    def _arrange(self, element: _Element) -> None:
         """Extract and organize search result data from HTML structure.
 
         Processes the HTML table rows to extract various attributes including:
@@ -54,30 +73,30 @@ class IqdbItem(BaseSearchItem):
         - Similarity percentage
 
         Args:
-            data (PyQuery): PyQuery object containing the table structure of the result.
+            element (_Element): The table element of the result.
 
         Note:
             Handles special case for "No relevant matches" results.
         """
-        tr_list = list(data("tr").items())
+        tr_list = IQDB_ROW.select(element)
         if len(tr_list) >= 5:
-            self.content = tr_list[0]("th").text()
+            self.content = text(IQDB_TH.select(tr_list[0]))
             if self.content == "No relevant matches":
                 return
             tr_list = tr_list[1:]
-        self.url: str = self._get_url(tr_list[0]("td > a").attr("href"))
-        self.thumbnail: str = "https://iqdb.org" + tr_list[0]("td > a > img").attr("src")
-        source_list = [i.tail.strip() for i in tr_list[1]("img")]
+        self.url: str = self._get_url(attr(IQDB_TD_LINK.select(tr_list[0]), "href", ""))
+        self.thumbnail: str = "https://iqdb.org" + attr(IQDB_TD_LINK_IMG.select(tr_list[0]), "src", "")
+        source_list = [i.tail.strip() for i in IQDB_IMG.select(tr_list[1])]
         self.source = source_list[0]
-        if other_source := tr_list[1]("td > a"):
+        if other_source := IQDB_TD_LINK.select(tr_list[1]):
             self.other_source.append(
                 {
                     "source": source_list[1],
-                    "url": self._get_url(other_source.attr("href")),
+                    "url": self._get_url(other_source[0].get("href")),
                 }
             )
-        self.size = tr_list[2]("td").text()
-        similarity_raw = tr_list[3]("td").text()
+        self.size = text(IQDB_TD.select(tr_list[2]))
+        similarity_raw = text(IQDB_TD.select(tr_list[3]))
         self.similarity: float = float(similarity_raw.removesuffix("% similarity"))
 
     @staticmethod
@@ -151,34 +170,36 @@ class IqdbResponse(BaseSearchResponse[IqdbItem]):
         Args:
             data (PyQuery): PyQuery object containing the complete search response.
         """
-        host = "https://iqdb.org" if data('a[href^="//3d.iqdb.org"]') else "https://3d.iqdb.org"
-        tables = list(data("#pages > div > table").items())
-        self.url: str = f"{host}/?url=https://iqdb.org{tables[0].find('img').attr('src')}"
+        root = data[0]
+        host = "https://iqdb.org" if IQDB_3D_LINK.select(root) else "https://3d.iqdb.org"
+        tables = IQDB_TABLE.select(root)
+        self.url: str = f"{host}/?url=https://iqdb.org{attr(IQDB_IMG.find(tables[0]), 'src')}"
         if len(tables) > 1:
             tables = tables[1:]
-            self.raw.extend([IqdbItem(i) for i in tables])
-        if tables[0].find("th").text() == "No relevant matches":
-            self._get_other_urls(tables[0].find("a"))
+            self.raw = self._build_items(wrap(tables, data), IqdbItem)
+        if text(IQDB_TH.find(tables[0])) == "No relevant matches":
+            self._get_other_urls(IQDB_A.find(tables[0]))
         else:
-            self._get_other_urls(data("#show1 > a"))
-        self._get_more(data("#more1 > div.pages > div > table"))
+            self._get_other_urls(IQDB_OTHER_LINK.select(root))
+        self._get_more(data, IQDB_MORE_TABLE.select(root))
 
-    def _get_more(self, data: PyQuery) -> None:
+    def _get_more(self, data: PyQuery, tables: list[_Element]) -> None:
         """Extract additional lower-similarity search results.
 
         Args:
-            data (PyQuery): PyQuery object containing the 'more results' section.
+            data (PyQuery): PyQuery object containing the complete search response.
+            tables (list[_Element]): The result tables of the 'more results' section.
         """
-        self.more.extend([IqdbItem(i) for i in data.items()])
+        self.more = self._build_items(wrap(tables, data), IqdbItem)
 
-    def _get_other_urls(self, data: PyQuery) -> None:
+    def _get_other_urls(self, links: list[_Element]) -> None:
         """Extract URLs for searching the image on other platforms.
 
         Processes links to other search engines and stores their URLs in corresponding attributes.
         Handles protocol-relative URLs by adding 'https:' prefix when needed.
 
         Args:
-            data (PyQuery): PyQuery object containing the external search links.
+            links (list[_Element]): The external search link elements.
 
         Note:
             Supports links to SauceNao, ascii2d.net, Google Images, and TinEye.
@@ -190,15 +211,15 @@ class IqdbResponse(BaseSearchResponse[IqdbItem]):
             "TinEye": ["https:", "tineye"],
         }
 
-        for link in data.items():
-            href = link.attr("href")
-            text = link.text()
+        for link in links:
+            href = link.get("href")
+            name = text([link])
 
             if href == "#":
                 continue
 
-            if text in urls_with_name:
-                prefix, attr_name = urls_with_name[text]
+            if name in urls_with_name:
+                prefix, attr_name = urls_with_name[name]
                 # Check if the href already contains the `https:` prefix
                 full_url = href if href.startswith("https:") else prefix + href
                 setattr(self, f"{attr_name}_url", full_url)
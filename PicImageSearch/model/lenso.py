@@ -2,9 +2,12 @@ from typing import Any
 
 from typing_extensions import override
 
-from ..utils import deep_get
+from ..utils import compile_path
 from .base import BaseSearchItem, BaseSearchResponse
 
+_FIRST_URL_TITLE = compile_path("urlList[0].title")
+_FIRST_URL_SOURCE = compile_path("urlList[0].sourceUrl")
+
 
 class LensoURLItem:
     """Represents a URL item in Lenso search results.
@@ -12,15 +15,17 @@ class LensoURLItem:
     A class that processes and stores URL-related information from a Lenso search result.
 
     Attributes:
-        origin (dict): The raw JSON data of the URL item.
+        origin (Optional[dict]): The raw JSON data of the URL item, None once dropped.
         image_url (str): Direct URL to the full-size image.
         source_url (str): URL of the webpage containing the image.
         title (str): Title or description of the image.
         lang (str): Language of the webpage.
     """
 
+    __slots__ = ("image_url", "lang", "origin", "source_url", "title")
+
     def __init__(self, data: dict[str, Any]) -> None:
-        self.origin: dict[str, Any] = data
+        self.origin: dict[str, Any] | None = data
         self.image_url: str = data.get("imageUrl", "")
         self.source_url: str = data.get("sourceUrl", "")
         self.title: str = data.get("title") or ""
@@ -31,7 +36,7 @@ class LensoResultItem(BaseSearchItem):
     """Represents a single Lenso search result item.
 
     Attributes:
-        origin (dict): The raw JSON data of the search result item.
+        origin (Optional[dict]): The raw JSON data of the search result item, None once dropped.
         title (str): Title or name of the search result.
         url (str): URL of the webpage containing the image.
         hash (str): The hash of the image.
@@ -42,6 +47,8 @@ class LensoResultItem(BaseSearchItem):
         height (int): The height of the image.
     """
 
+    __slots__ = ("hash", "height", "url_list", "width")
+
     def __init__(self, data: dict[str, Any], **kwargs: Any) -> None:
         self.url_list: list[LensoURLItem] = []
         self.width: int = 0
@@ -51,9 +58,9 @@ class LensoResultItem(BaseSearchItem):
     @override
     def _parse_data(self, data: dict[str, Any], **kwargs: Any) -> None:
         """Parse search result data."""
-        self.origin: dict[str, Any] = data
-        self.title: str = deep_get(data, "urlList[0].title") or ""
-        self.url: str = deep_get(data, "urlList[0].sourceUrl") or ""
+        self.origin: dict[str, Any] | None = data
+        self.title: str = _FIRST_URL_TITLE(data) or ""
+        self.url: str = _FIRST_URL_SOURCE(data) or ""
         self.hash: str = data.get("hash", "")
 
         distance: float = data.get("distance", 0.0)
@@ -64,6 +71,12 @@ class LensoResultItem(BaseSearchItem):
         self.width = data.get("width", 0)
         self.height = data.get("height", 0)
 
+    @override
+    def drop_origin(self) -> None:
+        super().drop_origin()
+        for url_item in self.url_list:
+            url_item.origin = None
+
 
 class LensoResponse(BaseSearchResponse[LensoResultItem]):
     """Encapsulates a complete Lenso search response.
@@ -118,4 +131,4 @@ class LensoResponse(BaseSearchResponse[LensoResultItem]):
 
         for result_type, result_list in result_types.items():
             result_list.extend(LensoResultItem(item) for item in results_data.get(result_type, []))
-            self.raw.extend(result_list)
+        self.raw = [item for result_list in result_types.values() for item in result_list]
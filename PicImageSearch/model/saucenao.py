@@ -2,7 +2,7 @@ from typing import Any
 
 from typing_extensions import override
 
-from .base import BaseSearchItem, BaseSearchResponse
+from .base import BaseSearchItem, BaseSearchResponse, LazyField, lazy_field
 
 
 class SauceNAOItem(BaseSearchItem):
@@ -24,8 +24,25 @@ class SauceNAOItem(BaseSearchItem):
         author (str): Creator or uploader of the content.
         author_url (str): URL to the author's profile page.
         source (str): Original source platform or website.
+
+    Note:
+        `url`, `author` and `author_url` are resolved from the result data while parsing, or on
+        first access when the item is built lazily.
     """
 
+    __slots__ = ("_author", "_author_url", "_url", "ext_urls", "hidden", "index_id", "index_name", "source")
+
+    def _resolve_links(self) -> None:
+        """Resolves the source URL and author fields from the result data."""
+        data = self.origin["data"]
+        self.url = self._get_url(data)
+        self.author = self._get_author(data)
+        self.author_url = self._get_author_url(data)
+
+    url: str = lazy_field(_resolve_links)
+    author: LazyField[str] = LazyField(_resolve_links)
+    author_url: LazyField[str] = LazyField(_resolve_links)
+
     def __init__(self, data: dict[str, Any], **kwargs: Any):
         """Initializes a SauceNAOItem with data from a search result.
 
@@ -44,10 +61,7 @@ class SauceNAOItem(BaseSearchItem):
         self.index_name: str = header["index_name"]
         self.hidden: int = header.get("hidden", 0)
         self.title: str = self._get_title(data["data"])
-        self.url: str = self._get_url(data["data"])
         self.ext_urls: list[str] = data["data"].get("ext_urls", [])
-        self.author: str = self._get_author(data["data"])
-        self.author_url: str = self._get_author_url(data["data"])
         self.source: str = data["data"].get("source", "")
 
     @staticmethod
@@ -217,7 +231,7 @@ class SauceNAOResponse(BaseSearchResponse[SauceNAOItem]):
         self.status_code: int = resp_data["status_code"]
         header = resp_data["header"]
         results = resp_data.get("results", [])
-        self.raw: list[SauceNAOItem] = [SauceNAOItem(i) for i in results]
+        self.raw: list[SauceNAOItem] = self._build_items(results, SauceNAOItem)
         self.short_remaining: int | None = header.get("short_remaining")
         self.long_remaining: int | None = header.get("long_remaining")
         self.user_id: int | None = header.get("user_id")
@@ -0,0 +1,198 @@
+"""Precompiled CSS selectors for the HTML-scraping models.
+
+Every selector is translated to XPath and compiled once, at import, with the same translator
+PyQuery uses, and then run directly on `lxml` elements. Matching and text extraction follow
+PyQuery's semantics exactly, so models get the same results without translating CSS and
+wrapping PyQuery objects for every lookup.
+"""
+
+from collections.abc import Sequence
+from typing import overload
+
+from lxml.etree import XPath, _Element
+from pyquery import PyQuery
+from pyquery.cssselectpatch import JQueryTranslator
+from pyquery.text import extract_text
+
+_translator = JQueryTranslator(xhtml=False)
+
+
+class Selector:
+    """A CSS selector compiled to XPath.
+
+    Attributes:
+        css (str): The CSS selector.
+    """
+
+    __slots__ = ("_find", "_matches", "_select", "css")
+
+    def __init__(self, css: str):
+        """Compiles a CSS selector.
+
+        Args:
+            css (str): The CSS selector, with PyQuery's jQuery extensions available.
+        """
+        self.css: str = css
+        css = css.replace("[@", "[")
+        self._select: XPath = XPath(_translator.css_to_xpath(css, "descendant-or-self::"))
+        self._find: XPath = XPath(_translator.css_to_xpath(css, "descendant::"))
+        self._matches: XPath = XPath(_translator.css_to_xpath(css, "self::"))
+
+    def __repr__(self) -> str:
+        return f"Selector({self.css!r})"
+
+    def select(self, element: _Element) -> list[_Element]:
+        """Matches the element itself and its descendants, like `PyQuery(element)(css)`."""
+        return self._select(element)  # pyright: ignore[reportReturnType]
+
+    def find(self, element: _Element) -> list[_Element]:
+        """Matches the element's descendants only, like `PyQuery(element).find(css)`."""
+        return self._find(element)  # pyright: ignore[reportReturnType]
+
+    def select_all(self, elements: Sequence[_Element]) -> list[_Element]:
+        """Runs `select` on several elements, like `PyQuery(elements)(css)`."""
+        return [match for element in elements for match in self.select(element)]
+
+    def find_all(self, elements: Sequence[_Element]) -> list[_Element]:
+        """Runs `find` on several elements, like `PyQuery(elements).find(css)`."""
+        return [match for element in elements for match in self.find(element)]
+
+    def matches(self, element: _Element) -> bool:
+        """Returns whether the element itself matches."""
+        return bool(self._matches(element))
+
+
+def text(elements: Sequence[_Element]) -> str:
+    """Returns the text of elements, like `PyQuery.text()`."""
+    return " ".join(extract_text(element) for element in elements)
+
+
+@overload
+def attr(elements: Sequence[_Element], name: str) -> str | None: ...
+
+
+@overload
+def attr(elements: Sequence[_Element], name: str, default: str) -> str: ...
+
+
+def attr(elements: Sequence[_Element], name: str, default: str | None = None) -> str | None:
+    """Returns an attribute of the first element, like `PyQuery.attr(name)`, or `default` if it is missing."""
+    value = elements[0].get(name) if elements else None
+    return default if value is None else value
+
+
+def parent(elements: Sequence[_Element], selector: Selector | None = None) -> list[_Element]:
+    """Returns the distinct parents of elements, optionally filtered, like `PyQuery.parent(css)`."""
+    results: list[_Element] = []
+    for element in elements:
+        if (
+            (found := element.getparent()) is not None
+            and found not in results
+            and (selector is None or selector.matches(found))
+        ):
+            results.append(found)
+    return results
+
+
+def children(elements: Sequence[_Element], selector: Selector | None = None) -> list[_Element]:
+    """Returns the child elements of elements, optionally filtered, like `PyQuery.children(css)`."""
+    return [
+        child
+        for element in elements
+        for child in element.iterchildren()
+        if isinstance(child.tag, str) and (selector is None or selector.matches(child))
+    ]
+
+
+def parents(element: _Element) -> list[_Element]:
+    """Returns the element's ancestors from the root down, like `PyQuery.parents()`."""
+    ancestors = list(element.iterancestors())
+    ancestors.reverse()
+    return ancestors
+
+
+def remove(elements: Sequence[_Element]) -> None:
+    """Removes elements from their tree, keeping their tail text, like `PyQuery.remove()`."""
+    for element in elements:
+        if (parent := element.getparent()) is None:
+            continue
+        if element.tail:
+            if (previous := element.getprevious()) is None:
+                parent.text = (parent.text or "") + element.tail
+            else:
+                previous.tail = (previous.tail or "") + element.tail
+        parent.remove(element)
+
+
+def wrap(elements: Sequence[_Element], parent: PyQuery) -> list[PyQuery]:
+    """Wraps elements as PyQuery objects sharing the parent's translator, like `PyQuery.items()`."""
+    return [PyQuery(element, parent=parent) for element in elements]
+
+
+# Ascii2D
+ASCII2D_ITEM = Selector("div.row.item-box")
+ASCII2D_HASH = Selector("div.hash")
+ASCII2D_SMALL = Selector("small")
+ASCII2D_IMG = Selector("img")
+ASCII2D_DETAIL_BOX = Selector("div.detail-box.gray-link")
+ASCII2D_LINK = Selector("a")
+ASCII2D_H6 = Selector("h6")
+ASCII2D_EXTERNAL = Selector(".external")
+ASCII2D_BACKUP_LINK = Selector("div.pull-xs-right > a")
+
+# E-Hentai
+EHENTAI_TABLE = Selector(".itg")
+EHENTAI_ROW = Selector("tr")
+EHENTAI_CELL = Selector("td")
+EHENTAI_GRID_ITEM = Selector(".gl1t")
+EHENTAI_GLINK = Selector(".glink")
+EHENTAI_DIV = Selector("div")
+EHENTAI_A = Selector("a")
+EHENTAI_THUMBNAILS = (Selector(".glthumb img"), Selector(".gl1e img"), Selector(".gl3t img"))
+EHENTAI_TYPES = (Selector(".cs"), Selector(".cn"))
+EHENTAI_POSTED = Selector("[id^='posted']")
+EHENTAI_TAG = Selector("div[class=gt],div[class=gtl]")
+
+# Google
+GOOGLE_PAGE_LINK = Selector('a[aria-label~="Page"]')
+GOOGLE_SCRIPT = Selector("script")
+GOOGLE_ITEM = Selector("#search .wHYlTd")
+GOOGLE_ITEM_IMAGE = Selector('img[id^="dimg_"]')
+GOOGLE_TITLE = Selector("h3")
+GOOGLE_LINK = Selector("a")
+GOOGLE_CONTENT = Selector("div.VwiC3b")
+
+# Google Lens
+LENS_SCRIPT = Selector("script[nonce]")
+LENS_ITEM = Selector(".vEWxFf.RCxtQc.my5z3d")
+LENS_LINK = Selector("a.LBcIee")
+LENS_TITLE = Selector("a.LBcIee .Yt787")
+LENS_SITE_NAME = Selector("a.LBcIee .R8BTeb.q8U8x.LJEGod.du278d.i0Rdmd")
+LENS_IMAGE = Selector(".gdOPf.q07dbf.uhHOwf.ez24Df img")
+LENS_RELATED = Selector(".Kg0xqe")
+LENS_RELATED_LINK = Selector("a.Kg0xqe")
+LENS_RELATED_IMAGE = Selector("img")
+LENS_RELATED_TITLE = Selector(".I9S4yc")
+LENS_EXACT_ITEM = Selector(".YxbOwd")
+LENS_EXACT_LINK = Selector("a.ngTNl")
+LENS_EXACT_TITLE = Selector(".ZhosBf")
+LENS_EXACT_IMAGE = Selector(".GmoL0c .zVq10e img")
+LENS_EXACT_SITE_NAME = Selector(".XC18Gb .LbKnXb .xuPcX")
+LENS_EXACT_INFO = Selector(".oYQBg.Zn52Me")
+LENS_EXACT_INFO_SPAN = Selector("div.oYQBg.Zn52Me > span")
+
+# IQDB
+IQDB_3D_LINK = Selector('a[href^="//3d.iqdb.org"]')
+IQDB_TABLE = Selector("#pages > div > table")
+IQDB_MORE_TABLE = Selector("#more1 > div.pages > div > table")
+IQDB_OTHER_LINK = Selector("#show1 > a")
+IQDB_ROW = Selector("tr")
+IQDB_TH = Selector("th")
+IQDB_TD = Selector("td")
+IQDB_IMG = Selector("img")
+IQDB_A = Selector("a")
+IQDB_TD_LINK = Selector("td > a")
+IQDB_TD_LINK_IMG = Selector("td > a > img")
+
+# Yandex
+YANDEX_ROOT = Selector('div.Root[id^="ImagesApp-"]')
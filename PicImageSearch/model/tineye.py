@@ -20,6 +20,8 @@ class TineyeItem(BaseSearchItem):
         crawl_date (str): Timestamp indicating when the image was crawled by Tineye.
     """
 
+    __slots__ = ("crawl_date", "domain", "image_url", "size")
+
     def __init__(self, data: dict[str, Any], **kwargs: Any):
         """Initializes a TineyeItem with data from a search result.
 
@@ -44,7 +46,7 @@ class TineyeResponse(BaseSearchResponse[TineyeItem]):
 
     Attributes:
         origin (dict): The raw JSON response data from Tineye.
-        raw (list[TineyeItem]): List of TineyeItem objects, each representing a search result.
+        raw (list[TineyeItem]): TineyeItem objects, each representing a search result.
         domains (dict[str, int]):  A dictionary where keys are the domains where the image was found,
             and values are the number of matches found on that domain. Only available after the initial search.
         query_hash (str): Unique identifier for the search query. Used for pagination.
@@ -59,6 +61,7 @@ class TineyeResponse(BaseSearchResponse[TineyeItem]):
         resp_url: str,
         domains: list[DomainInfo],
         page_number: int = 1,
+        **kwargs: Any,
     ):
         """Initializes a TineyeResponse object with response data and metadata.
 
@@ -66,12 +69,14 @@ class TineyeResponse(BaseSearchResponse[TineyeItem]):
             resp_data (dict[str, Any]):
             resp_url (str):
             page_number (int):
+            **kwargs (Any): Options of `BaseSearchResponse`, such as `lazy`.
         """
         super().__init__(
             resp_data,
             resp_url,
             domains=domains,
             page_number=page_number,
+            **kwargs,
         )
         self.domains: list[DomainInfo] = domains
         self.page_number: int = page_number
@@ -83,4 +88,4 @@ class TineyeResponse(BaseSearchResponse[TineyeItem]):
         self.status_code: int = resp_data["status_code"]
         self.total_pages: int = resp_data["total_pages"]
         matches = resp_data["matches"]
-        self.raw: list[TineyeItem] = [TineyeItem(i) for i in matches] if matches else []
+        self.raw: list[TineyeItem] = self._build_items(matches or [], TineyeItem)
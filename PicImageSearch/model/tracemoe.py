@@ -63,6 +63,29 @@ class TraceMoeItem(BaseSearchItem):
         image (str): URL to the preview image of the matched scene.
     """
 
+    __slots__ = (
+        "From",
+        "To",
+        "anilist_id",
+        "anime_info",
+        "cover_image",
+        "end_date",
+        "episode",
+        "filename",
+        "format",
+        "idMal",
+        "image",
+        "isAdult",
+        "start_date",
+        "synonyms",
+        "title_chinese",
+        "title_english",
+        "title_native",
+        "title_romaji",
+        "type",
+        "video",
+    )
+
     def __init__(
         self,
         data: dict[str, Any],
@@ -153,7 +176,7 @@ class TraceMoeResponse(BaseSearchResponse[TraceMoeItem]):
 
     Attributes:
         origin (dict): Raw API response data.
-        raw (list[TraceMoeItem]): List of processed search results.
+        raw (list[TraceMoeItem]): Processed search results.
         frameCount (int): Total number of frames analyzed during search.
         error (str): Error message if the search encountered issues.
         url (str): URL to the search results page.
@@ -165,6 +188,7 @@ class TraceMoeResponse(BaseSearchResponse[TraceMoeItem]):
         resp_url: str,
         mute: bool,
         size: str | None,
+        **kwargs: Any,
     ):
         """Initializes with the response data.
 
@@ -173,8 +197,9 @@ class TraceMoeResponse(BaseSearchResponse[TraceMoeItem]):
             resp_url (str): URL to the search result page.
             mute (bool): Flag for muting video excerpts in search results.
             size (Optional[str]): Size parameter for modifying video and image URLs.
+            **kwargs (Any): Options of `BaseSearchResponse`, such as `lazy`.
         """
-        super().__init__(resp_data, resp_url, mute=mute, size=size)
+        super().__init__(resp_data, resp_url, mute=mute, size=size, **kwargs)
 
     @override
     def _parse_response(self, resp_data: dict[str, Any], **kwargs: Any) -> None:
@@ -193,15 +218,13 @@ class TraceMoeResponse(BaseSearchResponse[TraceMoeItem]):
             The parsed results are stored in the `raw` attribute as TraceMoeItem instances.
         """
         res_docs = resp_data["result"]
-        self.raw.extend(
-            [
-                TraceMoeItem(
-                    i,
-                    mute=kwargs.get("mute", False),
-                    size=kwargs.get("size"),
-                )
-                for i in res_docs
-            ]
+        self.raw: list[TraceMoeItem] = self._build_items(
+            res_docs,
+            lambda i: TraceMoeItem(
+                i,
+                mute=kwargs.get("mute", False),
+                size=kwargs.get("size"),
+            ),
         )
         self.frameCount: int = resp_data["frameCount"]
         self.error: str = resp_data["error"]
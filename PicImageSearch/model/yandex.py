@@ -1,12 +1,66 @@
-from json import loads as json_loads
+import re
+from html import unescape
 from typing import Any
 
 from pyquery import PyQuery
 from typing_extensions import override
 
 from ..exceptions import ParsingError
-from ..utils import deep_get, parse_html
-from .base import BaseSearchItem, BaseSearchResponse
+from ..utils import compile_path, json_loads, parse_html
+from .base import BaseSearchItem, BaseSearchResponse, LazyField
+from .selectors import YANDEX_ROOT, attr
+
+_ROOT_ID_PREFIX = "ImagesApp-"
+_SITES = compile_path("initialState.cbirSites.sites")
+_START_TAG = re.compile(
+    r"""<div((?:\s+[^\s"'>/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?)*)\s*/?>""", re.IGNORECASE
+)
+_ATTRIBUTE = re.compile(r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+
+
+def _unescape(value: str) -> str:
+    """Unescapes character references, replacing the common ones without regex callbacks."""
+    if "&" not in value:
+        return value
+    replaced = value.replace("&quot;", '"').replace("&lt;", "<").replace("&gt;", ">")
+    replaced = replaced.replace("&#39;", "'").replace("&#x27;", "'")
+    if "&" in replaced.replace("&amp;", ""):
+        return unescape(value)
+    return replaced.replace("&amp;", "&")
+
+
+def find_data_state(html: str | bytes) -> str | None:
+    """Finds the `data-state` of the `div.Root[id^="ImagesApp-"]` element by scanning the page.
+
+    Only the `<div>` start tags holding an "ImagesApp-" id are looked at, so the page is never
+    parsed into a DOM. Attributes are read like an HTML parser would: quoted values may contain
+    ">", names are case-insensitive, the first of duplicate attributes wins, and character
+    references are unescaped.
+
+    Args:
+        html (Union[str, bytes]): The page, as text or as UTF-8 bytes.
+
+    Returns:
+        Optional[str]: The attribute value, None if no such element was found.
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    position = html.find(_ROOT_ID_PREFIX)
+    while position != -1:
+        start = html.rfind("<", 0, position)
+        if start != -1 and (tag := _START_TAG.match(html, start)) and tag.end() > position:
+            attributes: dict[str, str] = {}
+            for name, double_quoted, single_quoted, unquoted in _ATTRIBUTE.findall(tag[1]):
+                attributes.setdefault(name.lower(), double_quoted or single_quoted or unquoted)
+            if (
+                _unescape(attributes.get("id", "")).startswith(_ROOT_ID_PREFIX)
+                and "Root" in attributes.get("class", "").split()
+                and "data-state" in attributes
+            ):
+                return _unescape(attributes["data-state"])
+            position = tag.end()
+        position = html.find(_ROOT_ID_PREFIX, position + 1)
+    return None
 
 
 class YandexItem(BaseSearchItem):
@@ -24,6 +78,8 @@ class YandexItem(BaseSearchItem):
         size (str): Image dimensions in "widthxheight" format.
     """
 
+    __slots__ = ("content", "size", "source")
+
     def __init__(self, data: dict[str, Any], **kwargs: Any):
         """Initializes a YandexItem with data from a search result.
 
@@ -63,10 +119,15 @@ class YandexResponse(BaseSearchResponse[YandexItem]):
     Processes and stores the full response from a Yandex reverse image search,
     including all found image results and metadata.
 
+    The results are read from the page's `data-state` attribute, which is located by scanning
+    the page text (see `find_data_state`); the page is only parsed into a DOM when the scan
+    fails, or when `origin` is first accessed.
+
     Attributes:
         raw (list[YandexItem]): List of parsed search results as YandexItem instances.
         url (str): URL of the search results page.
-        origin (PyQuery): PyQuery object containing the raw HTML response.
+        origin (Optional[PyQuery]): PyQuery object containing the raw HTML response, parsed on first access,
+            None once dropped.
     """
 
     def __init__(self, resp_data: str, resp_url: str, **kwargs: Any):
@@ -78,6 +139,16 @@ class YandexResponse(BaseSearchResponse[YandexItem]):
         """
         super().__init__(resp_data, resp_url, **kwargs)
 
+    def _parse_origin(self) -> None:
+        self.origin = parse_html(self._html) if self._html is not None else None
+
+    origin: LazyField[PyQuery | None] = LazyField(_parse_origin)
+
+    @override
+    def drop_origin(self) -> None:
+        self._html = None
+        super().drop_origin()
+
     @override
     def _parse_response(self, resp_data: str, **kwargs: Any) -> None:
         """Parses the raw HTML response from Yandex into structured data.
@@ -93,10 +164,12 @@ class YandexResponse(BaseSearchResponse[YandexItem]):
             The method looks for a specific div element containing the search results
             data in JSON format, then creates YandexItem instances for each result.
         """
-        data = parse_html(resp_data)
-        self.origin: PyQuery = data
-        data_div = data.find('div.Root[id^="ImagesApp-"]')
-        data_state = data_div.attr("data-state")
+        self._html: str | None = resp_data
+        YandexResponse.origin.reset(self)
+        data_state = find_data_state(resp_data)
+        if data_state is None:
+            self.origin = origin = parse_html(resp_data)
+            data_state = attr(YANDEX_ROOT.find(origin[0]), "data-state")
 
         if not data_state:
             raise ParsingError(
@@ -106,8 +179,8 @@ class YandexResponse(BaseSearchResponse[YandexItem]):
             )
 
         data_json = json_loads(str(data_state))
-        if sites := deep_get(data_json, "initialState.cbirSites.sites"):
-            self.raw: list[YandexItem] = [YandexItem(site) for site in sites]
+        if sites := _SITES(data_json):
+            self.raw: list[YandexItem] = self._build_items(sites, YandexItem)
         else:
             raise ParsingError(
                 message="Failed to extract search results from 'data-state'",
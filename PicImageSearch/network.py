@@ -1,7 +1,31 @@
+import asyncio
+import random
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from types import TracebackType
 from typing import Any, NamedTuple
 
-from httpx import AsyncClient, QueryParams, create_ssl_context
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    AsyncClient,
+    AsyncHTTPTransport,
+    ConnectError,
+    ConnectTimeout,
+    Headers,
+    Limits,
+    PoolTimeout,
+    QueryParams,
+    Request,
+    Response,
+    TransportError,
+    create_ssl_context,
+)
+
+from .utils import json_loads
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -10,6 +34,79 @@ DEFAULT_HEADERS = {
         "Chrome/99.0.4844.82 Safari/537.36"
     )
 }
+DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+
+class _ReleasingStream(AsyncByteStream):
+    """Response stream that runs a callback once the response is closed."""
+
+    def __init__(self, stream: AsyncByteStream, release: Callable[[], None]):
+        self._stream: AsyncByteStream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                release, self._release = self._release, None
+                release()
+
+
+def _forget_closed_loops(mapping: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]) -> None:
+    """Removes the entries of closed event loops, whose values may keep the loop itself alive."""
+    for loop in [loop for loop in mapping if loop.is_closed()]:
+        del mapping[loop]
+
+
+class _HostLimitedTransport(AsyncBaseTransport):
+    """Transport wrapper that caps the number of concurrent requests per host.
+
+    A request holds its host's slot until the response has been read and closed,
+    which bounds the number of connections opened to any single host. Slots are
+    counted per event loop, since asyncio semaphores belong to the loop they run on.
+    """
+
+    def __init__(self, transport: AsyncBaseTransport, max_connections_per_host: int):
+        self._transport: AsyncBaseTransport = transport
+        self._max_connections_per_host: int = max_connections_per_host
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            _forget_closed_loops(self._semaphores)
+            semaphores = self._semaphores[loop] = {}
+        semaphore = semaphores.get(host)
+        if semaphore is None:
+            semaphore = semaphores[host] = asyncio.Semaphore(self._max_connections_per_host)
+        return semaphore
+
+    async def handle_async_request(self, request: Request) -> Response:
+        semaphore = self._semaphore(request.url.netloc.decode("ascii"))
+
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        if response.is_closed or not isinstance(response.stream, AsyncByteStream):
+            semaphore.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
 
 
 class Network:
@@ -33,6 +130,8 @@ class Network:
         timeout: float = 30,
         verify_ssl: bool = True,
         http2: bool = False,
+        limits: Limits = DEFAULT_LIMITS,
+        max_connections_per_host: int | None = None,
     ):
         """Initialize a new Network instance with custom configuration.
 
@@ -44,6 +143,12 @@ class Network:
             timeout (float): Request timeout in seconds.
             verify_ssl (bool): If True, verifies SSL certificates.
             http2 (bool): If True, enables HTTP/2 support.
+            limits (Limits): Connection pool limits (max connections, keep-alive connections and expiry).
+            max_connections_per_host (Optional[int]): If set, caps concurrent requests to any single host.
+
+        Note:
+            When `max_connections_per_host` is set, the transport is built explicitly, so proxy
+            settings from environment variables are not picked up; pass `proxies` instead.
         """
         self.internal: bool = internal
         headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
@@ -55,15 +160,26 @@ class Network:
 
         ssl_context = create_ssl_context(verify=verify_ssl)
         ssl_context.set_ciphers("DEFAULT")
-        self.client: AsyncClient = AsyncClient(
-            headers=headers,
-            cookies=self.cookies,
-            verify=ssl_context,
-            http2=http2,
-            proxy=proxies,
-            timeout=timeout,
-            follow_redirects=True,
-        )
+        if max_connections_per_host:
+            transport = AsyncHTTPTransport(verify=ssl_context, http2=http2, limits=limits, proxy=proxies)
+            self.client: AsyncClient = AsyncClient(
+                headers=headers,
+                cookies=self.cookies,
+                transport=_HostLimitedTransport(transport, max_connections_per_host),
+                timeout=timeout,
+                follow_redirects=True,
+            )
+        else:
+            self.client = AsyncClient(
+                headers=headers,
+                cookies=self.cookies,
+                verify=ssl_context,
+                http2=http2,
+                proxy=proxies,
+                timeout=timeout,
+                limits=limits,
+                follow_redirects=True,
+            )
 
     def start(self) -> AsyncClient:
         """Initializes and returns the HTTP client.
@@ -158,21 +274,305 @@ class ClientManager:
             await self.client.close()
 
 
+class ClientRegistry:
+    """A registry of shared HTTP clients keyed by network configuration.
+
+    Engines created with the same proxy, SSL, HTTP/2, timeout, header and cookie settings
+    receive the same `AsyncClient`, so they share one connection pool and SSL context
+    instead of each holding their own. Clients live until `aclose()` is called.
+
+    A client's connections belong to the event loop they were opened on, so each running
+    loop gets its own clients; those of loops that have been closed are forgotten.
+
+    Attributes:
+        limits (Limits): Connection pool limits applied to every client in the registry.
+        max_connections_per_host (Optional[int]): Per-host cap on concurrent requests, if any.
+    """
+
+    def __init__(self, limits: Limits = DEFAULT_LIMITS, max_connections_per_host: int | None = None):
+        """Initializes an empty registry.
+
+        Args:
+            limits (Limits): Connection pool limits for the shared clients.
+            max_connections_per_host (Optional[int]): If set, caps concurrent requests to any single host
+                for each shared client.
+        """
+        self.limits: Limits = limits
+        self.max_connections_per_host: int | None = max_connections_per_host
+        self._networks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[Any, ...], Network]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __len__(self) -> int:
+        return sum(len(networks) for networks in self._networks.values())
+
+    @staticmethod
+    def _key(
+        proxies: str | None,
+        headers: dict[str, str] | None,
+        cookies: str | None,
+        timeout: float,
+        verify_ssl: bool,
+        http2: bool,
+    ) -> tuple[Any, ...]:
+        return (
+            proxies,
+            tuple(sorted(headers.items())) if headers else (),
+            cookies or "",
+            timeout,
+            verify_ssl,
+            http2,
+        )
+
+    def find_client(
+        self,
+        proxies: str | None = None,
+        headers: dict[str, str] | None = None,
+        cookies: str | None = None,
+        timeout: float = 30,
+        verify_ssl: bool = True,
+        http2: bool = False,
+    ) -> AsyncClient | None:
+        """Returns the open shared client for the given configuration on the running event loop, if any.
+
+        Unlike `get_client`, this never creates a client.
+
+        Args:
+            proxies (Optional[str]): Proxy URL string.
+            headers (Optional[dict[str, str]]): Custom headers merged with the defaults.
+            cookies (Optional[str]): Cookies in ';' separated string format.
+            timeout (float): Request timeout in seconds.
+            verify_ssl (bool): If True, verifies SSL certificates.
+            http2 (bool): If True, enables HTTP/2 support.
+
+        Returns:
+            Optional[AsyncClient]: The shared client, or None if none was created yet (or outside a running loop).
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        network = self._networks.get(loop, {}).get(self._key(proxies, headers, cookies, timeout, verify_ssl, http2))
+        if network is None or network.client.is_closed:
+            return None
+        return network.client
+
+    def get_client(
+        self,
+        proxies: str | None = None,
+        headers: dict[str, str] | None = None,
+        cookies: str | None = None,
+        timeout: float = 30,
+        verify_ssl: bool = True,
+        http2: bool = False,
+    ) -> AsyncClient:
+        """Returns the shared client for the given configuration on the running event loop, creating it on first use.
+
+        Args:
+            proxies (Optional[str]): Proxy URL string.
+            headers (Optional[dict[str, str]]): Custom headers merged with the defaults.
+            cookies (Optional[str]): Cookies in ';' separated string format.
+            timeout (float): Request timeout in seconds.
+            verify_ssl (bool): If True, verifies SSL certificates.
+            http2 (bool): If True, enables HTTP/2 support.
+
+        Returns:
+            AsyncClient: A client shared by every caller on this loop using the same configuration.
+
+        Raises:
+            RuntimeError: If no event loop is running.
+        """
+        loop = asyncio.get_running_loop()
+        networks = self._networks.get(loop)
+        if networks is None:
+            _forget_closed_loops(self._networks)
+            networks = self._networks[loop] = {}
+        key = self._key(proxies, headers, cookies, timeout, verify_ssl, http2)
+        network = networks.get(key)
+        if network is None or network.client.is_closed:
+            network = networks[key] = Network(
+                internal=True,
+                proxies=proxies,
+                headers=headers,
+                cookies=cookies,
+                timeout=timeout,
+                verify_ssl=verify_ssl,
+                http2=http2,
+                limits=self.limits,
+                max_connections_per_host=self.max_connections_per_host,
+            )
+        return network.client
+
+    async def aclose(self) -> None:
+        """Closes the shared clients of the running event loop and empties the registry.
+
+        Clients of other loops are only dropped, since their connections cannot be closed from this one.
+        """
+        networks = self._networks.pop(asyncio.get_running_loop(), {})
+        self._networks.clear()
+        for network in networks.values():
+            await network.close()
+
+
+default_registry = ClientRegistry()
+"""Process-wide registry used by engines created with `registry=default_registry`."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings for transient HTTP failures.
+
+    Failed attempts are retried with exponential backoff and optional full jitter. A
+    `Retry-After` header on the response takes precedence over the computed backoff.
+
+    Which failures are retried depends on whether the request may have reached the server:
+        - Connection failures (connect errors and timeouts, pool timeouts) are always retried.
+        - Statuses in both `retry_statuses` and `unprocessed_statuses` (429 by default) are retried
+          for every method, since the server rejected the request without processing it.
+        - Other retryable statuses and errors after sending (e.g. connection resets) are only
+          retried for methods in `allowed_methods`.
+
+    Callers that throttle themselves, e.g. by switching API keys on a 429, leave the status out
+    of `retry_statuses` (`dataclasses.replace(policy, retry_statuses=policy.retry_statuses - {429})`)
+    to get the response back at once.
+
+    Attributes:
+        max_attempts (int): Total number of attempts, including the first one. 1 disables retries.
+        backoff_factor (float): Base delay in seconds; attempt n waits up to `backoff_factor * 2 ** (n - 1)`.
+        max_backoff (float): Upper bound for the computed backoff delay.
+        jitter (bool): If True, the backoff delay is drawn uniformly from [0, delay].
+        retry_statuses (frozenset[int]): HTTP status codes considered transient.
+        unprocessed_statuses (frozenset[int]): Retryable status codes that mean the request was not processed,
+            retried regardless of `allowed_methods`.
+        allowed_methods (frozenset[str]): Methods that are safe to resend after reaching the server.
+        respect_retry_after (bool): If True, honors the `Retry-After` response header.
+        max_retry_after (float): Responses asking to wait longer than this are returned instead of retried.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    unprocessed_statuses: frozenset[int] = frozenset({429})
+    allowed_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def retries_status(self, method: str, status_code: int) -> bool:
+        """Whether a response with the given status should be retried."""
+        if status_code not in self.retry_statuses:
+            return False
+        return status_code in self.unprocessed_statuses or method.upper() in self.allowed_methods
+
+    def retries_error(self, method: str, error: Exception) -> bool:
+        """Whether a request that raised the given transport error should be retried."""
+        if isinstance(error, (ConnectError, ConnectTimeout, PoolTimeout)):
+            return True
+        return isinstance(error, TransportError) and method.upper() in self.allowed_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the delay before the attempt following attempt number `attempt`."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        """Parses a `Retry-After` header given either in seconds or as an HTTP date.
+
+        Args:
+            value (Optional[str]): The header value.
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the header is missing or invalid.
+        """
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+"""A retry policy that never retries."""
+
+LOOKUP_RETRY_POLICY = RetryPolicy(allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "POST"}))
+"""A retry policy for services whose POST requests are pure lookups that can be resent safely."""
+
+
 class RESP(NamedTuple):
     """A named tuple for HTTP response data.
 
     This class provides a convenient way to store and access HTTP response data,
-    including the response body, URL, and status code.
+    including the response body, URL, and status code. It also carries the body as
+    received, so `json()` decodes JSON straight from the bytes (see `utils.json_loads`),
+    along with transfer metadata. These extra fields have defaults, so a response can
+    still be built and unpacked as `(text, url, status_code)` when they are not needed.
 
     Attributes:
         text (str): The response body as text.
         url (str): The final URL after any redirects.
         status_code (int): The HTTP status code.
+        content (bytes): The response body as bytes, empty if only `text` was given.
+        encoding (str): The text encoding of the body, from its Content-Type or UTF-8.
+        headers (Headers): The response headers, empty if not built from an HTTP response.
+        elapsed (float): Seconds from sending the final request to reading the whole body.
+        bytes_sent (int): Size of the final request's body, 0 if it had none or its size was unknown.
+        bytes_received (int): Size of the response body as transferred, before decompression.
+        redirects (int): Number of redirects followed to reach `url`.
     """
 
     text: str
     url: str
     status_code: int
+    content: bytes = b""
+    encoding: str = "utf-8"
+    headers: Headers = Headers()
+    elapsed: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    redirects: int = 0
+
+    @classmethod
+    def from_response(cls, resp: Response) -> "RESP":
+        """Builds the response data from a read httpx response.
+
+        Args:
+            resp (Response): A response whose body has been read.
+
+        Returns:
+            RESP: The body, final URL, status, headers, timing and transfer sizes of the response.
+        """
+        content_length = resp.request.headers.get("Content-Length")
+        try:
+            elapsed = resp.elapsed.total_seconds()
+        except RuntimeError:  # bodies given in memory (e.g. by mock transports) are never closed
+            elapsed = 0.0
+        return cls(
+            resp.text,
+            str(resp.url),
+            resp.status_code,
+            resp.content,
+            resp.encoding or "utf-8",
+            headers=resp.headers,
+            elapsed=elapsed,
+            bytes_sent=int(content_length) if content_length and content_length.isdigit() else 0,
+            bytes_received=resp.num_bytes_downloaded or len(resp.content),
+            redirects=len(resp.history),
+        )
+
+    def json(self) -> Any:
+        """Decodes the response body as JSON, from `content` if set, otherwise from `text`.
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        return json_loads(self.content or self.text)
 
 
 class HandOver:
@@ -181,6 +581,12 @@ class HandOver:
     This class provides convenient methods for making HTTP requests with automatic
     client lifecycle management. It supports GET, POST, and download operations.
 
+    When no client is supplied, a single pooled client is created lazily on the first
+    request and reused for every following request until `close()` is called, so
+    keep-alive connections survive across calls and searches. Its connections belong to
+    the event loop that created it, so it is replaced when requests run on another loop
+    (e.g. across `asyncio.run()` calls).
+
     Attributes:
         client (Optional[AsyncClient]): An optional pre-configured client.
         proxies (Optional[str]): Proxy settings for requests.
@@ -189,8 +595,13 @@ class HandOver:
         timeout (float): Default timeout for requests.
         verify_ssl (bool): If True, verifies SSL certificates.
         http2 (bool): If True, enables HTTP/2 support.
+        reuse_client (bool): If False, a fresh client is built and closed for every request.
+        registry (Optional[ClientRegistry]): If set, requests use the registry's shared client.
+        retry_policy (RetryPolicy): Retry settings applied to every request.
     """
 
+    default_retry_policy: RetryPolicy = RetryPolicy()
+
     def __init__(
         self,
         client: AsyncClient | None = None,
@@ -200,6 +611,9 @@ class HandOver:
         timeout: float = 30,
         verify_ssl: bool = True,
         http2: bool = False,
+        reuse_client: bool = True,
+        registry: ClientRegistry | None = None,
+        retry_policy: RetryPolicy | None = None,
     ):
         """Initializes HandOver with an existing AsyncClient or creates a new one.
 
@@ -211,6 +625,12 @@ class HandOver:
             timeout (float): Timeout duration.
             verify_ssl (bool): If True, verifies SSL certificates.
             http2 (bool): If True, enables HTTP/2 support.
+            reuse_client (bool): If True (default), lazily creates one pooled client and reuses it until
+                `close()` is called. If False, builds and closes a new client for every request.
+            registry (Optional[ClientRegistry]): A registry to take a shared client from instead of owning one.
+                Shared clients are not closed by `close()`; close the registry instead.
+            retry_policy (Optional[RetryPolicy]): Retry settings for transient failures. Defaults to the
+                class's `default_retry_policy`; pass `NO_RETRY` to disable retries.
         """
         self.client: AsyncClient | None = client
         self.proxies: str | None = proxies
@@ -219,6 +639,131 @@ class HandOver:
         self.timeout: float = timeout
         self.verify_ssl: bool = verify_ssl
         self.http2: bool = http2
+        self.reuse_client: bool = reuse_client
+        self.registry: ClientRegistry | None = registry
+        self.retry_policy: RetryPolicy = retry_policy or self.default_retry_policy
+        self._network: Network | None = None
+        self._network_loop: asyncio.AbstractEventLoop | None = None
+
+    def _client_manager(self) -> ClientManager:
+        """Returns the client manager to use for the next request.
+
+        Returns:
+            ClientManager: Wraps the user-supplied client, the registry's shared client,
+                the lazily created pooled client, or a per-request client when `reuse_client` is False.
+        """
+        if self.client is None and self.registry is not None:
+            return ClientManager(self.registry.get_client(**self._network_options()))
+
+        if self.client is None and self.reuse_client:
+            loop = asyncio.get_running_loop()
+            if self._network is not None and self._network_loop is not loop:
+                # Connections of another (usually closed) loop cannot be used or closed from this one.
+                self._network = None
+            if self._network is None:
+                self._network_loop = loop
+                self._network = Network(internal=True, **self._network_options())
+            return ClientManager(self._network.client)
+
+        return ClientManager(self.client, **self._network_options())
+
+    def _network_options(self) -> dict[str, Any]:
+        """Returns the settings clients are built with for this instance."""
+        return {
+            "proxies": self.proxies,
+            "headers": self.headers,
+            "cookies": self.cookies,
+            "timeout": self.timeout,
+            "verify_ssl": self.verify_ssl,
+            "http2": self.http2,
+        }
+
+    def _active_client(self) -> AsyncClient | None:
+        """Returns the client currently used for requests, if one exists. Never creates one.
+
+        Returns:
+            Optional[AsyncClient]: The user-supplied client, the shared client of the running loop,
+                the pooled client, or None if none exists yet.
+        """
+        if self.client is not None:
+            return self.client
+        if self.registry is not None:
+            return self.registry.find_client(**self._network_options())
+        return self._network.client if self._network is not None else None
+
+    async def close(self) -> None:
+        """Closes the pooled client created by this instance.
+
+        User-supplied clients are left untouched. A pooled client created on another event loop is only
+        dropped, since its connections cannot be closed from this one. A new pooled client is created on
+        the next request.
+        """
+        if self._network is not None:
+            network, self._network = self._network, None
+            if self._network_loop is asyncio.get_running_loop():
+                await network.close()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        retry_policy: RetryPolicy | None = None,
+        before_attempt: Callable[[], Awaitable[None]] | None = None,
+        on_retry: Callable[[int, float, int | None, TransportError | None], None] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Send an HTTP request, retrying transient failures according to the retry policy.
+
+        Each call covers a single request, so in multi-step flows only the failed step is retried.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The target URL.
+            retry_policy (Optional[RetryPolicy]): Overrides the instance's retry policy for this request.
+            before_attempt (Optional[Callable[[], Awaitable[None]]]): Awaited before every attempt,
+                e.g. to wait for a rate limiter.
+            on_retry (Optional[Callable[[int, float, Optional[int], Optional[TransportError]], None]]): Called
+                before waiting to retry, with the failed attempt's number, the delay, and the retried status
+                code or transport error.
+            **kwargs (Any): Additional arguments passed to httpx.AsyncClient.request().
+
+        Returns:
+            Response: The final response, which may still have an error status if retries ran out.
+
+        Raises:
+            httpx.TransportError: If the last attempt failed with a transport error.
+        """
+        method = method.upper()
+        policy = retry_policy or self.retry_policy
+        attempt = 1
+        while True:
+            if before_attempt is not None:
+                await before_attempt()
+
+            try:
+                async with self._client_manager() as client:
+                    resp = await client.request(method, url, **kwargs)
+            except TransportError as e:
+                if attempt >= policy.max_attempts or not policy.retries_error(method, e):
+                    raise
+                delay = policy.backoff(attempt)
+                if on_retry is not None:
+                    on_retry(attempt, delay, None, e)
+            else:
+                if attempt >= policy.max_attempts or not policy.retries_status(method, resp.status_code):
+                    return resp
+                delay = policy.backoff(attempt)
+                if policy.respect_retry_after:
+                    retry_after = policy.parse_retry_after(resp.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        if retry_after > policy.max_retry_after:
+                            return resp
+                        delay = retry_after
+                if on_retry is not None:
+                    on_retry(attempt, delay, resp.status_code, None)
+
+            await asyncio.sleep(delay)
+            attempt += 1
 
     async def get(
         self,
@@ -233,28 +778,19 @@ class HandOver:
             url (str): The target URL for the GET request.
             params (Optional[dict[str, str]]): Optional query parameters to append to the URL.
             headers (Optional[dict[str, str]]): Optional headers to override defaults.
-            **kwargs (Any): Additional arguments passed to httpx.AsyncClient.get().
+            **kwargs (Any): Additional arguments passed to httpx.AsyncClient.request(),
+                including `retry_policy` to override the retry settings for this request.
 
         Returns:
-            RESP: A named tuple containing:
-                - text: The response body as text
-                - url: The final URL after any redirects
-                - status_code: The HTTP status code
+            RESP: The response text and bytes (with `json()` to decode them), the final URL after any
+                redirects, the HTTP status code and headers, and timing and transfer sizes.
 
         Note:
-            The client is automatically managed within a context manager.
+            The client is automatically managed within a context manager, and transient
+            failures are retried according to the retry policy.
         """
-        async with ClientManager(
-            self.client,
-            self.proxies,
-            self.headers,
-            self.cookies,
-            self.timeout,
-            self.verify_ssl,
-            self.http2,
-        ) as client:
-            resp = await client.get(url, params=params, headers=headers, **kwargs)
-            return RESP(resp.text, str(resp.url), resp.status_code)
+        resp = await self._request("GET", url, params=params, headers=headers, **kwargs)
+        return RESP.from_response(resp)
 
     async def post(
         self,
@@ -275,37 +811,29 @@ class HandOver:
             data (Optional[dict[Any, Any]]): Optional form data for the request body.
             files (Optional[dict[str, Any]]): Optional files for multipart/form-data requests.
             json (Optional[dict[str, Any]]): Optional JSON data for the request body.
-            **kwargs (Any): Additional arguments passed to httpx.AsyncClient.post().
+            **kwargs (Any): Additional arguments passed to httpx.AsyncClient.request(),
+                including `retry_policy` to override the retry settings for this request.
 
         Returns:
-            RESP: A dataclass containing:
-                - text: The response body as text
-                - url: The final URL after any redirects
-                - status_code: The HTTP status code
+            RESP: The response text and bytes (with `json()` to decode them), the final URL after any
+                redirects, the HTTP status code and headers, and timing and transfer sizes.
 
         Note:
             - Only one of `data`, `files`, or `json` should be provided.
-            - The client is automatically managed within a context manager.
+            - The client is automatically managed within a context manager, and transient
+              failures are retried according to the retry policy.
         """
-        async with ClientManager(
-            self.client,
-            self.proxies,
-            self.headers,
-            self.cookies,
-            self.timeout,
-            self.verify_ssl,
-            self.http2,
-        ) as client:
-            resp = await client.post(
-                url,
-                params=params,
-                headers=headers,
-                data=data,
-                files=files,
-                json=json,
-                **kwargs,
-            )
-            return RESP(resp.text, str(resp.url), resp.status_code)
+        resp = await self._request(
+            "POST",
+            url,
+            params=params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            **kwargs,
+        )
+        return RESP.from_response(resp)
 
     async def download(self, url: str, headers: dict[str, str] | None = None) -> bytes:
         """Download content from a URL with automatic client management.
@@ -318,16 +846,8 @@ class HandOver:
             bytes: The downloaded content as bytes.
 
         Note:
-            The client is automatically managed within a context manager.
+            The client is automatically managed within a context manager, and transient
+            failures are retried according to the retry policy.
         """
-        async with ClientManager(
-            self.client,
-            self.proxies,
-            self.headers,
-            self.cookies,
-            self.timeout,
-            self.verify_ssl,
-            self.http2,
-        ) as client:
-            resp = await client.get(url, headers=headers)
-            return resp.read()
+        resp = await self._request("GET", url, headers=headers)
+        return resp.content
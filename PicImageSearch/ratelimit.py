@@ -0,0 +1,161 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+
+
+class RateLimiter(ABC):
+    """Base class for async rate limiters.
+
+    Limits are tracked separately for each key (engines use the request host), so one
+    limiter instance can be attached to an engine and throttle each host it talks to.
+    Calls that exceed the limit wait in FIFO order instead of failing.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @abstractmethod
+    def _delay(self, key: str, now: float) -> float:
+        """Returns how many seconds must pass before a call for `key` is allowed."""
+
+    @abstractmethod
+    def _consume(self, key: str, now: float) -> None:
+        """Records a call for `key` at time `now`."""
+
+    def wait_time(self, key: str = "") -> float:
+        """Returns the current wait time before a call for `key` would be allowed.
+
+        Args:
+            key (str): The limiter key, usually a host name.
+
+        Returns:
+            float: Seconds to wait, or 0.0 if a call would be allowed right now.
+        """
+        return max(self._delay(key, time.monotonic()), 0.0)
+
+    async def acquire(self, key: str = "") -> None:
+        """Waits until a call for `key` is allowed and records it.
+
+        Args:
+            key (str): The limiter key, usually a host name.
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            while (delay := self._delay(key, time.monotonic())) > 0:
+                await asyncio.sleep(delay)
+            self._consume(key, time.monotonic())
+
+
+class TokenBucket(RateLimiter):
+    """Token bucket limiter allowing bursts of up to `calls` requests, refilled over `period` seconds.
+
+    Attributes:
+        calls (int): Bucket capacity, i.e. the largest allowed burst.
+        period (float): Seconds needed to refill a full bucket.
+    """
+
+    def __init__(self, calls: int, period: float):
+        """Initializes a token bucket.
+
+        Args:
+            calls (int): Maximum number of calls in a burst.
+            period (float): Time in seconds to refill `calls` tokens.
+        """
+        super().__init__()
+        self.calls: int = calls
+        self.period: float = period
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def _tokens(self, key: str, now: float) -> float:
+        tokens, updated = self._buckets.get(key, (float(self.calls), now))
+        return min(float(self.calls), tokens + (now - updated) * self.calls / self.period)
+
+    def _delay(self, key: str, now: float) -> float:
+        tokens = self._tokens(key, now)
+        return 0.0 if tokens >= 1 else (1 - tokens) * self.period / self.calls
+
+    def _consume(self, key: str, now: float) -> None:
+        self._buckets[key] = (self._tokens(key, now) - 1, now)
+
+
+class SlidingWindow(RateLimiter):
+    """Sliding window limiter allowing at most `calls` requests in any `period` seconds.
+
+    Attributes:
+        calls (int): Maximum number of calls within the window.
+        period (float): Window length in seconds.
+    """
+
+    def __init__(self, calls: int, period: float):
+        """Initializes a sliding window limiter.
+
+        Args:
+            calls (int): Maximum number of calls within the window.
+            period (float): Window length in seconds.
+        """
+        super().__init__()
+        self.calls: int = calls
+        self.period: float = period
+        self._windows: dict[str, deque[float]] = {}
+
+    def _delay(self, key: str, now: float) -> float:
+        window = self._windows.get(key)
+        if not window:
+            return 0.0
+        while window and window[0] <= now - self.period:
+            window.popleft()
+        return 0.0 if len(window) < self.calls else window[0] + self.period - now
+
+    def _consume(self, key: str, now: float) -> None:
+        self._windows.setdefault(key, deque()).append(now)
+
+
+class CompositeLimiter(RateLimiter):
+    """Combines several limiters; a call is allowed only when every limiter allows it.
+
+    Useful for services with both a short and a long window, e.g. SauceNAO's
+    4 searches per 30 seconds and 150 searches per day.
+    """
+
+    def __init__(self, *limiters: RateLimiter):
+        """Initializes a composite limiter.
+
+        Args:
+            *limiters (RateLimiter): The limiters that must all allow a call.
+        """
+        super().__init__()
+        self.limiters: tuple[RateLimiter, ...] = limiters
+
+    def _delay(self, key: str, now: float) -> float:
+        return max((limiter._delay(key, now) for limiter in self.limiters), default=0.0)
+
+    def _consume(self, key: str, now: float) -> None:
+        for limiter in self.limiters:
+            limiter._consume(key, now)
+
+
+DEFAULT_RATE_LIMITS: dict[str, Callable[[], RateLimiter]] = {
+    "saucenao": lambda: CompositeLimiter(SlidingWindow(4, 30), SlidingWindow(150, 86400)),
+    "tracemoe": lambda: TokenBucket(10, 60),
+    "iqdb": lambda: TokenBucket(3, 6),
+    "ascii2d": lambda: TokenBucket(2, 4),
+}
+"""Factories for the default rate limit profile of each engine, keyed by lowercase engine class name."""
+
+
+def default_rate_limiter(engine_name: str) -> RateLimiter | None:
+    """Creates the default rate limiter for an engine.
+
+    Args:
+        engine_name (str): Engine name, case-insensitive (e.g. "SauceNAO").
+
+    Returns:
+        Optional[RateLimiter]: A new limiter, or None if the engine has no default profile.
+    """
+    factory = DEFAULT_RATE_LIMITS.get(engine_name.lower())
+    return factory() if factory else None
@@ -0,0 +1,312 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from .engines.base import BaseSearchEngine
+from .model.base import BaseSearchResponse
+
+IMAGE_SUFFIXES: frozenset[str] = frozenset(
+    {".avif", ".bmp", ".gif", ".jpeg", ".jpg", ".jfif", ".png", ".tif", ".tiff", ".webp"}
+)
+"""File suffixes picked up when scanning a directory."""
+
+
+def iter_sources(target: str | Path) -> Iterator[str]:
+    """Lists the images to scan.
+
+    Args:
+        target (Union[str, Path]): A directory, walked recursively in sorted order for files with an
+            `IMAGE_SUFFIXES` suffix, or a list file with one path or URL per line (blank lines and
+            lines starting with "#" are skipped).
+
+    Yields:
+        str: Image paths and URLs.
+    """
+    target = Path(target)
+    if target.is_dir():
+        for root, dirs, files in os.walk(target):
+            dirs.sort()
+            for name in sorted(files):
+                if Path(name).suffix.lower() in IMAGE_SUFFIXES:
+                    yield os.path.join(root, name)
+    else:
+        with target.open(encoding="utf-8") as f:
+            for line in f:
+                if (line := line.strip()) and not line.startswith("#"):
+                    yield line
+
+
+def is_url(source: str) -> bool:
+    """Returns whether a scan source is an HTTP(S) URL rather than a file path."""
+    return source.startswith(("http://", "https://"))
+
+
+def serialize_response(response: BaseSearchResponse[Any]) -> dict[str, Any]:
+    """Converts a search response into the JSON-serializable summary written by `scan`.
+
+    Args:
+        response (BaseSearchResponse): The search response.
+
+    Returns:
+        dict[str, Any]: The response URL and the common fields of every result item.
+    """
+    return {
+        "url": response.url,
+        "items": [
+            {
+                "title": item.title,
+                "url": item.url,
+                "thumbnail": item.thumbnail,
+                "similarity": item.similarity,
+            }
+            for item in response.raw
+        ],
+    }
+
+
+@dataclass
+class _ScanItem:
+    source: str
+    digest: str | None = None
+    image: bytes | None = None
+    results: dict[str, Any] = field(default_factory=dict)
+    remaining: int = 0
+    failed: bool = False
+
+
+class ScanProgress:
+    """Tracks scan throughput and prints periodic progress lines.
+
+    Attributes:
+        done (int): Items finished in this run, including failed ones.
+        failed (int): Items with a read error or a failed engine search in this run.
+        skipped (int): Items skipped because the checkpoint lists them as finished.
+        total (Optional[int]): Items to process in this run, known once they have been counted.
+    """
+
+    def __init__(self, stream: TextIO | None = None, interval: float = 5.0):
+        """Initializes the progress tracker.
+
+        Args:
+            stream (Optional[TextIO]): Where to print progress lines, None to stay silent.
+            interval (float): Minimum seconds between two progress lines.
+        """
+        self.stream: TextIO | None = stream
+        self.interval: float = interval
+        self.done: int = 0
+        self.failed: int = 0
+        self.skipped: int = 0
+        self.total: int | None = None
+        self._start: float = time.monotonic()
+        self._last_report: float = self._start
+
+    @property
+    def rate(self) -> float:
+        """Finished items per second."""
+        elapsed = time.monotonic() - self._start
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated seconds until the scan finishes, None while unknown."""
+        if self.total is None or not self.rate:
+            return None
+        return (self.total - self.done) / self.rate
+
+    def advance(self, failed: bool = False) -> None:
+        """Counts one finished item, printing progress if the interval has passed.
+
+        Args:
+            failed (bool): Whether the item had a read error or a failed engine search.
+        """
+        self.done += 1
+        self.failed += failed
+        if (now := time.monotonic()) - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self) -> None:
+        """Prints a progress line."""
+        if self.stream is None:
+            return
+        total = "?" if self.total is None else str(self.total)
+        eta = "?" if (eta := self.eta) is None else time.strftime("%H:%M:%S", time.gmtime(eta))
+        print(
+            f"{self.done}/{total} done ({self.failed} failed, {self.skipped} skipped), "
+            f"{self.rate:.1f} items/s, ETA {eta}",
+            file=self.stream,
+            flush=True,
+        )
+
+
+def load_checkpoint(path: str | Path) -> set[str]:
+    """Reads the sources recorded as finished by a previous run.
+
+    Args:
+        path (Union[str, Path]): The checkpoint file.
+
+    Returns:
+        set[str]: Finished sources, empty if the file does not exist.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+async def scan(
+    target: str | Path,
+    engines: Mapping[BaseSearchEngine[Any], int],
+    output: str | Path,
+    checkpoint: str | Path | None = None,
+    errors: str | Path | None = None,
+    readers: int = 4,
+    queue_size: int = 64,
+    progress: ScanProgress | None = None,
+) -> ScanProgress:
+    """Searches every image of a directory or list file and writes the results as JSON lines.
+
+    The scan is a pipeline of stages joined by bounded queues, so memory use stays flat
+    on large inputs: walk sources → read and hash files → search on every engine (each
+    engine's cache, if set, is consulted first, keyed by the digest computed when reading)
+    → append to the output file.
+
+    Each output line holds the source, the image's SHA-256 (None for URLs) and, per engine,
+    a response summary. Once a line is written, the source is appended to the checkpoint file;
+    rerunning with the same checkpoint skips finished sources. Items that could not be read or
+    whose search failed on any engine go to the errors file instead, with an error message in
+    place of the failed engines' summaries, and are not checkpointed, so a rerun retries them.
+
+    Args:
+        target (Union[str, Path]): A directory or list file, see `iter_sources`.
+        engines (Mapping[BaseSearchEngine, int]): The engines to search with, mapped to how many
+            searches each may run concurrently.
+        output (Union[str, Path]): The JSONL output file, appended to.
+        checkpoint (Union[str, Path, None]): The checkpoint file. Defaults to `output` + ".checkpoint".
+        errors (Union[str, Path, None]): The JSONL file failed items are appended to. Defaults to
+            `output` + ".errors".
+        readers (int): Number of concurrent file readers.
+        queue_size (int): Capacity of each queue between stages.
+        progress (Optional[ScanProgress]): Progress tracker, a silent one by default.
+
+    Returns:
+        ScanProgress: The final progress counters.
+    """
+    checkpoint = Path(checkpoint) if checkpoint is not None else Path(f"{output}.checkpoint")
+    errors = Path(errors) if errors is not None else Path(f"{output}.errors")
+    progress = progress or ScanProgress()
+    finished = load_checkpoint(checkpoint)
+
+    sources: asyncio.Queue[str | None] = asyncio.Queue(queue_size)
+    engine_queues: dict[BaseSearchEngine[Any], asyncio.Queue[_ScanItem | None]] = {
+        engine: asyncio.Queue(queue_size) for engine in engines
+    }
+    sink: asyncio.Queue[_ScanItem | None] = asyncio.Queue(queue_size)
+
+    def count() -> int:
+        return sum(source not in finished for source in iter_sources(target))
+
+    async def count_sources() -> None:
+        # A separate pass, since the walk below waits on the bounded queue for most of the scan
+        progress.total = await asyncio.to_thread(count)
+
+    async def walk() -> None:
+        for source in iter_sources(target):
+            if source in finished:
+                progress.skipped += 1
+                continue
+            await sources.put(source)
+
+    async def read() -> None:
+        while (source := await sources.get()) is not None:
+            item = _ScanItem(source, remaining=len(engine_queues))
+            if not is_url(source):
+                try:
+                    item.image = await asyncio.to_thread(Path(source).read_bytes)
+                except OSError as e:
+                    item.results = {"error": f"{type(e).__name__}: {e}"}
+                    item.failed = True
+                    await sink.put(item)
+                    continue
+                item.digest = hashlib.sha256(item.image).hexdigest()
+            for queue in engine_queues.values():
+                await queue.put(item)
+
+    async def search(engine: BaseSearchEngine[Any]) -> None:
+        queue = engine_queues[engine]
+        name = type(engine).__name__
+        while (item := await queue.get()) is not None:
+            try:
+                if item.image is None or item.digest is None:
+                    response = await engine.search(url=item.source)
+                else:
+                    response = await engine.search_digest(item.image, item.digest)
+                item.results[name] = serialize_response(response)
+            except Exception as e:
+                item.results[name] = {"error": f"{type(e).__name__}: {e}"}
+                item.failed = True
+            item.remaining -= 1
+            if not item.remaining:
+                item.image = None
+                await sink.put(item)
+
+    async def write() -> None:
+        with (
+            open(output, "a", encoding="utf-8") as out,
+            open(checkpoint, "a", encoding="utf-8") as done,
+            open(errors, "a", encoding="utf-8") as failed,
+        ):
+            while (item := await sink.get()) is not None:
+                record = {"source": item.source, "sha256": item.digest, "results": item.results}
+                line = json.dumps(record, ensure_ascii=False) + "\n"
+                if item.failed:
+                    failed.write(line)
+                    failed.flush()
+                else:
+                    out.write(line)
+                    out.flush()
+                    done.write(item.source + "\n")
+                    done.flush()
+                progress.advance(item.failed)
+
+    counter = asyncio.create_task(count_sources())
+    walker = asyncio.create_task(walk())
+    reader_tasks = [asyncio.create_task(read()) for _ in range(readers)]
+    search_tasks = [
+        asyncio.create_task(search(engine)) for engine, concurrency in engines.items() for _ in range(concurrency)
+    ]
+    writer = asyncio.create_task(write())
+
+    async def shut_down() -> None:
+        # Each stage is told to stop once the stage feeding it has drained
+        await walker
+        for _ in reader_tasks:
+            await sources.put(None)
+        await asyncio.gather(*reader_tasks)
+        for engine, concurrency in engines.items():
+            for _ in range(concurrency):
+                await engine_queues[engine].put(None)
+        await asyncio.gather(*search_tasks)
+        await sink.put(None)
+        await writer
+
+    tasks = [asyncio.create_task(shut_down()), counter, walker, *reader_tasks, *search_tasks, writer]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if (error := task.exception()) is not None:
+                raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    progress.report()
+    return progress
@@ -3,38 +3,112 @@ Rewrites all public asynchronous methods in the library's public interface for s
 Useful for scripts, with low runtime overhead. Ideal for synchronous calls preference over managing an event loop.
 
 Automatically wraps asynchronous methods of specified classes, enabling synchronous calls.
+
+Classes are imported and patched when first accessed through this module, e.g.
+`from PicImageSearch.sync import Iqdb`; classes never accessed through it stay asynchronous.
+
+All calls run on one event loop in a dedicated background thread, so calls from several threads
+overlap and pooled clients keep their connections between calls. `shutdown()` stops the loop; it
+is registered to run at interpreter exit.
 """
 
 import asyncio
+import atexit
 import functools
 import inspect
+import threading
 from collections.abc import Callable, Coroutine
-from typing import Any
-
-from . import (
-    AnimeTrace,
-    Ascii2D,
-    BaiDu,
-    Bing,
-    Copyseeker,
-    EHentai,
-    Google,
-    GoogleLens,
-    Iqdb,
-    Lenso,
-    Network,
-    SauceNAO,
-    Tineye,
-    TraceMoe,
-    Yandex,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        AnimeTrace,
+        Ascii2D,
+        BaiDu,
+        Bing,
+        Copyseeker,
+        EHentai,
+        Google,
+        GoogleLens,
+        Iqdb,
+        Lenso,
+        Network,
+        SauceNAO,
+        Tineye,
+        TraceMoe,
+        Yandex,
+    )
+
+
+class _LoopThread:
+    """Runs an event loop forever in a daemon thread, started on first use."""
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="PicImageSearch-sync", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def is_current(self) -> bool:
+        return self._thread is not None and self._thread is threading.current_thread()
+
+    def stop(self, timeout: float | None) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        async def cleanup() -> None:
+            from .network import default_registry
+
+            await default_registry.aclose()
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(cleanup(), loop).result(timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+
+
+_runner = _LoopThread()
+
+
+def shutdown(timeout: float | None = 5.0) -> None:
+    """Closes the shared client registry and stops the background event loop.
+
+    Later synchronous calls start a new loop. Pooled clients owned by engines are bound to
+    the stopped loop, so close engines (`engine.close()`) before shutting down.
+
+    Args:
+        timeout (Optional[float]): Seconds to wait for cleanup and for the thread to exit.
+    """
+    _runner.stop(timeout)
+
+
+atexit.register(shutdown)
 
 
 def _syncify_wrap(class_type: type, method_name: str) -> None:
     """Wrap an asynchronous method of a class for synchronous calling.
 
-    Creates a synchronous version of the specified asynchronous method.
-    Checks if the event loop is running; if not, runs it until method completion.
+    Creates a synchronous version of the specified asynchronous method, which submits the
+    coroutine to the background event loop and blocks until it completes. Called from code
+    already running on another event loop, it returns an awaitable of the result instead;
+    called from the background loop itself (nested calls), it returns the coroutine.
     Original asynchronous method remains accessible via `__tl.sync` attribute.
 
     Args:
@@ -49,12 +123,20 @@ def _syncify_wrap(class_type: type, method_name: str) -> None:
     @functools.wraps(method)
     def syncified(*args: Any, **kwargs: Any) -> Any:
         coro: Coroutine[None, None, Any] = method(*args, **kwargs)
+        if _runner.is_current():
+            return coro
+        future = asyncio.run_coroutine_threadsafe(coro, _runner.loop)
         try:
-            loop = asyncio.get_event_loop()
+            asyncio.get_running_loop()
         except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return coro if loop.is_running() else loop.run_until_complete(coro)
+            pass
+        else:
+            return asyncio.wrap_future(future)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
 
     setattr(syncified, "__tl.sync", method)
     setattr(class_type, method_name, syncified)
@@ -76,24 +158,6 @@ def syncify(*classes: type) -> None:
                 _syncify_wrap(c, name)
 
 
-syncify(
-    AnimeTrace,
-    Ascii2D,
-    BaiDu,
-    Bing,
-    Copyseeker,
-    EHentai,
-    Google,
-    GoogleLens,
-    Iqdb,
-    Lenso,
-    Network,
-    SauceNAO,
-    Tineye,
-    TraceMoe,
-    Yandex,
-)
-
 __all__ = [
     "AnimeTrace",
     "Ascii2D",
@@ -110,4 +174,19 @@ __all__ = [
     "Tineye",
     "TraceMoe",
     "Yandex",
+    "shutdown",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Classes are imported and syncified on first access (PEP 562), keeping this module cheap to import
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    class_type = getattr(import_module(".", __package__), name)
+    syncify(class_type)
+    globals()[name] = class_type
+    return class_type
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,105 @@
+import json
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from lxml.html import fromstring
-from pyquery import PyQuery
+if TYPE_CHECKING:
+    from pyquery import PyQuery
+
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # optional: pip install PicImageSearch[orjson]
+    _orjson_loads = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decodes a JSON document, with `orjson` when it is installed and the standard library otherwise.
+
+    Both accept the raw response bytes, so JSON bodies are decoded without building a `str`
+    first. Decoding errors are `json.JSONDecodeError` (a `ValueError`) in both cases.
+
+    Args:
+        data (Union[str, bytes]): The JSON document, bytes being UTF-8 encoded.
+
+    Returns:
+        Any: The decoded value.
+
+    Note:
+        `orjson` is stricter than the standard library: it rejects `NaN`/`Infinity` and
+        integers wider than 64 bits, which the JSON APIs used here never send.
+    """
+    if _orjson_loads is not None:
+        return _orjson_loads(data)
+    return json.loads(data)
+
+
+_LIST_KEY = re.compile(r"(\S+)?\[(\d+)]")
+
+
+class CompiledPath:
+    """A `deep_get` path, parsed once into its lookup steps.
+
+    Calling it looks the path up in a nested dictionary with the same results as `deep_get`,
+    without splitting the path and matching its keys on every call.
+
+    Attributes:
+        path (str): The dot-separated path.
+
+    Examples:
+        >>> sites = compile_path("initialState.cbirSites.sites")
+        >>> sites({"initialState": {"cbirSites": {"sites": []}}})
+        []
+    """
+
+    __slots__ = ("_steps", "path")
+
+    def __init__(self, path: str):
+        """Parses a path.
+
+        Args:
+            path (str): A dot-separated string of keys, which can include list indices in square brackets.
+        """
+        self.path: str = path
+        # (key, None) looks a key up; (key, index) looks the key up, if any, then the index
+        self._steps: tuple[tuple[str | None, int | None], ...] = tuple(
+            (list_key[1], int(list_key[2])) if (list_key := _LIST_KEY.search(key)) else (key, None)
+            for key in path.split(".")
+        )
+
+    def __repr__(self) -> str:
+        return f"CompiledPath({self.path!r})"
+
+    def __call__(self, dictionary: dict[str, Any]) -> Any | None:
+        """Looks the path up, see `deep_get`."""
+        value: Any = dictionary
+        for key, index in self._steps:
+            if index is None:
+                try:
+                    value = value[key]
+                except (KeyError, TypeError):
+                    return None
+            else:
+                try:
+                    if key:
+                        value = value[key]
+                    value = value[index]
+                except (KeyError, IndexError):
+                    return None
+        return value
+
+
+@lru_cache(maxsize=512)
+def compile_path(path: str) -> CompiledPath:
+    """Parses a `deep_get` path once, returning a cached accessor.
+
+    Args:
+        path (str): A dot-separated string of keys, which can include list indices in square brackets.
+
+    Returns:
+        CompiledPath: The accessor, shared by every caller with the same path.
+    """
+    return CompiledPath(path)
 
 
 def deep_get(dictionary: dict[str, Any], keys: str) -> Any | None:
@@ -14,6 +110,9 @@ def deep_get(dictionary: dict[str, Any], keys: str) -> Any | None:
     - List index: 'key1[0]'
     - Combined: 'key1[0].key2'
 
+    The path is parsed once and cached (see `compile_path`); code running the same lookup in
+    a loop can hold on to the compiled path instead.
+
     Args:
         dictionary (dict[str, Any]): The nested dictionary to search in.
         keys (str): A dot-separated string of keys, which can include list indices in square brackets.
@@ -28,20 +127,7 @@ def deep_get(dictionary: dict[str, Any], keys: str) -> Any | None:
         >>> deep_get(data, 'a.b[1]')
         None
     """
-    for key in keys.split("."):
-        if list_search := re.search(r"(\S+)?\[(\d+)]", key):
-            try:
-                if list_search[1]:
-                    dictionary = dictionary[list_search[1]]
-                dictionary = dictionary[int(list_search[2])]  # pyright: ignore[reportArgumentType]
-            except (KeyError, IndexError):
-                return None
-        else:
-            try:
-                dictionary = dictionary[key]
-            except (KeyError, TypeError):
-                return None
-    return dictionary
+    return compile_path(keys)(dictionary)
 
 
 def read_file(file: str | bytes | Path) -> bytes:
@@ -80,7 +166,7 @@ def read_file(file: str | bytes | Path) -> bytes:
         raise OSError(f"An I/O error occurred while reading the file {file}: {e}") from e
 
 
-def parse_html(html: str) -> PyQuery:
+def parse_html(html: str) -> "PyQuery":
     """Parses HTML content into a PyQuery object using UTF-8 encoding.
 
     This function creates a PyQuery object from HTML string content,
@@ -96,4 +182,8 @@ def parse_html(html: str) -> PyQuery:
         Uses lxml's HTMLParser with explicit UTF-8 encoding to prevent
         potential character encoding issues.
     """
+    # Imported here so engines with JSON APIs never load lxml and pyquery
+    from lxml.html import fromstring
+    from pyquery import PyQuery
+
     return PyQuery(fromstring(html))
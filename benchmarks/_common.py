@@ -0,0 +1,18 @@
+"""Helpers shared by the benchmark scripts."""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+
+def best(func: Callable[[], Any], runs: int, number: int = 1) -> float:
+    """Returns the fastest of `runs` timings of `number` calls to `func`, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=runs))
+
+
+def description(doc: str | None) -> str:
+    """Returns the first line of a script's docstring, for its argument parser.
+
+    Docstrings are stripped under `python -OO`, in which case the description is empty.
+    """
+    return doc.splitlines()[0] if doc else ""
@@ -0,0 +1,66 @@
+"""Nested lookup micro-benchmark.
+
+Times `deep_get` on the paths the models use, against the previous implementation (which
+split the path and matched a regex on every key, on every call) and against holding the
+`compile_path` accessor, as the models do.
+
+Usage (from the repository root):
+    python -m benchmarks.deep_get [--number N]
+"""
+
+import argparse
+import re
+from typing import Any
+
+from benchmarks._common import best, description
+from PicImageSearch.utils import compile_path, deep_get
+
+DATA: dict[str, Any] = {
+    "initialState": {"cbirSites": {"sites": [{"url": "https://example.com"}]}},
+    "urlList": [{"title": "Title", "sourceUrl": "https://example.com"}],
+    "data": {"list": [1, 2, 3], "url": "https://example.com"},
+    "title": ["Title"],
+}
+PATHS = ["initialState.cbirSites.sites", "urlList[0].sourceUrl", "data.list", "title[0]", "data.missing.key"]
+
+
+def regex_deep_get(dictionary: dict[str, Any], keys: str) -> Any | None:
+    """The regex-per-key implementation `deep_get` replaced."""
+    for key in keys.split("."):
+        if list_search := re.search(r"(\S+)?\[(\d+)]", key):
+            try:
+                if list_search[1]:
+                    dictionary = dictionary[list_search[1]]
+                dictionary = dictionary[int(list_search[2])]  # pyright: ignore[reportArgumentType]
+            except (KeyError, IndexError):
+                return None
+        else:
+            try:
+                dictionary = dictionary[key]
+            except (KeyError, TypeError):
+                return None
+    return dictionary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--number", type=int, default=100_000, help="lookups per timing (default: 100000)")
+    args = parser.parse_args()
+
+    print(f"{'path':<30} {'regex ns':>9} {'deep_get ns':>12} {'compiled ns':>12} {'speedup':>8}")
+    for path in PATHS:
+        compiled = compile_path(path)
+        assert regex_deep_get(DATA, path) == deep_get(DATA, path) == compiled(DATA)
+        timings = [
+            best(func, 5, number=args.number) / args.number * 1e9
+            for func in (
+                lambda: regex_deep_get(DATA, path),
+                lambda: deep_get(DATA, path),
+                lambda: compiled(DATA),
+            )
+        ]
+        print(f"{path:<30} {timings[0]:>9.0f} {timings[1]:>12.0f} {timings[2]:>12.0f} {timings[0] / timings[2]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Import-time benchmark.
+
+Measures, in fresh interpreters, how long common import statements take, e.g. for CLI
+tools and serverless cold starts that only use one or two engines.
+
+Usage (from the repository root):
+    python -m benchmarks.import_time [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from benchmarks._common import description
+
+STATEMENTS: dict[str, str] = {
+    "package": "import PicImageSearch",
+    "one HTML engine": "from PicImageSearch import Iqdb",
+    "one JSON engine": "from PicImageSearch import SauceNAO",
+    "one engine (sync)": "from PicImageSearch.sync import Iqdb",
+    "all engines": "from PicImageSearch.engines import *",
+}
+
+_TIMER = "import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    """Times an import statement in `runs` fresh interpreters, in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        timings.append(float(output) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--runs", type=int, default=10, help="interpreters per statement (default: 10)")
+    args = parser.parse_args()
+
+    print(f"{'statement':<20} {'median ms':>10} {'min ms':>10}")
+    for name, statement in STATEMENTS.items():
+        timings = measure(statement, args.runs)
+        print(f"{name:<20} {statistics.median(timings):>10.1f} {min(timings):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""JSON response decoding benchmark.
+
+Times turning a JSON response body into Python objects: the previous path (decode the
+bytes to `str` as `httpx.Response.text` does for UTF-8, then `json.loads`), the standard library on
+the raw bytes, and `orjson` on the raw bytes when it is installed (what `RESP.json()` uses).
+Runs on recorded payloads given as arguments, or on synthetic SauceNAO payloads (see `pages.py`).
+
+Usage (from the repository root):
+    python -m benchmarks.json_decode [--runs N] [PAYLOAD.json ...]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from benchmarks import pages
+from benchmarks._common import best, description
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("payloads", nargs="*", type=Path, help="recorded JSON response bodies")
+    parser.add_argument("--runs", type=int, default=50, help="timing runs, the fastest is kept (default: 50)")
+    args = parser.parse_args()
+
+    if args.payloads:
+        cases = {path.name: path.read_bytes() for path in args.payloads}
+    else:
+        cases = {f"saucenao, {n} results": json.dumps(pages.saucenao(n)).encode() for n in (8, 100, 1000)}
+
+    print(
+        f"{'payload':<24} {'size KiB':>9} {'text+json ms':>13} {'json bytes ms':>14} {'orjson ms':>10} {'speedup':>8}"
+    )
+    for name, body in cases.items():
+        previous = best(lambda: json.loads(body.decode("utf-8", errors="replace")), args.runs)
+        stdlib = best(lambda: json.loads(body), args.runs)
+        fastest = stdlib
+        if orjson is not None:
+            loads = orjson.loads
+            fastest = best(lambda: loads(body), args.runs)
+        orjson_column = f"{fastest * 1e3:>10.3f}" if orjson is not None else f"{'n/a':>10}"
+        print(
+            f"{name:<24} {len(body) / 1024:>9.0f} {previous * 1e3:>13.3f} {stdlib * 1e3:>14.3f} {orjson_column} "
+            f"{previous / fastest:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Google Lens image map extraction benchmark.
+
+Compares building the thumbnail maps of a Lens page (`google.ldi` URLs and `_setImagesSrc`
+base64 images) by scanning the raw page (`scan_image_maps`, what the Lens models do) with
+selecting and reading every `<script nonce>` element of the parsed DOM (`extract_image_maps`).
+Runs on recorded pages given as arguments, or on synthetic pages (see `pages.py`).
+
+Usage (from the repository root):
+    python -m benchmarks.lens_scripts [--runs N] [PAGE.html ...]
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks import pages
+from benchmarks._common import best, description
+from PicImageSearch.model.google_lens import extract_image_maps, scan_image_maps
+from PicImageSearch.utils import parse_html
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("pages", nargs="*", type=Path, help="recorded Google Lens result pages (HTML files)")
+    parser.add_argument("--runs", type=int, default=20, help="timing runs, the fastest is kept (default: 20)")
+    args = parser.parse_args()
+
+    if args.pages:
+        cases = {path.name: path.read_text(encoding="utf-8") for path in args.pages}
+    else:
+        cases = {f"synthetic, {n} results": pages.google_lens(n) for n in (10, 50, 200)}
+
+    print(f"{'page':<24} {'size KiB':>9} {'scan ms':>8} {'DOM ms':>8} {'speedup':>8}")
+    for name, html in cases.items():
+        document = parse_html(html)
+        if scan_image_maps(html) != extract_image_maps(document):
+            print(f"{name:<24} scan and DOM results differ, skipped")
+            continue
+        scan_time = best(lambda: scan_image_maps(html), args.runs)
+        # The DOM is already parsed for the result items, so only the script lookups are timed
+        dom_time = best(lambda: extract_image_maps(document), args.runs)
+        print(
+            f"{name:<24} {len(html.encode()) / 1024:>9.0f} {scan_time * 1e3:>8.2f} {dom_time * 1e3:>8.2f} "
+            f"{dom_time / scan_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
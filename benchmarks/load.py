@@ -0,0 +1,267 @@
+"""Load generator for the engines, run against the local mock server.
+
+Starts `mock_server.MockServer` on a thread of its own, then keeps `--concurrency` searches per
+engine running for `--duration` seconds through the engines' real code paths (`search`, the
+retry loop, the parse executor). Reports:
+    - searches and HTTP requests per second, and failed searches, per engine;
+    - p50/p95/p99 latency of every request step and of parsing (collected with `EngineHooks`),
+      and of whole searches;
+    - the connection reuse ratio: the share of requests that did not open a new connection;
+    - event loop lag: how late a 10 ms timer on the driver's loop fires;
+    - resident memory growth over the run.
+
+Run it once per configuration to compare pooled and per-request clients, HTTP/1.1 and HTTP/2, or
+parse executors on the same machine. Engines are created without rate limiters. The server shares
+the process, and so the GIL, with the driver: absolute numbers are pessimistic, but configurations
+compared on the same machine are measured alike.
+
+Usage (from the repository root):
+    python -m benchmarks.load [--engines NAME ...] [--concurrency N] [--duration S] [--no-pool] [--http2]
+        [--parse-executor {default,thread,inline,process}] [--latency S] [--jitter S] [--error-rate P]
+        [--throttle-rate P] [--max-rps N] [--retry-after S] [--results N]
+"""
+
+import argparse
+import asyncio
+import re
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from benchmarks._common import description
+from benchmarks.memory import rss
+from benchmarks.mock_server import ENGINES, Behaviour, MockServer
+from PicImageSearch.engines.base import BaseSearchEngine
+from PicImageSearch.hooks import EngineHooks
+from PicImageSearch.network import DEFAULT_LIMITS, RESP
+
+IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(4096)
+"""The searched image: a PNG signature and some padding, since the mock server does not decode it."""
+
+_ID_SEGMENT = re.compile(r"/[0-9a-f]{16,}(?=/|$)")
+
+
+class StepTimer(EngineHooks):
+    """Collects request and parse latencies per engine and step.
+
+    Steps are named after the request method and path under the engine's prefix, with ids replaced
+    by `{id}`, e.g. `POST /upload` or `GET /api/v1/search/get_domains/{id}`.
+
+    Attributes:
+        samples (defaultdict[tuple[str, str], list[float]]): Latencies in seconds, by engine and step.
+    """
+
+    def __init__(self) -> None:
+        self.samples: defaultdict[tuple[str, str], list[float]] = defaultdict(list)
+
+    def on_request_end(
+        self,
+        engine: BaseSearchEngine[Any],
+        method: str,
+        url: str,
+        resp: RESP | None,
+        elapsed: float,
+        error: BaseException | None,
+    ) -> None:
+        _, _, path = urlsplit(url).path.lstrip("/").partition("/")
+        step = _ID_SEGMENT.sub("/{id}", f"/{path}")
+        self.samples[type(engine).__name__, f"{method} {step}"].append(elapsed)
+
+    def on_parse_end(
+        self,
+        engine: BaseSearchEngine[Any],
+        response_cls: type,
+        elapsed: float,
+        error: BaseException | None,
+    ) -> None:
+        self.samples[type(engine).__name__, "parse"].append(elapsed)
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """Returns the nearest-rank `p`th percentile of sorted `samples`."""
+    return samples[min(len(samples) - 1, max(0, round(p / 100 * len(samples)) - 1))]
+
+
+@contextmanager
+def serve_in_thread(behaviour: Behaviour) -> Iterator[MockServer]:
+    """Runs a mock server on a separate thread and event loop, so it does not share the driver's loop."""
+    server = MockServer(behaviour)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="mock-server", daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def measure_lag(samples: list[float], interval: float = 0.01) -> None:
+    """Records how late a timer of `interval` seconds fires on the running loop, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(loop.time() - start - interval)
+
+
+async def warm_up(engine: BaseSearchEngine[Any]) -> None:
+    """Runs one search ahead of the measurement: imports, selector compilation, executor start."""
+    try:
+        await engine.search(file=IMAGE)
+    except Exception:
+        pass  # failures are counted in the measured run
+
+
+async def keep_searching(
+    engine: BaseSearchEngine[Any],
+    deadline: float,
+    durations: list[float],
+    errors: defaultdict[str, int],
+) -> None:
+    """Runs searches back to back until `deadline`, recording their durations and failures."""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            await engine.search(file=IMAGE)
+        except Exception as e:
+            errors[type(e).__name__] += 1
+        else:
+            durations.append(time.perf_counter() - start)
+
+
+async def run(args: argparse.Namespace, server: MockServer) -> None:
+    executor: Executor | bool | None = {"thread": True, "inline": False}.get(args.parse_executor)
+    if args.parse_executor == "process":
+        executor = ProcessPoolExecutor()
+    timer = StepTimer()
+
+    def make_engine(name: str) -> BaseSearchEngine[Any]:
+        kwargs: dict[str, Any] = {"rate_limiter": False, "parse_executor": executor, "hooks": [timer]}
+        if args.http2:
+            # Cleartext HTTP/2 needs prior knowledge, which the engines' own clients do not use.
+            kwargs["client"] = httpx.AsyncClient(http1=False, http2=True, limits=DEFAULT_LIMITS, timeout=30)
+        else:
+            kwargs["reuse_client"] = not args.no_pool
+        return server.engine(name, **kwargs)
+
+    engines = {name: make_engine(name) for name in args.engines}
+    await asyncio.gather(*(warm_up(engine) for engine in engines.values()))
+    timer.samples.clear()
+
+    durations: dict[str, list[float]] = {name: [] for name in engines}
+    errors: dict[str, defaultdict[str, int]] = {name: defaultdict(int) for name in engines}
+    lag: list[float] = []
+    connections, requests = server.stats.connections, dict(server.stats.responses)
+    rss_before = rss()
+
+    lag_task = asyncio.ensure_future(measure_lag(lag))
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(
+        *(
+            keep_searching(engine, deadline, durations[name], errors[name])
+            for name, engine in engines.items()
+            for _ in range(args.concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    lag_task.cancel()
+    rss_growth = rss() - rss_before
+
+    for engine in engines.values():
+        if engine.client is not None:
+            await engine.client.aclose()
+        await engine.close()
+    if isinstance(executor, ProcessPoolExecutor):
+        executor.shutdown()
+
+    new_connections = server.stats.connections - connections
+    per_engine = {
+        name: sum(count for (engine, _), count in server.stats.responses.items() if engine == name)
+        - sum(count for (engine, _), count in requests.items() if engine == name)
+        for name in engines
+    }
+    total_requests = sum(per_engine.values())
+
+    client = "HTTP/2" if args.http2 else "HTTP/1.1, " + ("per-request clients" if args.no_pool else "pooled")
+    print(f"{args.concurrency} concurrent searches per engine for {elapsed:.1f}s ({client}, {args.parse_executor})")
+    print(f"\n{'engine':<12} {'searches/s':>10} {'requests/s':>10} {'failed':>7}  errors")
+    for name, engine in engines.items():
+        failed = sum(errors[name].values())
+        kinds = ", ".join(f"{kind} x{count}" for kind, count in errors[name].items())
+        print(
+            f"{type(engine).__name__:<12} {len(durations[name]) / elapsed:>10.1f} "
+            f"{per_engine[name] / elapsed:>10.1f} {failed:>7}  {kinds}"
+        )
+
+    print(f"\n{'engine':<12} {'step':<40} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    rows = [((type(engines[name]).__name__, "search"), durations[name]) for name in engines]
+    for key, samples in sorted([*timer.samples.items(), *rows]):
+        if samples:
+            samples = sorted(samples)
+            print(
+                f"{key[0]:<12} {key[1]:<40} {len(samples):>6} {percentile(samples, 50) * 1e3:>8.1f} "
+                f"{percentile(samples, 95) * 1e3:>8.1f} {percentile(samples, 99) * 1e3:>8.1f}"
+            )
+
+    lag.sort()
+    reuse = 1 - new_connections / total_requests if total_requests else 0.0
+    print(f"\nconnections opened: {new_connections} for {total_requests} requests (reuse ratio {reuse:.1%})")
+    if lag:
+        print(
+            f"event loop lag: p50 {percentile(lag, 50) * 1e3:.1f} ms, p99 {percentile(lag, 99) * 1e3:.1f} ms, "
+            f"max {lag[-1] * 1e3:.1f} ms"
+        )
+    print(f"RSS growth: {rss_growth / 2**20:.1f} MiB (includes the mock server thread)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES), help="engines to load")
+    parser.add_argument("--concurrency", type=int, default=10, help="concurrent searches per engine (default: 10)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run (default: 10)")
+    parser.add_argument("--no-pool", action="store_true", help="build a new client for every request")
+    parser.add_argument("--http2", action="store_true", help="use HTTP/2 (prior knowledge) instead of HTTP/1.1")
+    parser.add_argument(
+        "--parse-executor",
+        choices=("default", "thread", "inline", "process"),
+        default="default",
+        help="where responses are parsed: the engine default, the loop's thread pool, inline or a process pool",
+    )
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency per response (default: 0.02)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra server latency (default: 0.01)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 responses (default: 0)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of 429 responses (default: 0)")
+    parser.add_argument("--max-rps", type=float, help="per-engine request rate answered with 429s above it")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After of 429 responses (default: 0)")
+    parser.add_argument("--results", type=int, default=50, help="result items per response (default: 50)")
+    args = parser.parse_args()
+    if args.http2 and args.no_pool:
+        parser.error("--http2 uses one pooled client per engine and cannot be combined with --no-pool")
+
+    behaviour = Behaviour(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        max_rps=args.max_rps,
+        retry_after=args.retry_after,
+        results=args.results,
+    )
+    with serve_in_thread(behaviour) as server:
+        asyncio.run(run(args, server))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Retained memory benchmark.
+
+Parses synthetic result pages (see `pages.py`) until 1,000 results are held, keeps every
+response, and reports the memory retained per 1,000 results with `keep_origin` on (the
+default) and off. Each case runs in a fresh interpreter and is measured as the growth of the
+process's resident set: the parsed HTML trees live in libxml2 memory, which `tracemalloc`
+does not see.
+
+Usage (from the repository root):
+    python -m benchmarks.memory [--results N] [--per-page N]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks import pages
+from benchmarks._common import description
+from PicImageSearch.model import (
+    Ascii2DResponse,
+    EHentaiResponse,
+    GoogleLensResponse,
+    IqdbResponse,
+    SauceNAOResponse,
+)
+
+CASES: dict[str, tuple[Callable[[int], Any], Callable[..., Any]]] = {
+    "saucenao": (
+        lambda n: json.dumps(pages.saucenao(n)),
+        lambda page, **kw: SauceNAOResponse(json.loads(page), "", **kw),
+    ),
+    "ascii2d": (pages.ascii2d, lambda page, **kw: Ascii2DResponse(page, "", **kw)),
+    "ehentai": (pages.ehentai, lambda page, **kw: EHentaiResponse(page, "", **kw)),
+    "iqdb": (pages.iqdb, lambda page, **kw: IqdbResponse(page, "", **kw)),
+    "google lens": (pages.google_lens, lambda page, **kw: GoogleLensResponse(page, "", **kw)),
+}
+
+
+def rss() -> int:
+    """Returns the resident set size of the process in bytes, or its peak where unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def release_free_memory() -> None:
+    """Collects garbage and, on glibc, hands freed heap pages back to the system."""
+    gc.collect()
+    if (libc := ctypes.util.find_library("c")) is not None:
+        trim = getattr(ctypes.CDLL(libc), "malloc_trim", None)
+        if trim is not None:
+            trim(0)
+
+
+def measure(name: str, results: int, per_page: int, keep_origin: bool) -> tuple[int, int]:
+    """Parses and keeps `results` results of a case, returning the retained bytes and item count."""
+    build, parse = CASES[name]
+    page = build(per_page)
+    parse(page)  # warm-up: imports, selector compilation, allocator pools
+    release_free_memory()
+    before = rss()
+    responses = [parse(page, keep_origin=keep_origin) for _ in range(-(-results // per_page))]
+    release_free_memory()
+    return rss() - before, sum(len(response.raw) for response in responses)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--results", type=int, default=1000, help="results to hold per case (default: 1000)")
+    parser.add_argument("--per-page", type=int, default=50, help="result items per page (default: 50)")
+    parser.add_argument("--measure", choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument("--drop-origin", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(*measure(args.measure, args.results, args.per_page, keep_origin=not args.drop_origin))
+        return
+
+    def run(name: str, drop: bool) -> float:
+        command = [sys.executable, "-m", "benchmarks.memory", "--measure", name, "--results", str(args.results)]
+        command += ["--per-page", str(args.per_page)] + (["--drop-origin"] if drop else [])
+        retained, items = map(int, subprocess.check_output(command, text=True).split())
+        return retained / items * 1000 / 1024
+
+    print(f"{'page':<14} {'keep_origin KiB/1k':>19} {'dropped KiB/1k':>15} {'saved':>7}")
+    for name in CASES:
+        kept, dropped = run(name, False), run(name, True)
+        print(f"{name:<14} {kept:>19.0f} {dropped:>15.0f} {1 - dropped / kept:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
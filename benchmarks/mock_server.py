@@ -0,0 +1,474 @@
+"""Local stand-in server for the multi-step engine protocols, for offline load tests.
+
+Emulates, on one localhost port and each under its own path prefix, the request flows of:
+    - SauceNAO (`/saucenao`): the `search.php` JSON API.
+    - Bing (`/bing`): image upload or URL page (skey, imageSignature, BCID), then the knowledge API.
+    - Copyseeker (`/copyseeker`): SetCookie action, discovery action, then the results RSC lines.
+    - BaiDu (`/baidu`): upload returning `data.url`, the `cardData` page, then the `simipic` API.
+    - Tineye (`/tineye`): `result_json`, then `get_domains`.
+
+Point an engine at it with `MockServer.base_url(name)` (or build one with `MockServer.engine(name)`).
+Every response can be delayed, and requests can fail with 503s or be throttled with 429s, at random
+or above a per-engine request rate. Bodies are the synthetic pages of `pages.py`. The server speaks
+HTTP/1.1 with keep-alive and cleartext HTTP/2 with prior knowledge (`httpx.AsyncClient(http1=False,
+http2=True)`), and counts connections and responses, so clients can be compared on connection
+reuse as well as throughput and latency.
+
+Usage (from the repository root):
+    python -m benchmarks.mock_server [--port N] [--latency S] [--jitter S] [--error-rate P]
+        [--throttle-rate P] [--max-rps N] [--retry-after S] [--results N]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from base64 import b64encode
+from collections import Counter
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from types import TracebackType
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+from typing_extensions import Self
+
+from benchmarks import pages
+from benchmarks._common import description
+from PicImageSearch.constants import COPYSEEKER_CONSTANTS
+from PicImageSearch.engines import BaiDu, Bing, Copyseeker, SauceNAO, Tineye
+from PicImageSearch.engines.base import BaseSearchEngine
+
+ENGINES: dict[str, type[BaseSearchEngine[Any]]] = {
+    "saucenao": SauceNAO,
+    "bing": Bing,
+    "copyseeker": Copyseeker,
+    "baidu": BaiDu,
+    "tineye": Tineye,
+}
+"""Emulated engines, by the path prefix they are served under."""
+
+_BING_SIGNATURE = "1|mock-image-signature|1700000000"
+_BING_SIGNATURE_KEY = "AAAAC3NzaC1lZDI1NTE5AAAAIGd3gMN2v1KRLBGmotz7jbQYF8PaB+Jpe6iVf2YIeN5b"
+_H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+_COPYSEEKER_HEAD = '0:{"a":"$@1","f":"","b":"mock"}\n'
+
+Response = tuple[int, str, bytes, dict[str, str]]
+"""Status code, content type, body and extra headers."""
+
+
+@dataclass
+class Behaviour:
+    """How the server answers requests.
+
+    Attributes:
+        latency (float): Seconds every response is delayed by, like server think time.
+        jitter (float): Extra delay per response, drawn uniformly from [0, jitter] seconds.
+        error_rate (float): Fraction of requests answered with a 503.
+        throttle_rate (float): Fraction of requests answered with a 429.
+        max_rps (Optional[float]): Requests per second each engine accepts (bursting up to one second's
+            worth); requests over it are answered with a 429.
+        retry_after (float): `Retry-After` of 429 responses, in seconds.
+        results (int): Result items per search response, fixed when the server starts.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    max_rps: float | None = None
+    retry_after: float = 1.0
+    results: int = 50
+
+
+@dataclass
+class Stats:
+    """Traffic counters of a `MockServer`.
+
+    Attributes:
+        connections (int): TCP connections accepted.
+        responses (Counter[tuple[str, int]]): Responses sent, by engine prefix and status code.
+    """
+
+    connections: int = 0
+    responses: Counter[tuple[str, int]] = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        """Total number of requests answered."""
+        return sum(self.responses.values())
+
+
+@dataclass
+class _Request:
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes
+
+
+def _json(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+def _header_text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _encrypt_signature(signature: str) -> str:
+    """The inverse of `engines.bing._parse_signature`, so the engine decodes the mock signature."""
+    version, data, timestamp = signature.split("|")
+    key = _BING_SIGNATURE_KEY
+    encrypted = bytes((ord(char) + 3) ^ ord(key[i % len(key)]) for i, char in enumerate(data))
+    return f"{version}|{b64encode(encrypted).decode()}|{timestamp}"
+
+
+async def _read_request(reader: asyncio.StreamReader, prefix: bytes = b"") -> _Request | None:
+    """Reads one HTTP/1.1 request, or returns None once the client has closed the connection.
+
+    `prefix` holds bytes of the request already read from the stream.
+    """
+    try:
+        head = prefix + await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    method, target, _ = request_line.split(" ", 2)
+    headers: dict[str, str] = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        await reader.readline()
+        body = b"".join(chunks)
+    else:
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+    url = urlsplit(target)
+    return _Request(method, url.path, dict(parse_qsl(url.query)), headers, body)
+
+
+class MockServer:
+    """An HTTP server answering like the engines in `ENGINES`, for load tests.
+
+    Use it as an async context manager, or call `start()` and `close()`.
+
+    Attributes:
+        behaviour (Behaviour): Latency, failure and throttling settings; may be changed while running.
+        stats (Stats): Connections accepted and responses sent.
+    """
+
+    def __init__(self, behaviour: Behaviour | None = None, host: str = "127.0.0.1", port: int = 0):
+        """Initializes the server without starting it.
+
+        Args:
+            behaviour (Optional[Behaviour]): How to answer. Defaults to instant, error-free responses.
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 for any free port.
+        """
+        self.behaviour: Behaviour = behaviour or Behaviour()
+        self.stats: Stats = Stats()
+        self._host: str = host
+        self._port: int = port
+        self._server: asyncio.Server | None = None
+        self._bodies: dict[str, bytes] = {}
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        """The server's root URL."""
+        if self._server is None:
+            raise RuntimeError("server not started")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def base_url(self, engine: str) -> str:
+        """The base URL to give an engine, by its `ENGINES` name."""
+        return f"{self.url}/{engine}"
+
+    def engine(self, name: str, **kwargs: Any) -> BaseSearchEngine[Any]:
+        """Creates an engine pointed at the server.
+
+        Args:
+            name (str): The engine's `ENGINES` name.
+            **kwargs (Any): Engine arguments, e.g. `rate_limiter=False` to measure the client unthrottled.
+
+        Returns:
+            BaseSearchEngine: A new engine instance.
+        """
+        return ENGINES[name](base_url=self.base_url(name), **kwargs)
+
+    async def start(self) -> None:
+        """Starts listening and renders the response bodies."""
+        self._server = await asyncio.start_server(self._serve, self._host, self._port)
+        n = self.behaviour.results
+        saucenao = pages.saucenao(n)
+        del saucenao["status_code"]  # added by the engine
+        baidu = pages.baidu(n)
+        del baidu["same"]  # added by the engine from the cardData page
+        tineye = pages.tineye(n)
+        del tineye["status_code"]
+        domains = [[f"example{k}.com", 1, []] for k in range(1, 7)]
+        self._bodies = {
+            "saucenao": _json(saucenao),
+            "bing_page": pages.bing_search_page(_encrypt_signature(_BING_SIGNATURE)).encode(),
+            "bing_knowledge": _json(pages.bing(n)),
+            "copyseeker_cookie": f"{_COPYSEEKER_HEAD}1:null\n".encode(),
+            "copyseeker_discovery": f'{_COPYSEEKER_HEAD}1:{{"discoveryId":"mock-discovery"}}\n'.encode(),
+            "copyseeker_results": f"{_COPYSEEKER_HEAD}1:".encode() + _json(pages.copyseeker(n)) + b"\n",
+            "baidu_upload": _json({"status": 0, "msg": "Success", "data": {"url": f"{self.url}/baidu/s?sign=mock"}}),
+            "baidu_page": pages.baidu_cards(n, first_url=f"{self.url}/baidu/ajax/pcsimi?sign=mock&page=1").encode(),
+            "baidu_simipic": _json(baidu),
+            "tineye": _json(tineye),
+            "tineye_domains": _json({"domains": [["example0.com", n, ["stock"]], *domains]}),
+        }
+
+    async def close(self) -> None:
+        """Stops listening and closes open connections."""
+        if self._server is not None:
+            server, self._server = self._server, None
+            server.close()
+            for writer in self._writers:
+                writer.close()
+            await server.wait_closed()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats.connections += 1
+        self._writers.add(writer)
+        try:
+            preface = await reader.readexactly(len(_H2_PREFACE))
+            if preface == _H2_PREFACE:
+                await self._serve_h2(reader, writer, preface)
+            else:
+                await self._serve_http1(reader, writer, preface)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _serve_http1(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, prefix: bytes) -> None:
+        """Answers HTTP/1.1 requests one at a time until the client closes the connection."""
+        while (request := await _read_request(reader, prefix)) is not None:
+            prefix = b""
+            engine, _, path = request.path.lstrip("/").partition("/")
+            status, content_type, body, headers = await self._respond(engine, path, request)
+            self.stats.responses[engine, status] += 1
+            keep_alive = request.headers.get("connection", "").lower() != "close"
+            head = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", f"Content-Length: {len(body)}"]
+            head += [f"Content-Type: {content_type}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+            head += [f"{name}: {value}" for name, value in headers.items()]
+            writer.write("\r\n".join(head).encode("latin-1") + b"\r\n\r\n" + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+
+    async def _serve_h2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, preface: bytes) -> None:
+        """Answers cleartext HTTP/2 (prior knowledge) streams concurrently until the connection ends."""
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        conn.initiate_connection()
+        window_updated = asyncio.Event()
+        requests: dict[int, tuple[list[tuple[str, str]], bytearray]] = {}
+        tasks: set[asyncio.Task[None]] = set()
+        data = preface
+        try:
+            while data:
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers = [(_header_text(name), _header_text(value)) for name, value in event.headers]
+                        requests[event.stream_id] = (headers, bytearray())
+                    elif isinstance(event, h2.events.DataReceived):
+                        requests[event.stream_id][1].extend(event.data)
+                        conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        headers, body = requests.pop(event.stream_id)
+                        task = asyncio.ensure_future(
+                            self._respond_h2(conn, writer, window_updated, event.stream_id, headers, bytes(body))
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    elif isinstance(event, (h2.events.WindowUpdated, h2.events.RemoteSettingsChanged)):
+                        window_updated.set()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+                data = await reader.read(65536)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _respond_h2(
+        self,
+        conn: h2.connection.H2Connection,
+        writer: asyncio.StreamWriter,
+        window_updated: asyncio.Event,
+        stream_id: int,
+        raw_headers: list[tuple[str, str]],
+        body: bytes,
+    ) -> None:
+        pseudo = {name: value for name, value in raw_headers if name.startswith(":")}
+        headers: dict[str, str] = {}
+        for name, value in raw_headers:
+            if not name.startswith(":"):
+                headers[name] = f"{headers[name]}; {value}" if name in headers else value
+        url = urlsplit(pseudo[":path"])
+        request = _Request(pseudo[":method"], url.path, dict(parse_qsl(url.query)), headers, body)
+        engine, _, path = request.path.lstrip("/").partition("/")
+        status, content_type, response_body, extra_headers = await self._respond(engine, path, request)
+        self.stats.responses[engine, status] += 1
+
+        response_headers: list[tuple[str, str]] = [
+            (":status", str(status)),
+            ("content-length", str(len(response_body))),
+        ]
+        response_headers += [("content-type", content_type), *((k.lower(), v) for k, v in extra_headers.items())]
+        try:
+            conn.send_headers(stream_id, response_headers)
+            view = memoryview(response_body)
+            while view:
+                size = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size, len(view))
+                if size <= 0:
+                    window_updated.clear()
+                    await window_updated.wait()
+                    continue
+                conn.send_data(stream_id, view[:size].tobytes())
+                view = view[size:]
+                writer.write(conn.data_to_send())
+            conn.end_stream(stream_id)
+            writer.write(conn.data_to_send())
+            await writer.drain()
+        except (h2.exceptions.StreamClosedError, ConnectionError):
+            pass
+
+    def _over_rate(self, engine: str, max_rps: float) -> bool:
+        """Takes a token from the engine's bucket, returning True if there was none."""
+        now = time.monotonic()
+        tokens, last = self._buckets.get(engine, (max_rps, now))
+        tokens = min(max_rps, tokens + (now - last) * max_rps)
+        self._buckets[engine] = (tokens - 1 if tokens >= 1 else tokens, now)
+        return tokens < 1
+
+    async def _respond(self, engine: str, path: str, request: _Request) -> Response:
+        behaviour = self.behaviour
+        if delay := behaviour.latency + random.uniform(0, behaviour.jitter):
+            await asyncio.sleep(delay)
+
+        handler = getattr(self, f"_{engine}", None) if engine in ENGINES else None
+        if handler is None:
+            return 404, "text/plain", b"not found", {}
+        throttled = random.random() < behaviour.throttle_rate
+        if throttled or (behaviour.max_rps is not None and self._over_rate(engine, behaviour.max_rps)):
+            return 429, "text/plain", b"too many requests", {"Retry-After": f"{behaviour.retry_after:g}"}
+        if random.random() < behaviour.error_rate:
+            return 503, "text/plain", b"service unavailable", {}
+        return handler(path, request)
+
+    def _ok(self, name: str, content_type: str = "application/json", headers: dict[str, str] | None = None) -> Response:
+        return 200, content_type, self._bodies[name], headers or {}
+
+    def _saucenao(self, path: str, request: _Request) -> Response:
+        if path != "search.php" or request.method != "POST":
+            return 404, "text/plain", b"not found", {}
+        return self._ok("saucenao")
+
+    def _bing(self, path: str, request: _Request) -> Response:
+        if path == "images/search":
+            return self._ok("bing_page", "text/html; charset=utf-8")
+        if path == "images/api/custom/knowledge" and request.method == "POST":
+            if request.headers.get("x-image-knowledge-signature") != _BING_SIGNATURE:
+                return 403, "text/plain", b"missing or invalid image signature", {}
+            return self._ok("bing_knowledge")
+        return 404, "text/plain", b"not found", {}
+
+    def _copyseeker(self, path: str, request: _Request) -> Response:
+        action = request.headers.get("next-action")
+        if path == "" and action == COPYSEEKER_CONSTANTS["SET_COOKIE_TOKEN"]:
+            headers = {"Set-Cookie": "copyseeker_session=mock; Path=/"}
+            return self._ok("copyseeker_cookie", "text/x-component", headers)
+        if path == "" and action in (
+            COPYSEEKER_CONSTANTS["URL_SEARCH_TOKEN"],
+            COPYSEEKER_CONSTANTS["FILE_UPLOAD_TOKEN"],
+        ):
+            return self._ok("copyseeker_discovery", "text/x-component")
+        if path == "discovery" and action == COPYSEEKER_CONSTANTS["GET_RESULTS_TOKEN"]:
+            return self._ok("copyseeker_results", "text/x-component")
+        return 404, "text/plain", b"not found", {}
+
+    def _baidu(self, path: str, request: _Request) -> Response:
+        if path == "upload" and request.method == "POST":
+            return self._ok("baidu_upload")
+        if path == "s" and request.query.get("sign") == "mock":
+            return self._ok("baidu_page", "text/html; charset=utf-8")
+        if path == "ajax/pcsimi" and request.query.get("sign") == "mock":
+            return self._ok("baidu_simipic")
+        return 404, "text/plain", b"not found", {}
+
+    def _tineye(self, path: str, request: _Request) -> Response:
+        if path == "api/v1/result_json/":
+            return self._ok("tineye")
+        if path.startswith("api/v1/search/get_domains/"):
+            return self._ok("tineye_domains")
+        return 404, "text/plain", b"not found", {}
+
+
+async def serve(args: argparse.Namespace) -> None:
+    behaviour = Behaviour(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        max_rps=args.max_rps,
+        retry_after=args.retry_after,
+        results=args.results,
+    )
+    async with MockServer(behaviour, args.host, args.port) as server:
+        for name, engine in ENGINES.items():
+            print(f"{engine.__name__:<11} base_url={server.base_url(name)}", flush=True)
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: 8000)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency, up to S seconds (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 responses (default: 0)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of 429 responses (default: 0)")
+    parser.add_argument("--max-rps", type=float, help="per-engine request rate answered with 429s above it")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of 429 responses (default: 1)")
+    parser.add_argument("--results", type=int, default=50, help="result items per response (default: 50)")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""Synthetic result pages for the parsing benchmarks.
+
+Each builder returns an HTML page (or, for JSON APIs, the decoded payload) with `n` result items,
+laid out with the markup (class names, ids and nesting) or keys the corresponding response model
+parses, so benchmarks run offline and scale to any result count. The pages are sanitized stand-ins
+for recorded responses: every URL, title and name is made up, and only the structure is kept.
+"""
+
+import json
+from html import escape
+from typing import Any
+
+_ASCII2D_ITEM = """
+<div class="row item-box">
+  <div class="col-xs-12 col-sm-12 col-md-4 col-xl-4 text-xs-center image-box">
+    <img src="/thumbnail/{i}/{i}/{i}/{i}.jpg" loading="lazy">
+  </div>
+  <div class="col-xs-12 col-sm-12 col-md-8 col-xl-8 info-box">
+    <div class="hash">{i:032x}</div>
+    <small class="text-muted">1200x{i} JPEG 300.0KB</small>
+    <div class="detail-box gray-link">
+      <h6>
+        <img src="/icon/pixiv.ico" width="14" height="14">
+        <a href="https://www.pixiv.net/artworks/{i}" target="_blank" rel="noopener">Artwork {i}</a>
+        <a href="https://www.pixiv.net/users/{i}" target="_blank" rel="noopener">Artist {i}</a>
+        <small>pixiv</small>
+      </h6>
+    </div>
+    <div class="pull-xs-right"><a href="/details/{i:032x}">詳細</a></div>
+  </div>
+</div>
+"""
+
+_EHENTAI_ROW = """
+<tr>
+  <td class="gl1c glcat"><div class="cn ct2">Doujinshi</div></td>
+  <td class="gl2c">
+    <div class="glthumb"><div><img data-src="https://ehgt.org/t/{i}.jpg" src="data:image/gif;base64,R0lGOD"></div></div>
+    <div><div id="posted_{i}">2024-01-01 00:{m:02d}</div></div>
+  </td>
+  <td class="gl3c glname">
+    <a href="https://e-hentai.org/g/{i}/{i:010x}/">
+      <div class="glink">Gallery {i}</div>
+      <div>
+        <div class="gt" title="parody:series {i}">series {i}</div>
+        <div class="gtl" title="artist:artist {i}">artist {i}</div>
+      </div>
+    </a>
+  </td>
+  <td class="gl4c glhide"><div><a href="https://e-hentai.org/uploader/{i}">uploader</a></div><div>24 pages</div></td>
+</tr>
+"""
+
+_EHENTAI_CELL = """
+<div class="gl1t">
+  <a href="https://e-hentai.org/g/{i}/{i:010x}/"><div class="glink">Gallery {i}</div></a>
+  <div class="gl3t"><a href="https://e-hentai.org/g/{i}/{i:010x}/"><img src="https://ehgt.org/t/{i}.jpg"></a></div>
+  <div class="gl5t"><div><div class="cs ct2">Doujinshi</div><div id="posted_{i}">2024-01-01 00:{m:02d}</div></div></div>
+</div>
+"""
+
+_IQDB_MATCH = """
+<div><table>
+  <tr><th>{kind}</th></tr>
+  <tr><td class="image"><a href="//danbooru.donmai.us/posts/{i}"><img src="/danbooru/{i}.jpg"></a></td></tr>
+  <tr><td><img class="service-icon" src="/icon/danbooru.ico">Danbooru
+    <img class="service-icon" src="/icon/gelbooru.ico">Gelbooru <a href="https://gelbooru.com/index.php?id={i}"></a></td></tr>
+  <tr><td>1200×{i} [Safe]</td></tr>
+  <tr><td>{similarity}% similarity</td></tr>
+</table></div>
+"""
+
+_GOOGLE_ITEM = """
+<div class="wHYlTd">
+  <div><a href="https://example.com/{i}"><h3>Result {i}</h3><cite>example.com</cite></a></div>
+  <div><img id="dimg_{i}" src="data:image/gif;base64,R0lGOD"></div>
+  <div class="VwiC3b"><span>Snippet text for result {i}, </span><em>highlighted</em> words.</div>
+</div>
+"""
+
+_LENS_ITEM = """
+<div class="vEWxFf RCxtQc my5z3d">
+  <a class="LBcIee" href="https://example.com/{i}">
+    <div class="gdOPf q07dbf uhHOwf ez24Df">
+      <img id="dimg_{i}" data-iid="dimg_{i}" src="data:image/gif;base64,R0lGOD">
+    </div>
+    <div class="Yt787">Visual match {i}</div>
+    <span class="R8BTeb q8U8x LJEGod du278d i0Rdmd">example.com</span>
+  </a>
+</div>
+"""
+
+_LENS_RELATED = """
+<a class="Kg0xqe" href="/search?q=related+{i}">
+  <img src="https://example.com/r{i}.jpg"><div class="I9S4yc">Related {i}</div>
+</a>
+"""
+
+_LENS_EXACT = """
+<div class="YxbOwd">
+  <a class="ngTNl" href="https://example.com/{i}">
+    <div class="GmoL0c"><div class="zVq10e"><img id="dimg_{i}" src="data:image/gif;base64,R0lGOD"></div></div>
+    <div class="ZhosBf">Exact match {i}</div>
+    <div class="XC18Gb"><div class="LbKnXb"><span class="xuPcX">example.com</span></div></div>
+    <div class="oYQBg Zn52Me"><span>JPEG</span><span>1200x{i}</span></div>
+  </a>
+</div>
+"""
+
+_YANDEX_SITE = """
+<li class="CbirSites-Item">
+  <div class="CbirSites-ItemThumb">
+    <a href="https://example.com/{i}"><img src="//avatars.mds.yandex.net/i?id={i}"></a>
+  </div>
+  <div class="CbirSites-ItemInfo">
+    <div class="CbirSites-ItemTitle"><a href="https://example.com/{i}">Result {i} &lt;page&gt;</a></div>
+    <div class="CbirSites-ItemDomain">example.com</div>
+    <div class="CbirSites-ItemDescription">Description of result {i} with some text.</div>
+  </div>
+</li>
+"""
+
+
+def _page(body: str, head: str = "") -> str:
+    return f"<!DOCTYPE html><html><head><title>Results</title>{head}</head><body>{body}</body></html>"
+
+
+def ascii2d(n: int) -> str:
+    """An Ascii2D color search result page."""
+    return _page(f'<div class="container">{"".join(_ASCII2D_ITEM.format(i=i) for i in range(1, n + 1))}</div>')
+
+
+def yandex(n: int) -> str:
+    """A Yandex "sites with this image" page: the results are both rendered and embedded as `data-state` JSON."""
+    sites = [
+        {
+            "url": f"https://example.com/{i}",
+            "title": f'Result {i} <page> & "quotes"',
+            "thumb": {"url": f"//avatars.mds.yandex.net/i?id={i}", "width": 240, "height": 180},
+            "domain": "example.com",
+            "description": f"Description of result {i} with some text.",
+            "originalImage": {"url": f"https://example.com/{i}.jpg", "width": 1200, "height": 900},
+        }
+        for i in range(1, n + 1)
+    ]
+    state = {"initialState": {"cbirSites": {"sites": sites}, "i18n": {"lang": "en"}}}
+    header_state = {"user": {"region": 1}, "links": [f"https://yandex.com/{i}" for i in range(200)]}
+    return _page(
+        f'<div class="Root" id="Header-1" data-state="{escape(json.dumps(header_state))}"><header>Yandex</header></div>'
+        f'<div class="Root" id="ImagesApp-1" data-state="{escape(json.dumps(state, ensure_ascii=False))}">'
+        f'<ul class="CbirSites-Items">{"".join(_YANDEX_SITE.format(i=i) for i in range(1, n + 1))}</ul></div>',
+        head="<script>window.__DATA__ = {};</script>" * 20,
+    )
+
+
+def ehentai(n: int, grid: bool = False) -> str:
+    """An e-hentai file search result page, in the table (default) or grid layout."""
+    if grid:
+        cells = "".join(_EHENTAI_CELL.format(i=i, m=i % 60) for i in range(1, n + 1))
+        return _page(f'<div class="itg gld">{cells}</div>')
+    rows = "".join(_EHENTAI_ROW.format(i=i, m=i % 60) for i in range(1, n + 1))
+    return _page(f'<table class="itg gltc"><tr><th>Category</th><th>Published</th><th>Title</th></tr>{rows}</table>')
+
+
+def iqdb(n: int) -> str:
+    """An IQDB result page with one best match, `n - 1` additional matches and a lower-similarity block."""
+    matches = "".join(
+        _IQDB_MATCH.format(i=i, kind="Best match" if i == 1 else "Additional match", similarity=max(99 - i, 1))
+        for i in range(1, n + 1)
+    )
+    more = "".join(
+        _IQDB_MATCH.format(i=i, kind="Possible match", similarity=max(60 - i, 1)) for i in range(n + 1, 2 * n + 1)
+    )
+    query = (
+        "<div><table><tr><th>Your image</th></tr>"
+        '<tr><td class="image"><img src="/thu/query.jpg"></td></tr></table></div>'
+    )
+    links = (
+        '<a href="#">Show more</a> <a href="//saucenao.com/search.php?url=x">SauceNao</a> '
+        '<a href="https://ascii2d.net/search/url/x">ascii2d.net</a> '
+        '<a href="//www.google.com/searchbyimage?image_url=x">Google Images</a> '
+        '<a href="//tineye.com/search?url=x">TinEye</a>'
+    )
+    return _page(
+        f'<a href="//3d.iqdb.org/">3D</a><div id="pages">{query}{matches}</div>'
+        f'<div id="show1">{links}</div><div id="more1"><div class="pages">{more}</div></div>'
+    )
+
+
+def google(n: int) -> str:
+    """A Google search-by-image result page with inline base64 thumbnails."""
+    ids = ",".join(f"'dimg_{i}'" for i in range(1, n + 1))
+    script = f"<script>(function(){{var s='data:image/jpeg;base64,/9j/4AAQ\\x3d';var ii=[{ids}];}})();</script>"
+    items = "".join(_GOOGLE_ITEM.format(i=i) for i in range(1, n + 1))
+    pages = "".join(f'<a aria-label="Page {p}" href="/search?start={(p - 1) * 10}">{p}</a>' for p in range(2, 6))
+    return _page(f'<div id="search">{items}</div><div role="navigation">{pages}</div>{script}')
+
+
+def _lens_scripts(n: int) -> str:
+    """The inline scripts of a Lens page: JS noise, base64 thumbnails for every 5th image and the LDI URL map."""
+    noise = "".join(
+        f'<script nonce="abc">(function(){{var a{k}=[{",".join(str(j) for j in range(400))}];'
+        f"window.jsl&&jsl.dh('m{k}','<div class=\\\"x\\\"></div>');}})();</script>"
+        for k in range(10)
+    )
+    base64 = "".join(
+        f"<script nonce=\"abc\">(function(){{var s='data:image/jpeg;base64,/9j/{'A' * 2000}{i}\\x3d\\x3d';"
+        f"var ii=['dimg_{i}'];_setImagesSrc(ii,s);}})();</script>"
+        for i in range(1, n + 1, 5)
+    )
+    ldi = ",".join(
+        f'"dimg_{i}":"https://encrypted-tbn0.gstatic.com/images?q\\u003d{i}\\u0026s"' for i in range(1, n + 1)
+    )
+    return f'{noise}{base64}<script nonce="abc">google.ldi={{{ldi}}};google.pim={{}};</script><script>var x;</script>'
+
+
+def google_lens(n: int) -> str:
+    """A Google Lens visual matches page with related searches, base64 thumbnails and an LDI image map."""
+    items = "".join(_LENS_ITEM.format(i=i) for i in range(1, n + 1))
+    related = "".join(_LENS_RELATED.format(i=i) for i in range(1, 9))
+    return _page(f"{related}{items}{_lens_scripts(n)}")
+
+
+def google_lens_exact(n: int) -> str:
+    """A Google Lens exact matches page."""
+    return _page("".join(_LENS_EXACT.format(i=i) for i in range(1, n + 1)) + _lens_scripts(n))
+
+
+def saucenao(n: int) -> dict[str, Any]:
+    """A SauceNAO API response with Pixiv results, as returned by the engine (with `status_code`)."""
+    header = {"user_id": "0", "account_type": "1", "short_limit": "4", "long_limit": "100", "status": 0}
+    header |= {"results_requested": n, "search_depth": "128", "minimum_similarity": 40.0, "results_returned": n}
+    header["query_image_display"] = "/userdata/query.jpg"
+    results = [
+        {
+            "header": {
+                "similarity": f"{max(95 - i / 10, 40):.2f}",
+                "thumbnail": f"https://img1.saucenao.com/res/pixiv/{i}.jpg?auth=token&exp={i}",
+                "index_id": 5,
+                "index_name": f"Index #5: Pixiv Images - {i}_p0.jpg",
+                "dupes": 0,
+                "hidden": 0,
+            },
+            "data": {
+                "ext_urls": [f"https://www.pixiv.net/member_illust.php?mode=medium&illust_id={i}"],
+                "title": f"Artwork {i}",
+                "pixiv_id": i,
+                "member_name": f"Artist {i}",
+                "member_id": i,
+            },
+        }
+        for i in range(1, n + 1)
+    ]
+    return {"status_code": 200, "header": header, "results": results}
+
+
+def _baidu_item(i: int) -> dict[str, Any]:
+    return {
+        "thumbUrl": f"https://mms0.baidu.com/it/u={i},{i}&fm=253&fmt=auto?w=200&h=150",
+        "fromUrl": f"https://example.com/{i}",
+        "title": [f"Result {i}"],
+        "simi": f"0.{99 - i % 90}",
+        "contsign": f"{i * 7919}",
+    }
+
+
+def baidu(n: int) -> dict[str, Any]:
+    """A BaiDu `simipic` API response, with the `same` card the engine adds to it."""
+    same = [
+        {
+            "url": f"https://example.com/same/{i}",
+            "image_src": f"https://example.com/same/{i}.jpg",
+            "title": [f"Same {i}"],
+        }
+        for i in range(1, n // 5 + 1)
+    ]
+    return {"status": 0, "data": {"list": [_baidu_item(i) for i in range(1, n + 1)]}, "same": {"list": same}}
+
+
+def baidu_cards(n: int, first_url: str = "https://graph.baidu.com/ajax/pcsimi?sign=x&page=1") -> str:
+    """A BaiDu result page embedding `window.cardData`, whose `same` card lists `n` images.
+
+    `first_url` is the `simipic` card's link to the similar images API (see `baidu`).
+    """
+    cards = [
+        {"cardName": "same", "tplData": {"list": [_baidu_item(i) for i in range(1, n + 1)]}},
+        {"cardName": "simipic", "tplData": {"firstUrl": first_url}},
+    ]
+    scripts = "".join(f'<script>window.__conf{k} = {{"k": {k}}};</script>' for k in range(20))
+    return _page(
+        f'<div id="app"></div>{scripts}<script>window.cardData = {json.dumps(cards, ensure_ascii=False)};</script>'
+    )
+
+
+def bing_search_page(signature: str) -> str:
+    """A Bing visual search page, carrying the session key, image signature and BCID the engine extracts."""
+    return _page(
+        '<a href="/images/search?view=detailv2&amp;skey=mock-skey&amp;iss=sbi">Visual search</a>'
+        f'<div data-ipc="{{&quot;imageSignature&quot;:&quot;{signature}&quot;}}"></div>'
+        '<script>var _w={"bcid":"bcid_mock.1234-abcd"};</script>'
+    )
+
+
+def bing(n: int) -> dict[str, Any]:
+    """A Bing visual search knowledge API response with `n` visual matches and `n // 2` pages including the image."""
+
+    def image(i: int) -> dict[str, Any]:
+        return {
+            "name": f"Result {i}",
+            "hostPageUrl": f"https://example.com/{i}",
+            "thumbnailUrl": f"https://tse.mm.bing.net/th?id=OIP.{i}",
+            "contentUrl": f"https://example.com/{i}.jpg",
+            "width": 1200,
+            "height": 900,
+            "encodingFormat": "jpeg",
+        }
+
+    related = [{"text": f"related {i}", "thumbnail": {"url": f"https://tse.mm.bing.net/th?q={i}"}} for i in range(8)]
+    entity = {
+        "name": "Entity",
+        "image": {"thumbnailUrl": "https://tse.mm.bing.net/th?id=entity"},
+        "description": "An entity description.",
+        "entityPresentationInfo": {"entityTypeDisplayHint": "Artwork"},
+    }
+    actions = [
+        {"actionType": "BestRepresentativeQuery", "displayName": "best guess"},
+        {"actionType": "PagesIncluding", "data": {"value": [image(i) for i in range(1, n // 2 + 1)]}},
+        {"actionType": "VisualSearch", "data": {"value": [image(i) for i in range(1, n + 1)]}},
+        {"actionType": "RelatedSearches", "data": {"value": related}},
+        {"actionType": "Entity", "data": entity},
+    ]
+    return {"_type": "ImageKnowledge", "tags": [{"displayName": "", "actions": actions}], "imageInsightsToken": "t"}
+
+
+def copyseeker(n: int) -> dict[str, Any]:
+    """A Copyseeker discovery result, as carried on line 1 of the results RSC payload."""
+    pages = [
+        {
+            "url": f"https://example.com/{i}",
+            "title": f"Result {i}",
+            "mainImage": f"https://example.com/{i}.jpg",
+            "otherImages": [f"https://example.com/{i}-{k}.jpg" for k in range(2)],
+            "rank": round(100 - i / 10, 1),
+        }
+        for i in range(1, n + 1)
+    ]
+    similar = [f"https://example.com/similar/{i}.jpg" for i in range(1, 11)]
+    return {
+        "id": "mock-discovery",
+        "imageUrl": "https://example.com/query.jpg",
+        "bestGuessLabel": "best guess",
+        "totalLinksFound": n,
+        "pages": pages,
+        "visuallySimilarImages": similar,
+    }
+
+
+def tineye(n: int) -> dict[str, Any]:
+    """A TinEye `result_json` API response, as returned by the engine (with `status_code`)."""
+    matches = [
+        {
+            "image_url": f"https://img.tineye.com/result/{i:064x}",
+            "domain": f"example{i % 7}.com",
+            "width": 1200,
+            "height": 900,
+            "size": 300000,
+            "format": "JPEG",
+            "score": 50.0,
+            "backlinks": [
+                {
+                    "url": f"https://example{i % 7}.com/{i}.jpg",
+                    "backlink": f"https://example{i % 7}.com/page/{i}",
+                    "crawl_date": "2024-01-01",
+                }
+            ],
+        }
+        for i in range(1, n + 1)
+    ]
+    query = {"key": "k", "hash": f"{n:040x}", "width": 1200, "height": 900}
+    return {"query": query, "query_hash": f"{n:040x}", "total_pages": 1, "matches": matches, "status_code": 200}
+
+
+def tracemoe(n: int) -> dict[str, Any]:
+    """A trace.moe `search?anilistInfo` API response."""
+    anilist = {
+        "id": 1,
+        "idMal": 1,
+        "title": {"native": "タイトル", "romaji": "Title", "english": "Title", "chinese": None},
+        "synonyms": ["Another title"],
+        "isAdult": False,
+        "type": "ANIME",
+        "format": "TV",
+        "startDate": {"year": 2000, "month": 1, "day": 1},
+        "endDate": {"year": 2000, "month": 3, "day": 31},
+        "coverImage": {"large": "https://example.com/cover.jpg"},
+    }
+    result = [
+        {
+            "anilist": anilist | {"id": i},
+            "filename": f"Title - {i:02d}.mp4",
+            "episode": i,
+            "from": 100.0 + i,
+            "to": 103.5 + i,
+            "similarity": max(0.99 - i / 1000, 0.5),
+            "video": f"https://api.trace.moe/video/{i}/title.mp4?t=101&now=1&token=x",
+            "image": f"https://api.trace.moe/image/{i}/title.mp4.jpg?t=101&now=1&token=x",
+        }
+        for i in range(1, n + 1)
+    ]
+    return {"frameCount": 4000000, "error": "", "result": result}
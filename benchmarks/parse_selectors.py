@@ -0,0 +1,96 @@
+"""HTML parsing benchmark.
+
+Parses synthetic result pages (see `pages.py`) with each HTML response model and reports
+the time per result item. For reference, it also runs every precompiled selector of an
+engine on each item both through PyQuery, which translates the CSS and wraps the results
+on every call, and through the compiled `Selector`, which is how the models look them up.
+
+Usage (from the repository root):
+    python -m benchmarks.parse_selectors [--items N] [--runs N]
+"""
+
+import argparse
+from collections.abc import Callable
+from typing import Any
+
+from pyquery import PyQuery
+
+from benchmarks import pages
+from benchmarks._common import best, description
+from PicImageSearch.model import (
+    Ascii2DResponse,
+    EHentaiResponse,
+    GoogleLensExactMatchesResponse,
+    GoogleLensResponse,
+    GoogleResponse,
+    IqdbResponse,
+    selectors,
+)
+from PicImageSearch.model.selectors import Selector
+from PicImageSearch.utils import parse_html
+
+CASES: dict[str, tuple[Callable[[int], str], Callable[[str], Any], str, str]] = {
+    "ascii2d": (pages.ascii2d, lambda html: Ascii2DResponse(html, ""), "ASCII2D_", "div.row.item-box"),
+    "ehentai": (pages.ehentai, lambda html: EHentaiResponse(html, ""), "EHENTAI_", ".itg > tr"),
+    "iqdb": (pages.iqdb, lambda html: IqdbResponse(html, ""), "IQDB_", "#pages > div > table"),
+    "google": (
+        pages.google,
+        lambda html: GoogleResponse(html, "", page_number=1),
+        "GOOGLE_",
+        "#search .wHYlTd",
+    ),
+    "google lens": (pages.google_lens, lambda html: GoogleLensResponse(html, ""), "LENS_", ".vEWxFf"),
+    "google lens exact": (
+        pages.google_lens_exact,
+        lambda html: GoogleLensExactMatchesResponse(html, ""),
+        "LENS_EXACT_",
+        ".YxbOwd",
+    ),
+}
+
+
+def engine_selectors(prefix: str) -> list[Selector]:
+    """Returns the precompiled selectors of an engine, by constant name prefix."""
+    found: list[Selector] = []
+    for name, value in vars(selectors).items():
+        if name.startswith(prefix):
+            found.extend(value if isinstance(value, tuple) else [value])
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("--items", type=int, default=50, help="result items per page (default: 50)")
+    parser.add_argument("--runs", type=int, default=20, help="timing runs, the fastest is kept (default: 20)")
+    args = parser.parse_args()
+
+    print(f"{'page':<18} {'parse µs/item':>14} {'PyQuery µs/item':>16} {'compiled µs/item':>17} {'speedup':>8}")
+    for name, (build, parse, prefix, item_css) in CASES.items():
+        html = build(args.items)
+        parse_time = best(lambda: parse(html), args.runs)
+
+        items = list(parse_html(html)(item_css))
+        engine = engine_selectors(prefix)
+
+        def with_pyquery() -> None:
+            for item in items:
+                wrapped = PyQuery(item)
+                for selector in engine:
+                    wrapped(selector.css)
+
+        def compiled() -> None:
+            for item in items:
+                for selector in engine:
+                    selector.select(item)
+
+        pyquery_time = best(with_pyquery, args.runs)
+        compiled_time = best(compiled, args.runs)
+        per_item = 1e6 / len(items)
+        print(
+            f"{name:<18} {parse_time * per_item:>14.1f} {pyquery_time * per_item:>16.1f} "
+            f"{compiled_time * per_item:>17.1f} {pyquery_time / compiled_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Offline parse throughput benchmark.
+
+Builds every response model from a response body, the way the engines do once the body has
+arrived (HTML decoded to text, JSON decoded with `utils.json_loads`), and reports the time per
+response, items parsed per second and the peak memory of one parse. Bodies are the sanitized
+synthetic pages of `pages.py`, or recorded bodies from `--fixtures DIR`, named after the cases
+(`iqdb.html`, `tineye.json`, ...).
+
+Peak memory is the growth of the process's peak resident set, which includes the HTML trees
+libxml2 allocates. Where the peak cannot be reset (outside Linux), the `tracemalloc` peak is
+shown instead, marked with `*`; it only covers Python objects.
+
+Usage (from the repository root):
+    python -m benchmarks.parse_throughput [--items N] [--runs N] [--fixtures DIR] [CASE ...]
+"""
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from lxml.html import fromstring
+from pyquery import PyQuery
+
+from benchmarks import pages
+from benchmarks._common import best, description
+from benchmarks.memory import release_free_memory
+from PicImageSearch.engines.baidu import BaiDu
+from PicImageSearch.model import (
+    Ascii2DResponse,
+    BaiDuResponse,
+    BingResponse,
+    EHentaiResponse,
+    GoogleLensExactMatchesResponse,
+    GoogleLensResponse,
+    GoogleResponse,
+    IqdbResponse,
+    SauceNAOResponse,
+    TineyeResponse,
+    TraceMoeResponse,
+    YandexResponse,
+)
+from PicImageSearch.utils import json_loads
+
+
+def _html(build: Callable[[int], str]) -> Callable[[int], bytes]:
+    return lambda n: build(n).encode()
+
+
+def _json(build: Callable[[int], Any]) -> Callable[[int], bytes]:
+    return lambda n: json.dumps(build(n), ensure_ascii=False).encode()
+
+
+def _items(response: Any) -> int:
+    return len(response.raw)
+
+
+def _bing_items(response: BingResponse) -> int:
+    return len(response.pages_including) + len(response.visual_search) + len(response.related_searches)
+
+
+CASES: dict[str, tuple[Callable[[int], bytes], Callable[[bytes], Any], Callable[[Any], int]]] = {
+    "ascii2d": (_html(pages.ascii2d), lambda body: Ascii2DResponse(body.decode(), ""), _items),
+    "iqdb": (_html(pages.iqdb), lambda body: IqdbResponse(body.decode(), ""), _items),
+    "ehentai": (_html(pages.ehentai), lambda body: EHentaiResponse(body.decode(), ""), _items),
+    "google": (_html(pages.google), lambda body: GoogleResponse(body.decode(), "", page_number=1), _items),
+    "google_lens": (_html(pages.google_lens), lambda body: GoogleLensResponse(body.decode(), ""), _items),
+    "google_lens_exact": (
+        _html(pages.google_lens_exact),
+        lambda body: GoogleLensExactMatchesResponse(body.decode(), ""),
+        _items,
+    ),
+    "yandex": (_html(pages.yandex), lambda body: YandexResponse(body.decode(), ""), _items),
+    "baidu_cards": (
+        _html(pages.baidu_cards),
+        lambda body: BaiDu._extract_card_data(PyQuery(fromstring(body.decode()))),
+        lambda cards: len(cards[0]["tplData"]["list"]),
+    ),
+    "baidu": (_json(pages.baidu), lambda body: BaiDuResponse(json_loads(body), ""), _items),
+    "bing": (_json(pages.bing), lambda body: BingResponse(json_loads(body), ""), _bing_items),
+    "tineye": (_json(pages.tineye), lambda body: TineyeResponse(json_loads(body), "", domains=[]), _items),
+    "saucenao": (_json(pages.saucenao), lambda body: SauceNAOResponse(json_loads(body), ""), _items),
+    "tracemoe": (
+        _json(pages.tracemoe),
+        lambda body: TraceMoeResponse(json_loads(body), "", mute=False, size=None),
+        _items,
+    ),
+}
+
+
+def _status_bytes(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) * 1024
+    raise OSError(f"{field} not in /proc/self/status")
+
+
+def peak_memory(func: Callable[[], Any]) -> tuple[int, bool]:
+    """Runs `func` once and returns how far memory use peaked above its starting point.
+
+    Returns:
+        tuple[int, bool]: The peak growth in bytes, and whether it is the resident set peak (True)
+            or the `tracemalloc` fallback (False).
+    """
+    release_free_memory()
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")  # resets VmHWM, the peak resident set size
+        before = _status_bytes("VmRSS")
+    except OSError:
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1], False
+        finally:
+            tracemalloc.stop()
+    func()
+    return max(_status_bytes("VmHWM") - before, 0), True
+
+
+def load_fixture(directory: Path, name: str) -> bytes | None:
+    """Returns the recorded body for a case from `directory`, if there is one."""
+    for path in sorted(directory.glob(f"{name}.*")):
+        return path.read_bytes()
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("cases", nargs="*", help=f"cases to run (default: all): {', '.join(CASES)}")
+    parser.add_argument("--items", type=int, default=50, help="result items per synthetic page (default: 50)")
+    parser.add_argument("--runs", type=int, default=20, help="timing runs, the fastest is kept (default: 20)")
+    parser.add_argument("--fixtures", type=Path, help="directory of recorded bodies replacing the synthetic ones")
+    args = parser.parse_args()
+    if unknown := [name for name in args.cases if name not in CASES]:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    print(f"{'case':<18} {'body KiB':>9} {'items':>6} {'µs/response':>12} {'items/s':>10} {'peak KiB':>9}")
+    for name in args.cases or CASES:
+        build, parse, count = CASES[name]
+        body = (load_fixture(args.fixtures, name) if args.fixtures else None) or build(args.items)
+        items = count(parse(body))  # warm-up: imports, selector compilation, caches
+
+        elapsed = best(lambda: parse(body), args.runs)
+        peak, resident = peak_memory(lambda: parse(body))
+        print(
+            f"{name:<18} {len(body) / 1024:>9.1f} {items:>6} {elapsed * 1e6:>12.0f} "
+            f"{items / elapsed:>10.0f} {peak / 1024:>9.0f}{'' if resident else '*'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Yandex `data-state` extraction benchmark.
+
+Compares locating the results JSON of a Yandex page by scanning the page text
+(`find_data_state`, what `YandexResponse` does) with parsing the whole page into a DOM and
+selecting the element (the fallback). Runs on recorded pages given as arguments, or on
+synthetic pages (see `pages.py`) of several sizes.
+
+Usage (from the repository root):
+    python -m benchmarks.yandex_state [--runs N] [PAGE.html ...]
+"""
+
+import argparse
+from pathlib import Path
+
+from benchmarks import pages
+from benchmarks._common import best, description
+from PicImageSearch.model.selectors import YANDEX_ROOT, attr
+from PicImageSearch.model.yandex import find_data_state
+from PicImageSearch.utils import parse_html
+
+
+def with_dom(html: str) -> str | None:
+    """Parses the page and reads the attribute, like the fallback path."""
+    return attr(YANDEX_ROOT.find(parse_html(html)[0]), "data-state")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=description(__doc__))
+    parser.add_argument("pages", nargs="*", type=Path, help="recorded Yandex result pages (HTML files)")
+    parser.add_argument("--runs", type=int, default=20, help="timing runs, the fastest is kept (default: 20)")
+    args = parser.parse_args()
+
+    if args.pages:
+        cases = {path.name: path.read_text(encoding="utf-8") for path in args.pages}
+    else:
+        cases = {f"synthetic, {n} results": pages.yandex(n) for n in (10, 50, 200, 1000)}
+
+    print(f"{'page':<24} {'size KiB':>9} {'scan ms':>8} {'DOM ms':>8} {'speedup':>8}")
+    for name, html in cases.items():
+        if find_data_state(html) != with_dom(html):
+            print(f"{name:<24} scan and DOM results differ, skipped")
+            continue
+        scan_time = best(lambda: find_data_state(html), args.runs)
+        dom_time = best(lambda: with_dom(html), args.runs)
+        print(
+            f"{name:<24} {len(html.encode()) / 1024:>9.0f} {scan_time * 1e3:>8.2f} {dom_time * 1e3:>8.2f} "
+            f"{dom_time / scan_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
 import os
+from collections.abc import Callable, Sequence
 from typing import Any
 
+import httpx
 import pytest
 
+from PicImageSearch import network
+from PicImageSearch.engines.base import BaseSearchEngine
+
+Handler = Callable[[httpx.Request], Any]
+
 
 def pytest_configure(config):
     """Configure test environment"""
@@ -122,3 +129,116 @@ def has_google_config(config: dict[str, Any]) -> bool:
 
 def has_saucenao_config(config: dict[str, Any]) -> bool:
     return bool(config.get("saucenao", {}).get("api_key"))
+
+
+# Offline stubs shared by the unit tests
+def make_mock_client(responses: Handler | Sequence[Any], **kwargs: Any) -> httpx.AsyncClient:
+    """Build a client answering through a mock transport
+
+    `responses` is a request handler, or the responses (or exceptions to raise) to return in order.
+    """
+    if callable(responses):
+        handler: Handler = responses
+    else:
+        calls = iter(responses)
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            result = next(calls)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        handler = respond
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class StubEngine(BaseSearchEngine[Any]):
+    """Engine sending the searched URL as a GET query
+
+    Returns the raw response, or the `response_cls` model built from its JSON or text body.
+    """
+
+    def __init__(self, base_url: str = "https://example.com", response_cls: type | None = None, **request_kwargs):
+        super().__init__(base_url, **request_kwargs)
+        self.response_cls = response_cls
+
+    async def search(self, url=None, file=None, **kwargs):
+        resp = await self._send_request(method="get", params={"url": url})
+        if self.response_cls is None:
+            return resp
+        data = resp.json() if resp.headers.get("Content-Type") == "application/json" else resp.text
+        return await self._make_response(self.response_cls, data, resp.url)
+
+
+@pytest.fixture
+def saucenao_response() -> dict[str, Any]:
+    """A SauceNAO API response with three Pixiv results, built afresh for every test"""
+    return {
+        "status_code": 200,
+        "header": {"query_image_display": "/userdata/query.jpg"},
+        "results": [
+            {
+                "header": {
+                    "similarity": "92.5",
+                    "thumbnail": "https://example.com/t.jpg",
+                    "index_id": 5,
+                    "index_name": "Pixiv",
+                },
+                "data": {
+                    "title": f"Artwork {i}",
+                    "pixiv_id": i,
+                    "member_id": 2,
+                    "member_name": "Artist",
+                    "ext_urls": [],
+                },
+            }
+            for i in range(3)
+        ],
+    }
+
+
+@pytest.fixture
+def mock_client() -> Callable[..., httpx.AsyncClient]:
+    """Factory of mock transport clients, see `make_mock_client`"""
+    return make_mock_client
+
+
+@pytest.fixture
+def stub_engine() -> Callable[..., StubEngine]:
+    """Factory of `StubEngine`s, answered by a mock client when given responses
+
+    Retries are not delayed, unless the test passes its own `retry_policy`.
+    """
+
+    def make(responses: Handler | Sequence[Any] | None = None, **kwargs: Any) -> StubEngine:
+        if responses is not None:
+            kwargs.setdefault("client", make_mock_client(responses))
+            kwargs.setdefault("retry_policy", network.RetryPolicy(backoff_factor=0))
+        return StubEngine(**kwargs)
+
+    return make
+
+
+@pytest.fixture
+def pooled_clients(monkeypatch) -> Callable[..., list[httpx.AsyncClient]]:
+    """Make the clients engines create themselves answer through a mock transport
+
+    Returns a function taking the request handler (by default, 200 "ok"), which returns the list
+    the created clients are appended to.
+    """
+
+    def patch(handler: Handler = lambda request: httpx.Response(200, text="ok")) -> list[httpx.AsyncClient]:
+        clients: list[httpx.AsyncClient] = []
+        original = network.AsyncClient
+
+        def factory(**kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            client = original(**kwargs)
+            clients.append(client)
+            return client
+
+        monkeypatch.setattr(network, "AsyncClient", factory)
+        return clients
+
+    return patch
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from collections.abc import AsyncGenerator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from PicImageSearch.engines.base import BaseSearchEngine
+from PicImageSearch.hooks import EngineHooks
+from PicImageSearch.model import SauceNAOResponse
+from PicImageSearch.model.base import BaseSearchResponse
+
+
+class RecordingEngine(BaseSearchEngine[Any]):
+    def __init__(self, **request_kwargs):
+        super().__init__("https://example.com", **request_kwargs)
+        self.running = 0
+        self.peak = 0
+
+    async def search(self, url=None, file=None, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.running -= 1
+        if file == b"bad":
+            raise ValueError("bad image")
+        return url or file
+
+
+class ThreadResponse(BaseSearchResponse[Any]):
+    def _parse_response(self, resp_data, **kwargs):
+        self.thread = threading.current_thread().name
+
+
+class TestSearchMany:
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        engine = RecordingEngine()
+        inputs = [b"image"] * 10 + ["https://example.com/a.jpg", b"bad"]
+        results = [pair async for pair in engine.search_many(inputs, concurrency=3)]
+
+        assert engine.peak == 3
+        assert len(results) == 12
+        assert ("https://example.com/a.jpg", "https://example.com/a.jpg") in results
+        errors = [result for _, result in results if isinstance(result, Exception)]
+        assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_inputs_pulled_lazily(self):
+        engine = RecordingEngine()
+        pulled = 0
+
+        async def inputs():
+            nonlocal pulled
+            for _ in range(100):
+                pulled += 1
+                yield b"image"
+
+        iterator = engine.search_many(inputs(), concurrency=2)
+        assert isinstance(iterator, AsyncGenerator)
+        await anext(iterator)
+        assert pulled <= 3
+        await iterator.aclose()
+        assert engine.running == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            await anext(RecordingEngine().search_many([b"image"], concurrency=0))
+
+
+class TestParseExecutor:
+    @pytest.fixture
+    def parsing_engine(self, stub_engine):
+        """Factory of engines building `ThreadResponse`s from JSON (by default) or HTML bodies"""
+
+        def make(html: bool = False, **kwargs):
+            def handler(request: httpx.Request) -> httpx.Response:
+                return httpx.Response(200, text="<html></html>") if html else httpx.Response(200, json={})
+
+            return stub_engine(handler, response_cls=ThreadResponse, **kwargs)
+
+        return make
+
+    @pytest.mark.asyncio
+    async def test_json_inline_by_default(self, parsing_engine):
+        response = await parsing_engine().search()
+        assert response.thread == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_html_in_engine_thread_by_default(self, parsing_engine):
+        engine = parsing_engine(html=True)
+        first = await engine.search()
+        second = await engine.search()
+        assert first.thread.startswith("StubEngine-parse") and second.thread == first.thread
+
+        await engine.close()
+        assert engine._parse_pool is None
+
+    @pytest.mark.asyncio
+    async def test_default_thread_pool(self, parsing_engine):
+        response = await parsing_engine(parse_executor=True).search()
+        assert response.thread != threading.current_thread().name
+        assert not response.thread.startswith("StubEngine")
+
+    @pytest.mark.asyncio
+    async def test_inline(self, parsing_engine):
+        response = await parsing_engine(html=True, parse_executor=False).search()
+        assert response.thread == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_custom_executor(self, parsing_engine):
+        with ThreadPoolExecutor(1, thread_name_prefix="parser") as executor:
+            response = await parsing_engine(parse_executor=executor).search()
+        assert response.thread.startswith("parser")
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self, stub_engine, saucenao_response):
+        responses = [httpx.Response(200, json=saucenao_response)]
+        with ProcessPoolExecutor(1) as executor:
+            engine = stub_engine(responses, response_cls=SauceNAOResponse, parse_executor=executor, lazy=True)
+            response = await engine.search()
+        assert response.origin is None
+        assert response.raw[1].origin is None
+        assert response.raw[1].url == "https://www.pixiv.net/artworks/1"
+        assert response.raw[1].author == "Artist"
+
+
+class RecordingHooks(EngineHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, engine, method, url):
+        self.events.append(("request_start", method, url))
+
+    def on_request_end(self, engine, method, url, resp, elapsed, error):
+        self.events.append(("request_end", resp.status_code if resp else None, type(error).__name__ if error else None))
+
+    def on_retry(self, engine, method, url, attempt, delay, status_code, error):
+        self.events.append(("retry", attempt, status_code))
+
+    def on_parse_start(self, engine, response_cls):
+        self.events.append(("parse_start", response_cls.__name__))
+
+    def on_parse_end(self, engine, response_cls, elapsed, error):
+        self.events.append(("parse_end", type(error).__name__ if error else None))
+
+
+class TestHooks:
+    @pytest.mark.asyncio
+    async def test_request_retry_and_parse(self, stub_engine, saucenao_response):
+        hooks = RecordingHooks()
+        responses = [httpx.Response(503), httpx.Response(200, json=saucenao_response)]
+        engine = stub_engine(responses, response_cls=SauceNAOResponse, hooks=[hooks])
+        await engine.search(url="a")
+
+        assert hooks.events == [
+            ("request_start", "GET", "https://example.com"),
+            ("retry", 1, 503),
+            ("request_end", 200, None),
+            ("parse_start", "SauceNAOResponse"),
+            ("parse_end", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failures(self, stub_engine):
+        hooks = RecordingHooks()
+        responses = [httpx.Response(200, text="not json", headers={"Content-Type": "application/json"})]
+        engine = stub_engine(responses, response_cls=SauceNAOResponse, hooks=[hooks])
+        with pytest.raises(ValueError):
+            await engine.search(url="a")
+        assert hooks.events[-1] == ("request_end", 200, None)
+
+        responses = [httpx.Response(200, json={"results": [{}]})]
+        engine = stub_engine(responses, response_cls=SauceNAOResponse, hooks=[hooks])
+        with pytest.raises(KeyError):
+            await engine.search(url="a")
+        assert hooks.events[-2:] == [("parse_start", "SauceNAOResponse"), ("parse_end", "KeyError")]
+
+    def test_defaults_do_nothing(self):
+        engine = RecordingEngine(hooks=[EngineHooks()])
+        assert engine.hooks and not RecordingEngine().hooks
+        engine.hooks[0].on_retry(engine, "GET", "https://example.com", 1, 0.0, None, None)
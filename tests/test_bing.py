@@ -1,6 +1,7 @@
+import httpx
 import pytest
 
-from PicImageSearch import Bing
+from PicImageSearch import Bing, network
 
 
 class TestBing:
@@ -27,3 +28,38 @@ class TestBing:
     async def test_search_with_url(self, engine, test_image_url):
         result = await engine.search(url=test_image_url)
         assert len(result.visual_search) > 0
+
+    @pytest.mark.asyncio
+    async def test_bcid_search_keeps_shared_cookies(self, pooled_clients):
+        sent: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.headers.get("Cookie"))
+            return httpx.Response(200, json={})
+
+        pooled_clients(handler)
+        registry = network.ClientRegistry()
+        engine = Bing(registry=registry, rate_limiter=False)
+        shared = registry.get_client(**engine._network_options())
+        shared.cookies.set("MUID", "1", domain="www.bing.com")
+
+        await engine._get_insights(bcid="bcid")
+        assert sent == [""]
+        assert shared.cookies.get("MUID") == "1"
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_bcid_search_sends_configured_cookies(self, pooled_clients):
+        sent: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.headers.get("Cookie"))
+            return httpx.Response(200, json={})
+
+        clients = pooled_clients(handler)
+        engine = Bing(cookies="SRCHUID=1", rate_limiter=False)
+        await engine._get_insights(bcid="bcid")
+        await engine._get_insights(bcid="bcid")
+        assert sent == ["SRCHUID=1", "SRCHUID=1"]
+        assert clients[0].cookies.get("SRCHUID") == "1"
+        await engine.close()
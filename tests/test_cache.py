@@ -0,0 +1,211 @@
+import asyncio
+import sqlite3
+import threading
+from contextlib import closing
+
+import httpx
+import pytest
+
+from PicImageSearch import SearchCache
+from PicImageSearch.cache import decode_payload, encode_payload, make_cache_key, normalize_url
+from PicImageSearch.engines.base import BaseSearchEngine
+from PicImageSearch.model.base import BaseSearchItem, BaseSearchResponse
+from PicImageSearch.types import DomainInfo, DomainTag
+
+
+class EchoItem(BaseSearchItem):
+    def _parse_data(self, data, **kwargs):
+        self.title = data
+
+
+class EchoResponse(BaseSearchResponse[EchoItem]):
+    def _parse_response(self, resp_data, **kwargs):
+        self.raw = [EchoItem(line) for line in resp_data.splitlines()]
+
+
+class EchoEngine(BaseSearchEngine[EchoResponse]):
+    def __init__(self, mode: str = "a", **request_kwargs):
+        super().__init__("https://example.com", **request_kwargs)
+        self.mode = mode
+
+    async def search(self, url=None, file=None, **kwargs):
+        resp = await self._send_request(method="post", files={"file": file} if file else None, data={"url": url})
+        return await self._make_response(EchoResponse, resp.text, resp.url)
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def client(requests, mock_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=f"result {len(requests)}")
+
+    return mock_client(handler)
+
+
+class TestCacheKey:
+    def test_normalize_url(self):
+        assert normalize_url("HTTPS://Example.COM:443/a.jpg?b=2&a=1#frag") == "https://example.com/a.jpg?a=1&b=2"
+        assert normalize_url("http://example.com:8080") == "http://example.com:8080/"
+
+    def test_key_components(self):
+        key = make_cache_key("SauceNAO", {"numres": 5}, None, b"image", {})
+        assert key == make_cache_key("SauceNAO", {"numres": 5}, None, b"image", {})
+        assert key != make_cache_key("SauceNAO", {"numres": 6}, None, b"image", {})
+        assert key != make_cache_key("Iqdb", {"numres": 5}, None, b"image", {})
+        assert key != make_cache_key("SauceNAO", {"numres": 5}, None, b"other", {})
+
+
+class TestPayload:
+    def test_round_trip(self):
+        domains = [DomainInfo("example.com", 2, DomainTag.STOCK), DomainInfo("example.org", 1)]
+        payload = encode_payload("model.Response", {"results": [1]}, "https://example.com", {"domains": domains})
+        assert decode_payload(payload) == (
+            "model.Response",
+            {"results": [1]},
+            "https://example.com",
+            {"domains": domains},
+        )
+
+    def test_unsupported_values(self):
+        with pytest.raises(TypeError):
+            encode_payload("model.Response", object(), "", {})
+
+    def test_foreign_payload_ignored(self):
+        assert decode_payload(b"\x80\x05N.") is None
+        assert decode_payload(b'{"data": null}') is None
+
+
+class TestSearchCache:
+    @pytest.mark.asyncio
+    async def test_hit_skips_network(self, client, requests):
+        engine = EchoEngine(client=client, cache=SearchCache())
+        first = await engine.search(file=b"image")
+        second = await engine.search(file=b"image")
+
+        assert len(requests) == 1
+        assert second is not first
+        assert [item.title for item in second.raw] == [item.title for item in first.raw]
+
+        await engine.search(file=b"other")
+        await EchoEngine(mode="b", client=client, cache=engine.cache).search(file=b"image")
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_lru(self, client, requests):
+        engine = EchoEngine(client=client, cache=SearchCache(maxsize=1, ttls={"EchoEngine": 0}))
+        await engine.search(url="https://example.com/a.jpg")
+        await engine.search(url="https://example.com/a.jpg")
+        assert len(requests) == 2
+
+        engine.cache = SearchCache(maxsize=1)
+        await engine.search(url="https://example.com/a.jpg")
+        await engine.search(url="https://example.com/b.jpg")
+        await engine.search(url="https://example.com/a.jpg")
+        assert len(requests) == 5
+        assert len(engine.cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_tier_persists(self, client, requests, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = SearchCache(path=path)
+        await EchoEngine(client=client, cache=cache).search(file=b"image")
+        await cache.aclose()
+
+        cache = SearchCache(path=path)
+        response = await EchoEngine(client=client, cache=cache).search(file=b"image")
+        await cache.aclose()
+        assert len(requests) == 1
+        assert response.raw[0].title == "result 1"
+
+    @pytest.mark.asyncio
+    async def test_sqlite_size_eviction(self, client, requests, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = SearchCache(maxsize=0, path=path)
+        await EchoEngine(client=client, cache=cache).search(file=b"first")
+        await cache.aclose()
+        with closing(sqlite3.connect(path)) as conn:
+            (size,) = conn.execute("SELECT size FROM responses").fetchone()
+
+        # Room for one entry only: storing a second one evicts the least recently used
+        cache = SearchCache(maxsize=0, path=path, max_disk_bytes=size + size // 2)
+        engine = EchoEngine(client=client, cache=cache)
+        await engine.search(file=b"second")
+        await engine.search(file=b"second")
+        await engine.search(file=b"first")
+        await cache.aclose()
+        assert len(requests) == 3
+
+
+class TestSingleFlight:
+    @pytest.fixture
+    def slow_client(self, requests, mock_client):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text=f"result {len(requests)}")
+
+        return mock_client(handler)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_coalesced(self, slow_client, requests):
+        engines = [EchoEngine(client=slow_client, single_flight=True) for _ in range(2)]
+        results = await asyncio.gather(*(engine.search(file=b"image") for engine in engines * 3))
+
+        assert len(requests) == 1
+        assert all(result is results[0] for result in results)
+
+        await asyncio.gather(engines[0].search(file=b"image"), engines[0].search(file=b"other"))
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_engine_options_not_shared(self, slow_client, requests):
+        engines = [
+            EchoEngine(client=slow_client, single_flight=True),
+            EchoEngine(client=slow_client, single_flight=True, keep_origin=False),
+            EchoEngine(client=slow_client, single_flight=True, lazy=True),
+            EchoEngine(client=slow_client, single_flight=True, headers={"X-Test": "1"}),
+        ]
+        results = await asyncio.gather(*(engine.search(file=b"image") for engine in engines))
+
+        assert len(requests) == 4
+        assert results[0].origin is not None
+        assert results[1].origin is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, slow_client, requests):
+        engine = EchoEngine(client=slow_client, single_flight=True)
+        first = asyncio.create_task(engine.search(file=b"image"))
+        second = asyncio.create_task(engine.search(file=b"image"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert (await second).raw[0].title == "result 1"
+        assert first.cancelled()
+        assert len(requests) == 1
+
+    def test_flights_kept_per_event_loop(self, requests, pooled_clients):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text="result")
+
+        pooled_clients(handler)
+        results: list[str] = []
+
+        def search() -> None:
+            engine = EchoEngine(single_flight=True, rate_limiter=False)
+            results.append(asyncio.run(engine.search(file=b"image")).raw[0].title)
+
+        threads = [threading.Thread(target=search) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["result", "result"]
+        assert len(requests) == 2
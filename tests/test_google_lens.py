@@ -1,6 +1,8 @@
 import pytest
 
 from PicImageSearch import GoogleLens
+from PicImageSearch.model.google_lens import decode_ldi, extract_image_maps, scan_image_maps
+from PicImageSearch.utils import parse_html
 from tests.conftest import has_google_config
 
 
@@ -30,3 +32,32 @@ class TestGoogleLens:
     async def test_search_with_url(self, engine, test_image_url):
         result = await engine.search(url=test_image_url)
         assert len(result.raw) > 0
+
+
+SCRIPTS = [
+    '<script nonce="n">google.ldi={"dimg_1":"https://example.com/1?q\\u003d1\\u0026s"};</script>',
+    "<SCRIPT NONCE=n>google.ldi = {'dimg_2': 'https://example.com/2?q\\\\u003d2', 'other': 'x'};</SCRIPT>",
+    '<script>google.ldi={"dimg_3":"https://example.com/3"};</script>',
+    "<script nonce>(function(){var s='data:image/jpeg;base64,/9j/AA\\x3d';var ii=['dimg_4','dimg_5'];"
+    "_setImagesSrc(ii,s);})();</script>",
+    "<script nonce=\"n\">if (a < b) { document.write('<div></div>'); }</script>",
+]
+
+
+class TestScanImageMaps:
+    def test_matches_dom_extraction(self):
+        html = f"<html><head>{''.join(SCRIPTS)}</head><body><p>text</p></body></html>"
+        image_url_map, base64_image_map = scan_image_maps(html)
+
+        assert (image_url_map, base64_image_map) == extract_image_maps(parse_html(html))
+        assert image_url_map == {"dimg_1": "https://example.com/1?q=1&s", "dimg_2": "https://example.com/2?q=2"}
+        assert base64_image_map == {
+            "dimg_4": "data:image/jpeg;base64,/9j/AA\\x3d",
+            "dimg_5": "data:image/jpeg;base64,/9j/AA\\x3d",
+        }
+
+    def test_decode_ldi(self):
+        assert decode_ldi('{"dimg_1": "a\\u003db"}') == {"dimg_1": "a=b"}
+        assert decode_ldi("{'dimg_1': 'a'}") == {"dimg_1": "a"}
+        with pytest.raises((SyntaxError, ValueError)):
+            decode_ldi("{dimg_1: a}")
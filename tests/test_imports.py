@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import PicImageSearch
+from PicImageSearch import engines, model
+
+
+def run_isolated(script: str) -> None:
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(script)], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+
+class TestLazyImports:
+    def test_package_import_is_lazy(self):
+        run_isolated(
+            """
+            import sys
+            import PicImageSearch
+
+            assert not any(name.startswith(("httpx", "pyquery", "lxml")) for name in sys.modules)
+            assert "PicImageSearch.engines" not in sys.modules
+
+            from PicImageSearch import SauceNAO
+
+            assert "PicImageSearch.engines.saucenao" in sys.modules
+            assert "PicImageSearch.engines.iqdb" not in sys.modules
+            assert "pyquery" not in sys.modules
+            """
+        )
+
+    @pytest.mark.parametrize("module", [PicImageSearch, engines, model])
+    def test_public_names_resolve(self, module):
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+        assert set(module.__all__) <= set(dir(module))
+
+    def test_submodules_as_attributes(self):
+        run_isolated(
+            """
+            import PicImageSearch
+
+            for name in ("engines", "model", "network", "utils"):
+                assert getattr(PicImageSearch, name).__name__ == f"PicImageSearch.{name}"
+            assert PicImageSearch.engines.base.BaseSearchEngine
+            assert PicImageSearch.model.base.BaseSearchResponse
+            """
+        )
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            PicImageSearch.NotAnEngine
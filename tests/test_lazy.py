@@ -0,0 +1,101 @@
+import httpx
+import pytest
+
+from PicImageSearch import SearchCache
+from PicImageSearch.model import Ascii2DResponse, SauceNAOItem
+from PicImageSearch.model.base import BaseSearchItem, BaseSearchResponse, LazyItems
+
+ASCII2D_PAGE = """<div><div class="row item-box"><div class="hash">abc</div><small>100x100 JPEG 10KB</small>
+<div class="detail-box gray-link"><div class="external">Title<a href="/x">link</a></div></div></div></div>"""
+
+
+class CountingItem(BaseSearchItem):
+    parsed = 0
+
+    def _parse_data(self, data, **kwargs):
+        CountingItem.parsed += 1
+        self.title = data
+
+
+class CountingResponse(BaseSearchResponse[CountingItem]):
+    def _parse_response(self, resp_data, **kwargs):
+        self.raw = self._build_items(resp_data.splitlines(), CountingItem)
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CountingItem.parsed = 0
+
+
+class TestLazyItems:
+    def test_items_parsed_on_access(self):
+        response = CountingResponse("a\nb\nc", "https://example.com", lazy=True)
+        assert isinstance(response.raw, LazyItems)
+        assert len(response.raw) == 3
+        assert CountingItem.parsed == 0
+
+        assert response.raw[-1].title == "c"
+        assert response.raw[2] is response.raw[-1]
+        assert CountingItem.parsed == 1
+
+        assert [item.title for item in response.raw] == ["a", "b", "c"]
+        assert [item.title for item in response.raw[:2]] == ["a", "b"]
+        assert CountingItem.parsed == 3
+
+    def test_list_operations_parse_remaining_items(self):
+        response = CountingResponse("b\na\nc", "https://example.com", lazy=True)
+        items = response.raw
+        items.sort(key=lambda item: item.title)
+        assert CountingItem.parsed == 3
+        assert [item.title for item in list.__iter__(items)] == ["a", "b", "c"]
+        assert items == list(items)
+        with pytest.raises(TypeError):
+            hash(items)
+
+    def test_eager_by_default(self):
+        response = CountingResponse("a\nb", "https://example.com")
+        assert type(response.raw) is list
+        assert CountingItem.parsed == 2
+
+    @pytest.mark.asyncio
+    async def test_engine_option_applies_to_cache_hits(self, stub_engine, mock_client):
+        client = mock_client(lambda request: httpx.Response(200, text="a\nb\nc"))
+        options = {"client": client, "response_cls": CountingResponse, "cache": SearchCache()}
+        eager = await stub_engine(**options).search(url="https://example.com/a.jpg")
+        lazy = await stub_engine(**options, lazy=True).search(url="https://example.com/a.jpg")
+
+        assert type(eager.raw) is list
+        assert isinstance(lazy.raw, LazyItems)
+        assert CountingItem.parsed == 3
+        assert [item.title for item in lazy.raw] == [item.title for item in eager.raw]
+
+
+class TestLazyField:
+    def test_resolved_while_parsing_by_default(self, saucenao_response):
+        item = SauceNAOItem(saucenao_response["results"][1])
+        assert item._url == "https://www.pixiv.net/artworks/1"
+        assert item._author == "Artist"
+
+    def test_resolved_on_first_access(self, saucenao_response):
+        item = SauceNAOItem(saucenao_response["results"][1], lazy=True)
+        assert not hasattr(item, "_url")
+        assert item.url == "https://www.pixiv.net/artworks/1"
+        assert item.author == "Artist"
+        assert item.author_url == "https://www.pixiv.net/users/2"
+
+    def test_assignment_overrides(self, saucenao_response):
+        item = SauceNAOItem(saucenao_response["results"][1], lazy=True)
+        item.author = "Someone else"
+        assert item.author == "Someone else"
+
+    def test_lazy_items_leave_page_untouched(self):
+        response = Ascii2DResponse(ASCII2D_PAGE, "https://ascii2d.net", lazy=True)
+        page = str(response.origin)
+        assert response.raw[0].title == "Title"
+        assert response.raw[0].url_list[0].href == "https://ascii2d.net/x"
+        assert str(response.origin) == page
+
+    def test_eager_items_match_lazy_ones(self):
+        eager = Ascii2DResponse(ASCII2D_PAGE, "https://ascii2d.net").raw[0]
+        lazy = Ascii2DResponse(ASCII2D_PAGE, "https://ascii2d.net", lazy=True).raw[0]
+        assert (eager.title, eager.url_list) == (lazy.title, lazy.url_list)
@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from PicImageSearch import MetaSearch, similarity_at_least
+from PicImageSearch.engines.base import BaseSearchEngine
+
+
+class SleepyEngine(BaseSearchEngine[Any]):
+    def __init__(self, delay: float, fail: bool = False):
+        super().__init__("https://example.com")
+        self.delay = delay
+        self.fail = fail
+        self.received: list[bytes | None] = []
+
+    async def search(self, url=None, file=None, **kwargs) -> Any:
+        self.received.append(file)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("engine failed")
+        return self.delay
+
+
+class TestMetaSearch:
+    @pytest.mark.asyncio
+    async def test_results_in_completion_order(self):
+        slow, fast, failing = SleepyEngine(0.05), SleepyEngine(0.0), SleepyEngine(0.01, fail=True)
+        metasearch = MetaSearch([slow, fast, failing])
+
+        results = [result async for result in metasearch.as_completed(file=b"image")]
+
+        assert [result.engine for result in results] == [fast, failing, slow]
+        assert results[0].response == 0.0
+        assert isinstance(results[1].error, RuntimeError)
+        assert all(engine.received == [b"image"] for engine in (slow, fast, failing))
+
+    @pytest.mark.asyncio
+    async def test_per_engine_timeout(self):
+        slow, fast = SleepyEngine(1), SleepyEngine(0)
+        metasearch = MetaSearch([slow, fast], timeout=5, timeouts={slow: 0.01})
+
+        results = await metasearch.search(url="https://example.com/image.jpg")
+
+        assert [result.engine for result in results] == [slow, fast]
+        assert isinstance(results[0].error, asyncio.TimeoutError)
+        assert results[1].ok
+
+    @pytest.mark.asyncio
+    async def test_requires_input(self):
+        with pytest.raises(ValueError):
+            await MetaSearch([]).search()
+
+
+class Item:
+    def __init__(self, similarity: float):
+        self.similarity = similarity
+
+
+class Response:
+    def __init__(self, *similarities: float):
+        self.raw = [Item(similarity) for similarity in similarities]
+
+
+class ConfidentEngine(SleepyEngine):
+    def __init__(self, delay: float, *similarities: float):
+        super().__init__(delay)
+        self.similarities = similarities
+
+    async def search(self, url=None, file=None, **kwargs):
+        await super().search(url, file, **kwargs)
+        return Response(*self.similarities)
+
+
+class TestEarlyExit:
+    @pytest.mark.asyncio
+    async def test_confident_match_cancels_remaining(self):
+        confident = ConfidentEngine(0.0, 50, 95)
+        slow = SleepyEngine(10)
+        metasearch = MetaSearch([slow, confident], stop_when=similarity_at_least(90))
+
+        results = await asyncio.wait_for(metasearch.search(file=b"image"), 1)
+
+        assert [result.engine for result in results] == [confident]
+
+    @pytest.mark.asyncio
+    async def test_engine_filter(self):
+        other = SleepyEngine(0.05)
+        weak, strong = ConfidentEngine(0.0, 95), ConfidentEngine(0.01, 20)
+
+        results = await MetaSearch([other, weak, strong]).search(
+            file=b"image",
+            stop_when=similarity_at_least(90, engines=[SleepyEngine]),
+        )
+        assert len(results) == 1
+
+        results = await MetaSearch([other, strong]).search(
+            file=b"image",
+            stop_when=similarity_at_least(90, engines=[ConfidentEngine]),
+        )
+        assert len(results) == 2
@@ -0,0 +1,276 @@
+import asyncio
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+from PicImageSearch import network
+from PicImageSearch.ratelimit import TokenBucket
+
+
+class TestPooledClient:
+    @pytest.fixture
+    def created_clients(self, pooled_clients):
+        return pooled_clients()
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_requests(self, created_clients, stub_engine):
+        async with stub_engine() as engine:
+            await engine.search(url="a")
+            await engine.search(url="b")
+            assert len(created_clients) == 1
+            assert not created_clients[0].is_closed
+        assert created_clients[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_recreated_after_close(self, created_clients, stub_engine):
+        engine = stub_engine()
+        await engine.search(url="a")
+        await engine.close()
+        await engine.search(url="b")
+        await engine.close()
+        assert len(created_clients) == 2
+
+    @pytest.mark.asyncio
+    async def test_per_request_client_when_disabled(self, created_clients, stub_engine):
+        engine = stub_engine(reuse_client=False)
+        await engine.search(url="a")
+        await engine.search(url="b")
+        assert len(created_clients) == 2
+        assert all(client.is_closed for client in created_clients)
+
+    @pytest.mark.asyncio
+    async def test_external_client_left_open(self, created_clients, stub_engine, mock_client):
+        client = mock_client(lambda request: httpx.Response(200))
+        async with stub_engine(client=client) as engine:
+            await engine.search(url="a")
+        assert not created_clients
+        assert not client.is_closed
+        await client.aclose()
+
+    def test_reused_across_event_loops(self, stub_engine):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            engine = stub_engine(base_url=f"http://127.0.0.1:{server.server_port}", rate_limiter=False)
+            for _ in range(2):
+                assert asyncio.run(engine.search(url="a")).status_code == 200
+            asyncio.run(engine.close())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestClientRegistry:
+    @pytest.mark.asyncio
+    async def test_same_configuration_shares_client(self, stub_engine, pooled_clients):
+        created_clients = pooled_clients()
+        registry = network.ClientRegistry()
+        first = stub_engine(base_url="https://a.example.com", registry=registry, timeout=10, rate_limiter=False)
+        second = stub_engine(base_url="https://b.example.com", registry=registry, timeout=10, rate_limiter=False)
+        other = stub_engine(base_url="https://a.example.com", registry=registry, timeout=10, http2=True)
+
+        assert first._active_client() is None
+        assert not created_clients
+        for engine in (first, second, other):
+            await engine.search(url="a")
+        assert first._active_client() is second._active_client() is created_clients[0]
+        assert other._active_client() is created_clients[1]
+        assert len(registry) == 2
+
+        await first.close()
+        assert not created_clients[0].is_closed
+        await registry.aclose()
+        assert len(registry) == 0
+        assert all(client.is_closed for client in created_clients)
+
+    @pytest.mark.asyncio
+    async def test_headers_are_part_of_key(self):
+        registry = network.ClientRegistry()
+        first = registry.get_client(headers={"X-Test": "1"})
+        assert registry.get_client(headers={"X-Test": "1"}) is first
+        assert registry.find_client(headers={"X-Test": "1"}) is first
+        assert registry.get_client(headers={"X-Test": "2"}) is not first
+        await registry.aclose()
+
+    def test_client_per_event_loop(self):
+        registry = network.ClientRegistry()
+
+        async def get_client() -> httpx.AsyncClient:
+            return registry.get_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+        assert registry.find_client() is None
+
+    @pytest.mark.asyncio
+    async def test_per_host_cap(self):
+        active = {"now": 0, "peak": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return httpx.Response(200, text="ok")
+
+        transport = network._HostLimitedTransport(httpx.MockTransport(handler), max_connections_per_host=2)
+        async with httpx.AsyncClient(transport=transport) as client:
+            await asyncio.gather(*(client.get("https://example.com/") for _ in range(8)))
+            await asyncio.gather(*(client.get(f"https://host{i}.example.com/") for i in range(4)))
+
+        assert active["peak"] == 4
+
+    def test_per_host_cap_across_event_loops(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.001)
+            return httpx.Response(200)
+
+        transport = network._HostLimitedTransport(httpx.MockTransport(handler), max_connections_per_host=1)
+
+        async def run() -> None:
+            client = httpx.AsyncClient(transport=transport)
+            await asyncio.gather(*(client.get("https://example.com/") for _ in range(3)))
+
+        asyncio.run(run())
+        asyncio.run(run())
+
+
+class TestRetryPolicy:
+    @pytest.mark.asyncio
+    async def test_transient_status_retried(self, stub_engine):
+        engine = stub_engine([httpx.Response(503), httpx.Response(502), httpx.Response(200, text="ok")])
+        resp = await engine.search(url="a")
+        assert resp.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, stub_engine):
+        engine = stub_engine([httpx.Response(503)] * 3)
+        resp = await engine.search(url="a")
+        assert resp.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_post_only_retried_on_429(self, stub_engine):
+        engine = stub_engine([httpx.Response(503), httpx.Response(200)])
+        resp = await engine._send_request(method="post")
+        assert resp.status_code == 503
+
+        engine = stub_engine([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200)])
+        resp = await engine._send_request(method="post")
+        assert resp.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_429_opt_out(self, stub_engine):
+        policy = network.RetryPolicy(backoff_factor=0, retry_statuses=frozenset({503}))
+        engine = stub_engine([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200)])
+        resp = await engine._send_request(method="get", retry_policy=policy)
+        assert resp.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_not_retried(self, stub_engine):
+        engine = stub_engine([httpx.Response(429, headers={"Retry-After": "3600"}), httpx.Response(200)])
+        resp = await engine.search(url="a")
+        assert resp.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_transport_errors(self, stub_engine):
+        engine = stub_engine([httpx.ConnectError("refused"), httpx.Response(200)])
+        assert (await engine._send_request(method="post")).status_code == 200
+
+        engine = stub_engine([httpx.ReadError("reset"), httpx.Response(200)])
+        with pytest.raises(httpx.ReadError):
+            await engine._send_request(method="post")
+
+        engine = stub_engine([httpx.ReadError("reset"), httpx.Response(200)])
+        assert (await engine._send_request(method="get")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_acquired_per_attempt(self, stub_engine):
+        acquired: list[str] = []
+
+        class RecordingLimiter(TokenBucket):
+            async def acquire(self, key: str = "") -> None:
+                acquired.append(key)
+
+        engine = stub_engine(
+            [httpx.Response(503), httpx.Response(200)],
+            rate_limiter=RecordingLimiter(1, 1),
+        )
+        await engine.search(url="a")
+        assert acquired == ["example.com", "example.com"]
+
+    def test_parse_retry_after(self):
+        assert network.RetryPolicy.parse_retry_after("5") == 5.0
+        assert network.RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert network.RetryPolicy.parse_retry_after("soon") is None
+
+
+class TestRESP:
+    @pytest.mark.asyncio
+    async def test_keeps_bytes_and_text(self, mock_client):
+        body = '{"title": "café"}'.encode("latin-1")
+        response = httpx.Response(200, content=body, headers={"Content-Type": "text/plain; charset=latin-1"})
+        client = mock_client(lambda request: response)
+        resp = await network.HandOver(client=client).get("https://example.com/a")
+
+        assert resp.content == body
+        assert resp.encoding == "latin-1"
+        assert resp.text == '{"title": "café"}'
+        assert resp.status_code == 200 and resp.url == "https://example.com/a"
+
+    def test_json(self):
+        resp = network.RESP("", "https://example.com", 200, '{"a": [1, "é"]}'.encode())
+        assert resp.json() == {"a": [1, "é"]}
+
+    def test_json_from_text(self):
+        resp = network.RESP('{"a": "é"}', "https://example.com", 200)
+        assert resp.content == b""
+        assert resp.json() == {"a": "é"}
+
+    def test_named_tuple(self):
+        resp = network.RESP("body", "https://example.com", 200)
+        text, url, status_code, *_ = resp
+        assert (text, url, status_code) == ("body", "https://example.com", 200)
+        assert isinstance(resp, tuple)
+        assert resp[0] == "body" and resp[:3] == ("body", "https://example.com", 200)
+        assert resp._asdict()["status_code"] == 200
+        assert resp._replace(status_code=404).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_transfer_metadata(self, mock_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old":
+                return httpx.Response(302, headers={"Location": "https://example.com/new"})
+            body = httpx.ByteStream(gzip.compress(b"0" * 1000))
+            return httpx.Response(200, stream=body, headers={"Content-Encoding": "gzip", "X-Server": "mock"})
+
+        client = mock_client(handler, follow_redirects=True)
+        resp = await network.HandOver(client=client).post("https://example.com/old", data={"a": "bc"})
+
+        assert resp.url == "https://example.com/new"
+        assert resp.redirects == 1
+        assert resp.headers["X-Server"] == "mock"
+        assert resp.content == b"0" * 1000
+        assert resp.bytes_received == len(gzip.compress(b"0" * 1000))
+        assert resp.elapsed > 0
+        assert resp.bytes_sent == 0  # the 302 turned the request into a bodiless GET
+
+        resp = await network.HandOver(client=client).post("https://example.com/new", data={"a": "bc"})
+        assert resp.bytes_sent == len(b"a=bc")
+        assert resp.redirects == 0
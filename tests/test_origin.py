@@ -0,0 +1,57 @@
+import httpx
+import pytest
+
+from PicImageSearch import model
+from PicImageSearch.model import LensoResponse, SauceNAOItem, SauceNAOResponse
+from PicImageSearch.model.base import LazyItems
+
+
+class TestSlots:
+    def test_items_have_no_dict(self, saucenao_response):
+        item = SauceNAOItem(saucenao_response["results"][0])
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.unknown = 1  # pyright: ignore[reportAttributeAccessIssue]
+
+    @pytest.mark.parametrize("name", [name for name in model.__all__ if name.endswith("Item")])
+    def test_item_classes_declare_slots(self, name):
+        for klass in getattr(model, name).__mro__[:-1]:
+            assert "__slots__" in vars(klass), klass.__name__
+
+
+class TestDropOrigin:
+    def test_kept_by_default(self, saucenao_response):
+        response = SauceNAOResponse(saucenao_response, "")
+        assert response.origin is saucenao_response
+        assert response.raw[0].origin is saucenao_response["results"][0]
+
+    def test_dropped_after_parsing(self, saucenao_response):
+        response = SauceNAOResponse(saucenao_response, "", keep_origin=False)
+        assert response.origin is None
+        assert all(item.origin is None for item in response.raw)
+        assert response.raw[1].url == "https://www.pixiv.net/artworks/1"
+        assert response.raw[1].author == "Artist"
+
+    def test_lazy_items_drop_when_built(self, saucenao_response):
+        response = SauceNAOResponse(saucenao_response, "", lazy=True, keep_origin=False)
+        assert isinstance(response.raw, LazyItems)
+        assert response.raw[2].origin is None
+        assert response.raw[2].title == "Artwork 2"
+        assert response.raw[2].author_url == "https://www.pixiv.net/users/2"
+
+    def test_nested_items(self):
+        result = {"hash": "h", "urlList": [{"sourceUrl": "https://example.com", "title": "Page"}]}
+        response = LensoResponse({"results": {"similar": [result]}}, "", keep_origin=False)
+        assert response.similar[0].origin is None
+        assert response.similar[0].url_list[0].origin is None
+        assert response.similar[0].url_list[0].title == "Page"
+
+    @pytest.mark.asyncio
+    async def test_engine_option(self, stub_engine, saucenao_response):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=saucenao_response)
+
+        engine = stub_engine(handler, response_cls=SauceNAOResponse, keep_origin=False)
+        response = await engine.search(url="https://example.com/a.jpg")
+        assert response.origin is None
+        assert response.raw[0].origin is None
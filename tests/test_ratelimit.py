@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+import pytest
+
+from PicImageSearch import Iqdb, SauceNAO, Yandex
+from PicImageSearch.ratelimit import CompositeLimiter, SlidingWindow, TokenBucket
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_then_queue(self):
+        limiter = TokenBucket(calls=2, period=0.2)
+        start = time.monotonic()
+        await limiter.acquire("a")
+        await limiter.acquire("a")
+        assert time.monotonic() - start < 0.05
+        assert limiter.wait_time("a") > 0
+
+        await limiter.acquire("a")
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self):
+        limiter = TokenBucket(calls=1, period=10)
+        await limiter.acquire("a")
+        assert limiter.wait_time("a") > 0
+        assert limiter.wait_time("b") == 0.0
+
+
+class TestSlidingWindow:
+    @pytest.mark.asyncio
+    async def test_window(self):
+        limiter = SlidingWindow(calls=3, period=0.15)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        assert time.monotonic() - start >= 0.14
+
+
+class TestCompositeLimiter:
+    @pytest.mark.asyncio
+    async def test_strictest_limiter_wins(self):
+        limiter = CompositeLimiter(SlidingWindow(5, 10), SlidingWindow(1, 10))
+        await limiter.acquire()
+        assert limiter.wait_time() > 9
+
+
+class TestEngineProfiles:
+    def test_default_profiles(self):
+        assert isinstance(SauceNAO().rate_limiter, CompositeLimiter)
+        assert isinstance(Iqdb().rate_limiter, TokenBucket)
+        assert Yandex().rate_limiter is None
+
+    def test_override_and_disable(self):
+        limiter = TokenBucket(1, 1)
+        assert SauceNAO(rate_limiter=limiter).rate_limiter is limiter
+        assert SauceNAO(rate_limiter=False).rate_limiter is None
+        assert SauceNAO(rate_limiter=False).rate_limit_wait() == 0.0
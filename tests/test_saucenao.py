@@ -1,6 +1,10 @@
+import asyncio
+
+import httpx
 import pytest
 
 from PicImageSearch import SauceNAO
+from PicImageSearch.engines.saucenao import SauceNAOKeyPool
 from tests.conftest import has_saucenao_config
 
 
@@ -30,3 +34,71 @@ class TestSauceNAO:
     async def test_search_with_url(self, engine, test_image_url):
         result = await engine.search(url=test_image_url)
         assert len(result.raw) > 0
+
+
+class TestSauceNAOKeyPool:
+    @pytest.fixture
+    def quota_client(self, mock_client):
+        def make(quota: dict[str, int], requests: list[str]) -> httpx.AsyncClient:
+            def handler(request: httpx.Request) -> httpx.Response:
+                api_key = request.url.params["api_key"]
+                requests.append(api_key)
+                quota[api_key] -= 1
+                header = {"short_remaining": quota[api_key], "long_remaining": 100, "status": 0}
+                return httpx.Response(200, json={"header": header, "results": []})
+
+            return mock_client(handler)
+
+        return make
+
+    @pytest.mark.asyncio
+    async def test_prefers_key_with_most_quota(self, quota_client):
+        quota = {"k1": 4, "k2": 2}
+        requests: list[str] = []
+        engine = SauceNAO(api_key=["k1", "k2"], client=quota_client(quota, requests), rate_limiter=False)
+
+        for _ in range(4):
+            await engine.search(url="https://example.com/image.jpg")
+
+        assert requests == ["k1", "k2", "k1", "k1"]
+
+    @pytest.mark.asyncio
+    async def test_exhausted_keys_are_parked(self, quota_client):
+        quota = {"k1": 1, "k2": 1}
+        requests: list[str] = []
+        pool = SauceNAOKeyPool(["k1", "k2"])
+        pool.short_window = 0.05
+        engine = SauceNAO(api_key=pool, client=quota_client(quota, requests), rate_limiter=False)
+
+        await engine.search(url="https://example.com/image.jpg")
+        await engine.search(url="https://example.com/image.jpg")
+        assert pool.available() == []
+
+        quota.update(k1=4, k2=4)
+        await engine.search(url="https://example.com/image.jpg")
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_throttled_key_is_switched(self, mock_client):
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            api_key = request.url.params["api_key"]
+            requests.append(api_key)
+            status_code = 429 if api_key == "k1" else 200
+            header = {"short_remaining": 3, "long_remaining": 100, "status": 0}
+            return httpx.Response(status_code, headers={"Retry-After": "0"}, json={"header": header, "results": []})
+
+        pool = SauceNAOKeyPool(["k1", "k2"])
+        engine = SauceNAO(api_key=pool, client=mock_client(handler), rate_limiter=False)
+
+        result = await engine.search(url="https://example.com/image.jpg")
+        assert result.status_code == 200
+        assert requests == ["k1", "k2"]
+        assert pool.available() == ["k2"]
+
+    def test_daily_quota_exhausted(self):
+        pool = SauceNAOKeyPool(["k1"])
+        pool.update("k1", 429, {"short_remaining": 0, "long_remaining": 0})
+        with pytest.raises(RuntimeError):
+            asyncio.run(pool.acquire())
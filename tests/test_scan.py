@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import json
+
+import pytest
+
+from PicImageSearch import SearchCache
+from PicImageSearch.__main__ import build_parser
+from PicImageSearch.engines.base import BaseSearchEngine
+from PicImageSearch.model.base import BaseSearchItem, BaseSearchResponse
+from PicImageSearch.scan import ScanProgress, iter_sources, scan
+
+
+class SizeItem(BaseSearchItem):
+    def _parse_data(self, data, **kwargs):
+        self.title = str(data)
+        self.similarity = 100.0
+
+
+class SizeResponse(BaseSearchResponse[SizeItem]):
+    def _parse_response(self, resp_data, **kwargs):
+        self.raw = [SizeItem(resp_data)]
+
+
+class SizeEngine(BaseSearchEngine[SizeResponse]):
+    def __init__(self, **request_kwargs):
+        super().__init__("https://example.com", **request_kwargs)
+        self.searched: list[str | bytes] = []
+
+    async def search(self, url=None, file=None, **kwargs):
+        source = url or file
+        assert source is not None
+        self.searched.append(source)
+        if file == b"broken":
+            raise ValueError("unsupported image")
+        return await self._make_response(SizeResponse, len(source), "https://example.com/result")
+
+
+@pytest.fixture
+def images(tmp_path):
+    root = tmp_path / "images"
+    (root / "nested").mkdir(parents=True)
+    (root / "a.jpg").write_bytes(b"aaaa")
+    (root / "nested" / "b.PNG").write_bytes(b"broken")
+    (root / "notes.txt").write_text("not an image")
+    return root
+
+
+class TestScan:
+    def test_iter_sources(self, images, tmp_path):
+        assert [path.rsplit("images", 1)[1] for path in iter_sources(images)] == ["/a.jpg", "/nested/b.PNG"]
+
+        listing = tmp_path / "list.txt"
+        listing.write_text("# comment\nhttps://example.com/c.jpg\n\n/tmp/d.jpg\n")
+        assert list(iter_sources(listing)) == ["https://example.com/c.jpg", "/tmp/d.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_scan_and_resume(self, images, tmp_path):
+        output = tmp_path / "results.jsonl"
+        errors = tmp_path / "results.jsonl.errors"
+        engine = SizeEngine()
+        progress = await scan(images, {engine: 2}, output, readers=1, queue_size=1)
+
+        records = {record["source"].rsplit("/", 1)[1]: record for record in map(json.loads, output.open())}
+        failures = [json.loads(line) for line in errors.open()]
+        assert progress.done == progress.total == 2
+        assert progress.failed == 1
+        assert list(records) == ["a.jpg"]
+        assert records["a.jpg"]["sha256"] is not None
+        assert records["a.jpg"]["results"]["SizeEngine"]["items"][0]["title"] == "4"
+        assert failures[0]["results"]["SizeEngine"] == {"error": "ValueError: unsupported image"}
+
+        # Failed items are not checkpointed, so a rerun searches them again
+        (images / "c.jpg").write_bytes(b"cc")
+        progress = await scan(images, {engine: 2}, output)
+        assert (progress.done, progress.failed, progress.skipped) == (2, 1, 1)
+        assert sorted(engine.searched[-2:]) == [b"broken", b"cc"]
+        assert len(output.read_text().splitlines()) == 2
+        assert len(errors.read_text().splitlines()) == 2
+
+    @pytest.mark.asyncio
+    async def test_total_known_before_walk_finishes(self, tmp_path):
+        listing = tmp_path / "list.txt"
+        listing.write_text("".join(f"https://example.com/{i}.jpg\n" for i in range(20)))
+        totals: list[int | None] = []
+
+        class TotalEngine(SizeEngine):
+            async def search(self, url=None, file=None, **kwargs):
+                totals.append(progress.total)
+                await asyncio.sleep(0.001)
+                return await super().search(url, file, **kwargs)
+
+        progress = ScanProgress()
+        await scan(listing, {TotalEngine(): 1}, tmp_path / "results.jsonl", queue_size=1, progress=progress)
+        assert totals[5] == 20
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_read_digest(self, tmp_path, monkeypatch):
+        root = tmp_path / "images"
+        root.mkdir()
+        (root / "a.jpg").write_bytes(b"aaaa")
+        engine = SizeEngine(cache=SearchCache())
+        await engine.search(file=b"aaaa")
+
+        hashed: list[bytes] = []
+        sha256 = hashlib.sha256
+        monkeypatch.setattr(hashlib, "sha256", lambda data=b"": hashed.append(data) or sha256(data))
+        progress = await scan(root, {engine: 1}, tmp_path / "results.jsonl")
+        assert progress.done == 1
+        assert engine.searched == [b"aaaa"]
+        assert hashed.count(b"aaaa") == 1
+
+    def test_cli_arguments(self):
+        args = build_parser().parse_args(
+            [
+                "scan",
+                "images",
+                "-e",
+                "SauceNAO=3",
+                "-e",
+                "iqdb",
+                "--option",
+                "iqdb.is_3d:=true",
+                "--option",
+                "saucenao.api_key=123",
+            ]
+        )
+        assert args.engines == [("saucenao", 3), ("iqdb", 0)]
+        assert args.options == [("iqdb", "is_3d", True), ("saucenao", "api_key", "123")]
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["scan", "images", "-e", "nope"])
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["scan", "images", "-e", "iqdb", "--option", "iqdb.is_3d:=yes"])
@@ -0,0 +1,58 @@
+import pytest
+from pyquery import PyQuery
+
+from PicImageSearch.model import EHentaiResponse
+from PicImageSearch.model.selectors import Selector, parent, remove, text
+from PicImageSearch.utils import parse_html
+
+HTML = """
+<div id="root">
+  <div class="box"><h6>Title <a href="/a">first</a> <small>pixiv <a href="/b">second</a></small> tail</h6></div>
+  <div class="box"><span class="external">ext <a href="/c">link</a> text</span></div>
+</div>
+"""
+
+EHENTAI_GRID = """
+<html><body><div class="itg gld">
+  <div class="gl1t">
+    <a href="https://e-hentai.org/g/1/abc/"><div class="glink">Gallery 1</div></a>
+    <div class="gl3t"><a href="https://e-hentai.org/g/1/abc/"><img src="https://ehgt.org/t/1.jpg"></a></div>
+    <div class="gl5t"><div><div class="cs ct2">Doujinshi</div><div id="posted_1">2024-01-01 00:00</div></div></div>
+  </div>
+</div></body></html>
+"""
+
+
+class TestSelector:
+    @pytest.fixture
+    def document(self):
+        return parse_html(HTML)
+
+    @pytest.mark.parametrize("css", ["div.box", "a", "h6 > a", "[href^='/b']", "div"])
+    def test_matches_pyquery(self, document, css):
+        root = document[0]
+        selector = Selector(css)
+        assert selector.select(root) == list(document(css))
+        assert selector.find(root) == list(document.find(css))
+        assert text(selector.select(root)) == document(css).text()
+
+    def test_parent_and_remove(self, document):
+        links = Selector("a").select(document[0])
+        assert parent(links, Selector("small")) == list(document("a").parent("small"))
+
+        expected = PyQuery(HTML)
+        expected("small").remove()
+        remove(Selector("small").select(document[0]))
+        assert text(document) == expected.text()
+
+
+class TestEHentaiGridLayout:
+    def test_grid_items_parsed(self):
+        response = EHentaiResponse(EHENTAI_GRID, "https://e-hentai.org/")
+        assert len(response.raw) == 1
+        item = response.raw[0]
+        assert item.title == "Gallery 1"
+        assert item.url == "https://e-hentai.org/g/1/abc/"
+        assert item.thumbnail == "https://ehgt.org/t/1.jpg"
+        assert item.type == "Doujinshi"
+        assert item.date == "2024-01-01 00:00"
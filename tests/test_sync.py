@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import textwrap
+
+# Importing PicImageSearch.sync patches the engine classes for the whole process,
+# so the facade is exercised in a subprocess.
+SCRIPT = textwrap.dedent(
+    """
+    import asyncio
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import httpx
+
+    from PicImageSearch.sync import Iqdb, shutdown
+
+    threads = set()
+
+    async def handler(request):
+        threads.add(threading.current_thread().name)
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, text="ok")
+
+    engine = Iqdb(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: engine.get("https://example.com"), range(8)))
+    assert all(resp.text == "ok" for resp in results)
+    assert time.monotonic() - start < 1.0, "calls from several threads did not overlap"
+
+    async def from_async():
+        return await engine.get("https://example.com")
+
+    assert asyncio.run(from_async()).text == "ok"
+    assert threads == {"PicImageSearch-sync"}
+
+    shutdown()
+    assert engine.get("https://example.com").text == "ok"
+    print("ok")
+    """
+)
+
+
+def test_sync_facade_uses_background_loop():
+    result = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from PicImageSearch import utils
+from PicImageSearch.utils import CompiledPath, compile_path, deep_get, json_loads
+
+DATA = {
+    "a": {"b": [{"c": 1}, {"c": 2}]},
+    "title": ["first"],
+    "a[0]": [["nested"]],
+    "text": "string",
+}
+
+
+class TestDeepGet:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("a.b[0].c", 1),
+            ("a.b[1].c", 2),
+            ("a.b[2].c", None),
+            ("a.missing", None),
+            ("title[0]", "first"),
+            ("a[0][0]", ["nested"]),
+            ("text.key", None),
+            ("a.b.key", None),
+        ],
+    )
+    def test_lookups(self, path, expected):
+        assert deep_get(DATA, path) == expected
+        assert compile_path(path)(DATA) == expected
+
+    def test_indexing_none_raises(self):
+        with pytest.raises(TypeError):
+            deep_get({"a": None}, "a[0]")
+
+
+class TestCompilePath:
+    def test_cached(self):
+        assert compile_path("a.b[0].c") is compile_path("a.b[0].c")
+        assert isinstance(compile_path("a"), CompiledPath)
+        assert repr(compile_path("a.b")) == "CompiledPath('a.b')"
+
+
+class TestJsonLoads:
+    @pytest.mark.parametrize("document", ['{"a": [1, "é"]}', '{"a": [1, "é"]}'.encode()])
+    def test_decodes_text_and_bytes(self, document):
+        assert json_loads(document) == {"a": [1, "é"]}
+
+    def test_standard_library_fallback(self, monkeypatch):
+        monkeypatch.setattr(utils, "_orjson_loads", None)
+        assert json_loads(b'{"a": 1}') == {"a": 1}
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b"{")
+
+    def test_errors_are_json_decode_errors(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b"{")
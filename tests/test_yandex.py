@@ -1,6 +1,11 @@
+from html import escape
+
 import pytest
 
 from PicImageSearch import Yandex
+from PicImageSearch.exceptions import ParsingError
+from PicImageSearch.model import YandexResponse
+from PicImageSearch.model.yandex import find_data_state
 
 
 class TestYandex:
@@ -27,3 +32,58 @@ class TestYandex:
     async def test_search_with_url(self, engine, test_image_url):
         result = await engine.search(url=test_image_url)
         assert len(result.raw) > 0
+
+
+SITE = (
+    '{"url": "https://example.com", "title": "A <b> title", "thumb": {"url": "//example.com/t.jpg"}, '
+    '"domain": "example.com", "description": "", "originalImage": {"width": 2, "height": 1}}'
+)
+STATE = f'{{"initialState": {{"cbirSites": {{"sites": [{SITE}]}}}}}}'
+
+
+class TestFindDataState:
+    @pytest.mark.parametrize(
+        "tag",
+        [
+            '<div class="Root" id="ImagesApp-1" data-state="{}">',
+            '<div data-state="{}" id="ImagesApp-1" class="Page Root">',
+            "<DIV CLASS=Root ID=ImagesApp-1 DATA-STATE='{}'>",
+            '<div\nclass="Root"\nid="ImagesApp-1"\ndata-state="{}"\n>',
+        ],
+    )
+    def test_attribute_layouts(self, tag):
+        state = "{&quot;a&quot;: &quot;x > y &amp; z&quot;}"
+        html = f'<div class="Root" id="Header-1" data-state="[]"></div>{tag.format(state)}</div>'
+        assert find_data_state(html) == '{"a": "x > y & z"}'
+        assert find_data_state(html.encode()) == find_data_state(html)
+
+    def test_skips_other_elements(self):
+        html = (
+            '<p>ImagesApp-1</p><span class="Root" id="ImagesApp-0" data-state="0"></span>'
+            '<div class="Other" id="ImagesApp-2" data-state="2"></div>'
+            '<div class="Root" id="ImagesApp-3" data-state="3"></div>'
+        )
+        assert find_data_state(html) == "3"
+
+    def test_not_found(self):
+        assert find_data_state('<div class="Root" id="ImagesApp-1"></div>') is None
+
+
+class TestYandexResponse:
+    def test_parses_without_dom(self):
+        html = f'<html><body><div class="Root" id="ImagesApp-1" data-state="{escape(STATE)}"></div></body></html>'
+        response = YandexResponse(html, "https://yandex.com")
+        assert not hasattr(response, "_origin")
+        assert response.raw[0].title == "A <b> title"
+        assert response.raw[0].size == "2x1"
+        assert response.origin is not None
+        assert response.origin("#ImagesApp-1").attr("class") == "Root"
+
+    def test_falls_back_to_dom(self):
+        html = f'<html><body><div class="Root" id="&#73;magesApp-1" data-state="{escape(STATE)}"></div></body></html>'
+        assert find_data_state(html) is None
+        assert YandexResponse(html, "https://yandex.com").raw[0].url == "https://example.com"
+
+    def test_missing_state(self):
+        with pytest.raises(ParsingError):
+            YandexResponse("<html><body></body></html>", "https://yandex.com")